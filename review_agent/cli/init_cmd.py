@@ -60,6 +60,24 @@ MCP_CONFIG = '''{
 '''
 
 
+def _create_file(path: Path, content: str) -> bool:
+    """
+    Create a file only if it does not exist yet.
+
+    Mode 'x' opens with O_CREAT|O_EXCL, so the existence check and the
+    creation happen in a single open() call.
+
+    Returns:
+        True if the file was created, False if it already existed
+    """
+    try:
+        with open(path, "x") as f:
+            f.write(content)
+    except FileExistsError:
+        return False
+    return True
+
+
 def init_repository(target_dir: Path = None):
     """
     Initialize review-agent in a repository.
@@ -82,21 +100,19 @@ def init_repository(target_dir: Path = None):
     workflow_dir.mkdir(parents=True, exist_ok=True)
 
     workflow_file = workflow_dir / "pr-review.yml"
-    if workflow_file.exists():
-        print(f"Already exists: {workflow_file}")
-    else:
-        workflow_file.write_text(WORKFLOW_TEMPLATE)
+    if _create_file(workflow_file, WORKFLOW_TEMPLATE):
         print(f"Created: {workflow_file}")
         created_files.append(workflow_file)
+    else:
+        print(f"Already exists: {workflow_file}")
 
     # Create MCP config
     mcp_file = target / ".mcp.json"
-    if mcp_file.exists():
-        print(f"Already exists: {mcp_file}")
-    else:
-        mcp_file.write_text(MCP_CONFIG)
+    if _create_file(mcp_file, MCP_CONFIG):
         print(f"Created: {mcp_file}")
         created_files.append(mcp_file)
+    else:
+        print(f"Already exists: {mcp_file}")
 
     if created_files:
         print("\nNext steps:")
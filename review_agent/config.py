@@ -1,7 +1,7 @@
 """Configuration for PR Review Agent."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 import os
 
 
@@ -13,6 +13,7 @@ class ReviewConfig:
     repo: str = ""
     pr_number: int = 0
     github_token: Optional[str] = None
+    github_tokens: List[str] = field(default_factory=list)  # Token pool for rate limit headroom
 
     # Review behavior
     min_confidence: float = 0.7  # Minimum confidence to report issue
@@ -27,6 +28,10 @@ class ReviewConfig:
 
     # Parallel processing
     parallel_validation: bool = True  # Validate issues in parallel (default: enabled)
+    max_parallel: int = 8             # Max concurrent agent sessions per stage
+    fuse_below_hunks: int = 4         # Single fused identify+validate session below this many hunks (0 = off)
+    validation_batch_size: int = 8    # Issues per Stage 2 session (1 = one session per issue)
+    cache_validations: bool = True    # Reuse Stage 2 verdicts for unchanged issues across runs
 
     # Severity filtering at Stage 1 (skip validation for low severity)
     min_severity: str = "medium"  # low, medium, high, critical
@@ -43,11 +48,16 @@ class ReviewConfig:
             repo=os.environ.get("GITHUB_REPOSITORY", ""),
             pr_number=int(os.environ.get("PR_NUMBER", "0")),
             github_token=os.environ.get("GITHUB_TOKEN"),
+            github_tokens=[t.strip() for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t.strip()],
             min_confidence=float(os.environ.get("MIN_CONFIDENCE", "0.7")),
             post_comments=os.environ.get("POST_COMMENTS", "true").lower() == "true",
             post_summary=os.environ.get("POST_SUMMARY", "true").lower() == "true",
             report_low=os.environ.get("REPORT_LOW", "false").lower() == "true",
             parallel_validation=os.environ.get("PARALLEL_VALIDATION", "true").lower() == "true",
+            max_parallel=int(os.environ.get("MAX_PARALLEL", "8")),
+            fuse_below_hunks=int(os.environ.get("FUSE_BELOW_HUNKS", "4")),
+            validation_batch_size=int(os.environ.get("VALIDATION_BATCH_SIZE", "8")),
+            cache_validations=os.environ.get("CACHE_VALIDATIONS", "true").lower() == "true",
             min_severity=os.environ.get("MIN_SEVERITY", "medium"),
         )
 
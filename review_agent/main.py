@@ -13,15 +13,25 @@ Or via GitHub Actions (see .github/workflows/pr-review.yml)
 
 import argparse
 import asyncio
+import functools
 import sys
-from typing import List
 
 from .config import ReviewConfig
-from .models import ValidatedIssue
-from .pipeline import identify_issues, validate_issues, run_feedback_loop, LoopConfig, LoopResult
-from .tools import GitHubTool, parse_pr_diff, format_hunks
 from .utils import setup_logging, get_logger
 
+# Pipeline and GitHub modules pull in the agent SDK and PyGithub; they are
+# imported inside the commands that need them so `init` and `--help` stay fast.
+
+
+def _run_async(coro):
+    """Run a coroutine on uvloop when it is installed, else the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
 
 async def run_review(config: ReviewConfig) -> dict:
     """
@@ -33,6 +43,9 @@ async def run_review(config: ReviewConfig) -> dict:
     Returns:
         Dictionary with review statistics
     """
+    from .pipeline import review_core, filter_reportable_issues
+    from .tools import GitHubTool
+
     logger = get_logger()
 
     logger.info(f"Starting review for {config.repo} PR #{config.pr_number}")
@@ -41,55 +54,31 @@ async def run_review(config: ReviewConfig) -> dict:
     github = GitHubTool(
         repo=config.repo,
         pr_number=config.pr_number,
-        token=config.github_token
+        token=config.github_token,
+        tokens=config.github_tokens
     )
 
     # Get PR diff
     logger.info("Fetching PR diff...")
-    diff_text = github.get_diff()
+    diff_text = await asyncio.to_thread(github.get_diff)
 
     if not diff_text.strip():
         logger.info("No changes found in PR")
         return {"status": "no_changes", "potential": 0, "valid": 0}
 
-    # Parse diff into hunks
-    file_diffs = parse_pr_diff(diff_text)
-    hunks_text = format_hunks(file_diffs)
-
-    logger.info(f"Analyzing {len(file_diffs)} changed files...")
-
-    # Stage 1: Identify potential issues
-    logger.info("Stage 1: Identifying potential issues...")
-    potential_issues = await identify_issues(hunks_text)
-    logger.info(f"Stage 1 complete: Found {len(potential_issues)} potential issues")
-
-    # Filter by min_severity before Stage 2 (skip validation for low severity)
-    severity_order = ["low", "medium", "high", "critical"]
-    min_sev_idx = severity_order.index(config.min_severity)
-    filtered_issues = [
-        issue for issue in potential_issues
-        if severity_order.index(issue.severity.lower()) >= min_sev_idx
-    ]
-
-    if len(filtered_issues) < len(potential_issues):
-        skipped = len(potential_issues) - len(filtered_issues)
-        logger.info(f"Filtered out {skipped} issues below {config.min_severity} severity")
-
-    potential_issues = filtered_issues
+    # Stages 1 + 2
+    core = await review_core(diff_text, config)
+    potential_issues = core.potential_issues
+    validated_issues = core.validated_issues
 
     if not potential_issues:
         logger.info("No potential issues found")
         if config.post_summary:
-            github.post_review_summary([], {"potential": 0, "valid": 0, "false_positives": 0})
+            await asyncio.to_thread(
+                github.post_review_summary, [], {"potential": 0, "valid": 0, "false_positives": 0}
+            )
         return {"status": "clean", "potential": 0, "valid": 0}
 
-    # Stage 2: Validate issues with evidence
-    logger.info("Stage 2: Validating issues with evidence...")
-    validated_issues = await validate_issues(
-        potential_issues,
-        parallel=config.parallel_validation
-    )
-
     # Filter by confidence and severity
     reportable_issues = filter_reportable_issues(validated_issues, config)
 
@@ -105,55 +94,36 @@ async def run_review(config: ReviewConfig) -> dict:
         "valid": valid_count,
         "false_positives": false_positives,
         "reported": len(reportable_issues),
+        "skipped": core.skipped,
     }
 
     # Post comments
     if config.post_comments and reportable_issues:
         logger.info("Posting review comments...")
-        for issue in reportable_issues:
-            success = github.post_review_comment(issue)
-            if not success:
-                logger.warning(f"Failed to post comment for {issue.issue.file_path}:{issue.issue.line_start}")
+        # One review with all comments; per-issue comments if GitHub rejects it
+        if not await asyncio.to_thread(github.post_review_batch, reportable_issues):
+            logger.info("Batched review failed, posting comments individually...")
+            results = await asyncio.gather(
+                *(asyncio.to_thread(github.post_review_comment, issue) for issue in reportable_issues),
+                return_exceptions=True
+            )
+            for issue, result in zip(reportable_issues, results):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        f"Failed to post comment for {issue.issue.file_path}:{issue.issue.line_start}: {result}"
+                    )
+                elif result is not True:
+                    logger.warning(f"Failed to post comment for {issue.issue.file_path}:{issue.issue.line_start}")
 
     # Post summary
     if config.post_summary:
         logger.info("Posting review summary...")
-        github.post_review_summary(validated_issues, stats)
+        await asyncio.to_thread(github.post_review_summary, validated_issues, stats)
 
     logger.info("Review complete!")
     return stats
 
 
-def filter_reportable_issues(
-    validated_issues: List[ValidatedIssue],
-    config: ReviewConfig
-) -> List[ValidatedIssue]:
-    """Filter issues based on confidence and severity settings."""
-    reportable = []
-
-    for issue in validated_issues:
-        # Skip if not valid or below confidence threshold
-        if not issue.is_valid:
-            continue
-        if issue.confidence < config.min_confidence:
-            continue
-
-        # Check severity settings
-        severity = issue.issue.severity.lower()
-        if severity == "critical" and not config.report_critical:
-            continue
-        if severity == "high" and not config.report_high:
-            continue
-        if severity == "medium" and not config.report_medium:
-            continue
-        if severity == "low" and not config.report_low:
-            continue
-
-        reportable.append(issue)
-
-    return reportable
-
-
 def cmd_init(args):
     """Handle 'init' subcommand."""
     from pathlib import Path
@@ -195,7 +165,7 @@ def cmd_review(args):
 
     # Run
     try:
-        stats = asyncio.run(run_review(config))
+        stats = _run_async(run_review(config))
         logger.info(f"Review stats: {stats}")
         sys.exit(0)
     except Exception as e:
@@ -274,7 +244,7 @@ def cmd_orchestrate(args):
             print(f"Merged: {result['summary']['merged']}")
 
     try:
-        asyncio.run(run())
+        _run_async(run())
         sys.exit(0)
     except Exception as e:
         logger.exception(f"Orchestration failed: {e}")
@@ -285,6 +255,7 @@ def cmd_autofix(args):
     """Handle 'autofix' subcommand - THE CORE FEEDBACK LOOP."""
     import logging
     import os
+    from .pipeline import run_feedback_loop, LoopConfig, LoopResult
     setup_logging(level=logging.DEBUG if args.debug else logging.INFO)
     logger = get_logger()
 
@@ -310,6 +281,7 @@ def cmd_autofix(args):
         run_tests=args.run_tests,
         test_command=args.test_command,
         require_tests_pass=args.require_tests,
+        local_diff=args.local_diff,
         working_dir=os.getcwd(),
     )
 
@@ -317,7 +289,7 @@ def cmd_autofix(args):
     logger.info(f"Config: max_iterations={config.max_iterations}, auto_merge={config.auto_merge}, run_tests={config.run_tests}")
 
     try:
-        result, statuses = asyncio.run(run_feedback_loop(
+        result, statuses = _run_async(run_feedback_loop(
             repo=args.repo,
             pr_number=args.pr_number,
             config=config,
@@ -358,14 +330,16 @@ def cmd_testgen(args):
     setup_logging(level=logging.DEBUG if args.debug else logging.INFO)
     logger = get_logger()
 
-    from .pipeline import generate_tests, CoverageGate
+    from .pipeline import generate_tests, review_core, CoverageGate
+    from .tools import GitHubTool
     from .config import MergeRules
     from .models import TestGenConfig
 
     # Initialize GitHub tool
     github = GitHubTool(
         repo=args.repo,
-        pr_number=args.pr_number
+        pr_number=args.pr_number,
+        tokens=ReviewConfig.from_env().github_tokens
     )
 
     async def run():
@@ -373,20 +347,19 @@ def cmd_testgen(args):
 
         # Get PR diff
         logger.info("Fetching PR diff...")
-        diff_text = github.get_diff()
-        changed_files = github.get_changed_files()
+        diff_text, changed_files = await asyncio.to_thread(github.fetch_pr_bundle)
 
         if not diff_text.strip():
             logger.info("No changes found in PR")
             return
 
-        # First run Stage 1,2 to get validated issues
+        # First run Stage 1,2 to get validated issues (all severities)
         logger.info("Running Stage 1,2 review first...")
-        file_diffs = parse_pr_diff(diff_text)
-        hunks_text = format_hunks(file_diffs)
-
-        potential_issues = await identify_issues(hunks_text)
-        validated_issues = await validate_issues(potential_issues, parallel=True)
+        review_config = ReviewConfig.from_env()
+        review_config.repo = args.repo
+        review_config.min_severity = "low"
+        review_config.report_low = True
+        validated_issues = (await review_core(diff_text, review_config)).validated_issues
 
         valid_count = len([i for i in validated_issues if i.is_valid])
         logger.info(f"Found {valid_count} valid issues for regression tests")
@@ -435,15 +408,16 @@ def cmd_testgen(args):
         return decision
 
     try:
-        asyncio.run(run())
+        _run_async(run())
         sys.exit(0)
     except Exception as e:
         logger.exception(f"Test generation failed: {e}")
         sys.exit(1)
 
 
-def main():
-    """CLI entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="AI PR Review Agent using Claude Agent SDK"
     )
@@ -616,6 +590,11 @@ def main():
         action="store_true",
         help="Require tests to pass before merge"
     )
+    autofix_parser.add_argument(
+        "--local-diff",
+        action="store_true",
+        help="Diff the checkout locally (histogram algorithm, ignores end-of-line whitespace)"
+    )
     autofix_parser.add_argument(
         "--debug",
         action="store_true",
@@ -672,6 +651,12 @@ def main():
         help="Enable debug logging"
     )
 
+    return parser
+
+
+def main():
+    """CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Route to subcommand
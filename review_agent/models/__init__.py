@@ -1,6 +1,6 @@
 """Data models for PR review."""
 
-from .issue import Severity, IssueType, PotentialIssue, ValidatedIssue
+from .issue import Severity, SEVERITY_RANK, IssueType, PotentialIssue, ValidatedIssue
 from .orchestrator import (
     PRStatus,
     PRNode,
@@ -19,6 +19,7 @@ from .test_gen import (
 
 __all__ = [
     "Severity",
+    "SEVERITY_RANK",
     "IssueType",
     "PotentialIssue",
     "ValidatedIssue",
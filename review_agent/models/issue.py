@@ -1,5 +1,6 @@
 """Data models for issues."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List
@@ -13,6 +14,13 @@ class Severity(Enum):
     LOW = "low"             # Style, suggestions
 
 
+# Severity value -> rank (higher is more severe), for cheap int comparisons
+SEVERITY_RANK = {
+    sev.value: rank
+    for rank, sev in enumerate((Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL))
+}
+
+
 class IssueType(Enum):
     """Types of issues that can be detected."""
     BUG = "bug"
@@ -24,7 +32,7 @@ class IssueType(Enum):
     BEST_PRACTICE = "best_practice"
 
 
-@dataclass
+@dataclass(slots=True)
 class PotentialIssue:
     """Stage 1 output - potential issue found in code."""
     file_path: str
@@ -35,8 +43,13 @@ class PotentialIssue:
     description: str
     code_snippet: str
 
+    def __post_init__(self):
+        # Canonical interned form: callers compare and rank without .lower()
+        self.severity = sys.intern(str(self.severity).lower())
+        self.issue_type = sys.intern(str(self.issue_type).lower())
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidatedIssue:
     """Stage 2 output - validated issue with evidence."""
     issue: PotentialIssue
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, FrozenSet, Optional, Set
 from datetime import datetime
 
 
@@ -19,7 +19,11 @@ class PRStatus(Enum):
     BLOCKED = "blocked"           # Blocked by dependencies
 
 
-@dataclass
+# Statuses that keep a PR from progressing (built once, not per check)
+_BLOCKED_STATUSES = frozenset({PRStatus.BLOCKED, PRStatus.CONFLICT})
+
+
+@dataclass(slots=True)
 class PRNode:
     """Represents a PR in the orchestration graph."""
     pr_number: int
@@ -27,24 +31,31 @@ class PRNode:
     base: str                     # Target branch (usually main)
     status: PRStatus = PRStatus.PENDING
     changed_files: List[str] = field(default_factory=list)
-    depends_on: List[int] = field(default_factory=list)      # PR numbers this depends on
-    conflicts_with: List[int] = field(default_factory=list)  # PRs with file overlap
+    depends_on: Set[int] = field(default_factory=set)  # PR numbers this depends on
+    conflicts_with: FrozenSet[int] = frozenset()       # PRs with file overlap (set by analyze)
     review_result: Optional[dict] = None  # Review stats from Stage 1,2
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # changed_files as a set, built once for overlap checks
+    file_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.file_set = frozenset(self.changed_files)
+        self.depends_on = set(self.depends_on)
+        self.conflicts_with = frozenset(self.conflicts_with)
 
     @property
     def is_ready_for_merge(self) -> bool:
         """Check if PR is ready to be merged."""
-        return self.status == PRStatus.REVIEW_PASSED
+        return self.status is PRStatus.REVIEW_PASSED
 
     @property
     def is_blocked(self) -> bool:
         """Check if PR is blocked by dependencies or conflicts."""
-        return self.status in (PRStatus.BLOCKED, PRStatus.CONFLICT)
+        return self.status in _BLOCKED_STATUSES
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of a merge operation."""
     pr_number: int
@@ -55,7 +66,7 @@ class MergeResult:
     merged_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorConfig:
     """Configuration for the PR orchestrator."""
     # Merge settings
@@ -1,5 +1,7 @@
 """Data models for Phase 3: TDD-Based Test Generation."""
 
+import io
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict
@@ -21,6 +23,10 @@ class TestCategory(Enum):
     REGRESSION = "regression"      # Tests for discovered issues
 
 
+# Test function definitions at the start of a line (not in strings or comments)
+_TEST_DEF_RE = re.compile(r"^[ \t]*(?:async[ \t]+)?def test_", re.MULTILINE)
+
+
 @dataclass
 class GeneratedTest:
     """A single generated test file."""
@@ -35,7 +41,7 @@ class GeneratedTest:
     def __post_init__(self):
         # Count test functions if not set
         if self.test_count == 0:
-            self.test_count = self.content.count("def test_")
+            self.test_count = sum(1 for _ in _TEST_DEF_RE.finditer(self.content))
 
 
 @dataclass
@@ -59,6 +65,11 @@ class CoverageResult:
         return self.tests_passed + self.tests_failed + self.tests_skipped
 
 
+# Indexed by bool: False -> 0, True -> 1
+_DECISION_STATUS = ("❌ BLOCKED", "✅ APPROVED")
+_CONDITION_ICONS = ("❌", "✅")
+
+
 @dataclass
 class MergeDecision:
     """Final decision on whether to approve merge."""
@@ -72,28 +83,25 @@ class MergeDecision:
 
     def summary(self) -> str:
         """Generate human-readable summary."""
-        status = "✅ APPROVED" if self.approved else "❌ BLOCKED"
-        lines = [f"## Merge Decision: {status}", "", self.reason, ""]
+        buf = io.StringIO()
+        buf.write(f"## Merge Decision: {_DECISION_STATUS[bool(self.approved)]}\n\n{self.reason}\n")
 
         if self.conditions_met:
-            lines.append("### Conditions")
+            buf.write("\n### Conditions")
             for cond, met in self.conditions_met.items():
-                icon = "✅" if met else "❌"
-                lines.append(f"- {icon} {cond}")
+                buf.write(f"\n- {_CONDITION_ICONS[bool(met)]} {cond}")
 
         if self.blocking_issues:
-            lines.append("")
-            lines.append("### Blocking Issues")
+            buf.write("\n\n### Blocking Issues")
             for issue in self.blocking_issues:
-                lines.append(f"- {issue}")
+                buf.write(f"\n- {issue}")
 
         if self.recommendations:
-            lines.append("")
-            lines.append("### Recommendations")
+            buf.write("\n\n### Recommendations")
             for rec in self.recommendations:
-                lines.append(f"- {rec}")
+                buf.write(f"\n- {rec}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 @dataclass
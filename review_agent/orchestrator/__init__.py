@@ -5,16 +5,19 @@ This module provides:
 - DependencyAnalyzer: Analyzes dependencies between PRs
 - ConflictPredictor: Predicts file conflicts between PRs
 - MergeExecutor: Executes merge operations safely
+- PRIndex: Shared lookup tables for dependency and conflict analysis
 """
 
 from .orchestrator import PROrchestrator
 from .dependency import DependencyAnalyzer
 from .conflict import ConflictPredictor
 from .merge import MergeExecutor
+from .index import PRIndex
 
 __all__ = [
     "PROrchestrator",
     "DependencyAnalyzer",
     "ConflictPredictor",
     "MergeExecutor",
+    "PRIndex",
 ]
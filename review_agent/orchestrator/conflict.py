@@ -1,10 +1,11 @@
 """Conflict prediction for Multi-PR Orchestration."""
 
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from collections import defaultdict
-from pathlib import Path
+from itertools import combinations
 
 from ..models import PRNode
+from .index import PRIndex
 
 
 class ConflictPredictor:
@@ -19,28 +20,33 @@ class ConflictPredictor:
 
     def __init__(self):
         self._file_to_prs: Dict[str, Set[int]] = defaultdict(set)
-        self._dir_to_prs: Dict[str, Set[int]] = defaultdict(set)
+        self._dir_to_prs: Optional[Dict[str, Set[int]]] = None  # Built lazily from _file_to_prs
+        self._pr_map: Dict[int, PRNode] = {}
+        self._analyzed_prs: Optional[List[PRNode]] = None  # List last passed to analyze()
+        self._signatures: Dict[int, int] = {}  # PR -> 64-bit file signature, built lazily
 
-    def analyze(self, prs: List[PRNode]) -> None:
+    def analyze(self, prs: List[PRNode], index: Optional[PRIndex] = None) -> None:
         """
         Analyze PRs for potential conflicts.
 
         Args:
             prs: List of PRNode objects
+            index: Optional PRIndex already built from prs; skips the scan
         """
-        self._file_to_prs.clear()
-        self._dir_to_prs.clear()
+        if index is None or not index.matches(prs):
+            index = PRIndex.build(prs)
 
-        for pr in prs:
-            for file_path in pr.changed_files:
-                self._file_to_prs[file_path].add(pr.pr_number)
+        # Shared with the index; replaced (never mutated) on re-analysis
+        self._file_to_prs = index.file_to_prs
+        self._dir_to_prs = None
+        self._pr_map = index.pr_map
+        self._analyzed_prs = prs
+        self._signatures = {}
 
-                # Track directory-level changes
-                path = Path(file_path)
-                for parent in path.parents:
-                    parent_str = str(parent)
-                    if parent_str != ".":
-                        self._dir_to_prs[parent_str].add(pr.pr_number)
+    def _ensure_analyzed(self, prs: List[PRNode]) -> None:
+        """Analyze prs unless they are the list last analyzed."""
+        if prs is not self._analyzed_prs:
+            self.analyze(prs)
 
     def predict_conflicts(
         self,
@@ -59,44 +65,63 @@ class ConflictPredictor:
         Returns:
             Tuple of (has_conflict, conflicting_files)
         """
-        pr_map = {pr.pr_number: pr for pr in prs}
+        # Reuse the PR index while callers pass the same list
+        self._ensure_analyzed(prs)
 
+        pr_map = self._pr_map
         if pr_a not in pr_map or pr_b not in pr_map:
             return False, []
 
-        files_a = set(pr_map[pr_a].changed_files)
-        files_b = set(pr_map[pr_b].changed_files)
+        # Disjoint signatures prove disjoint file sets; most pairs stop here
+        if not self._signature(pr_a) & self._signature(pr_b):
+            return False, []
 
-        overlapping = files_a & files_b
+        overlapping = pr_map[pr_a].file_set & pr_map[pr_b].file_set
         return bool(overlapping), list(overlapping)
 
-    def get_all_conflict_pairs(self, prs: List[PRNode]) -> List[Tuple[int, int, List[str]]]:
+    def _signature(self, pr_number: int) -> int:
+        """
+        Get a PR's file signature: one bit (of 64) set per changed file.
+
+        Two PRs sharing a file always share a bit, so an empty AND of
+        their signatures rules out any overlap without a set intersection.
+        """
+        signature = self._signatures.get(pr_number)
+        if signature is None:
+            signature = 0
+            for file_path in self._pr_map[pr_number].file_set:
+                signature |= 1 << (hash(file_path) & 63)
+            self._signatures[pr_number] = signature
+        return signature
+
+    def get_all_conflict_pairs(
+        self,
+        prs: List[PRNode],
+        index: Optional[PRIndex] = None
+    ) -> List[Tuple[int, int, List[str]]]:
         """
         Get all pairs of PRs that may conflict.
 
         Args:
             prs: List of PRNode objects
+            index: Optional PRIndex already built from prs; analyzes from it
 
         Returns:
-            List of (pr_a, pr_b, conflicting_files) tuples
+            List of (pr_a, pr_b, conflicting_files) tuples, files sorted
         """
-        self.analyze(prs)
-        conflicts = []
-
-        pr_numbers = [pr.pr_number for pr in prs]
-        n = len(pr_numbers)
+        if prs is not self._analyzed_prs:
+            self.analyze(prs, index)
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                has_conflict, files = self.predict_conflicts(
-                    pr_numbers[i],
-                    pr_numbers[j],
-                    prs
-                )
-                if has_conflict:
-                    conflicts.append((pr_numbers[i], pr_numbers[j], files))
+        # Only PRs that co-occur on some file can conflict: walk the
+        # inverted index instead of testing every pair of PRs
+        pair_to_files: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for file_path, pr_set in self._file_to_prs.items():
+            if len(pr_set) < 2:
+                continue
+            for pr_a, pr_b in combinations(sorted(pr_set), 2):
+                pair_to_files[(pr_a, pr_b)].append(file_path)
 
-        return conflicts
+        return [(pr_a, pr_b, sorted(files)) for (pr_a, pr_b), files in pair_to_files.items()]
 
     def get_conflict_free_order(
         self,
@@ -116,8 +141,8 @@ class ConflictPredictor:
         Returns:
             Reordered list of PR numbers
         """
-        self.analyze(prs)
-        pr_map = {pr.pr_number: pr for pr in prs}
+        self._ensure_analyzed(prs)
+        pr_map = self._pr_map
 
         # Group PRs by overlapping files
         conflict_groups = self._find_conflict_groups(prs)
@@ -126,6 +151,9 @@ class ConflictPredictor:
         for group in conflict_groups:
             group.sort(key=lambda pr: pr_map[pr].created_at)
 
+        # Index each PR's conflict group once instead of scanning all groups
+        pr_to_group = {pr: group for group in conflict_groups for pr in group}
+
         # Merge groups back respecting base_order
         result = []
         used = set()
@@ -134,15 +162,13 @@ class ConflictPredictor:
             if pr_num in used:
                 continue
 
-            # Find the conflict group containing this PR
-            for group in conflict_groups:
-                if pr_num in group:
-                    # Add entire group in order
-                    for g_pr in group:
-                        if g_pr not in used:
-                            result.append(g_pr)
-                            used.add(g_pr)
-                    break
+            group = pr_to_group.get(pr_num)
+            if group is not None:
+                # Add entire group in order
+                for g_pr in group:
+                    if g_pr not in used:
+                        result.append(g_pr)
+                        used.add(g_pr)
             else:
                 # PR not in any conflict group
                 result.append(pr_num)
@@ -154,38 +180,55 @@ class ConflictPredictor:
         """
         Find groups of PRs that have file overlaps.
 
-        Uses union-find to group PRs with transitive overlaps.
+        Uses union-find (union by size, iterative path compression) to
+        group PRs with transitive overlaps.
         """
         pr_numbers = [pr.pr_number for pr in prs]
 
-        # Union-Find data structure
-        parent = {pr: pr for pr in pr_numbers}
-
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
+        # Union-Find over dense indices
+        index = {pr: i for i, pr in enumerate(pr_numbers)}
+        parent = list(range(len(pr_numbers)))
+        size = [1] * len(pr_numbers)
+
+        def find(x: int) -> int:
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            # Second pass: point every node on the path at the root
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        def union(x: int, y: int):
+            rx, ry = find(x), find(y)
+            if rx == ry:
+                return
+            if size[rx] < size[ry]:
+                rx, ry = ry, rx
+            parent[ry] = rx
+            size[rx] += size[ry]
 
         # Union PRs that share files
-        for file_path, pr_set in self._file_to_prs.items():
-            pr_list = list(pr_set)
-            for i in range(1, len(pr_list)):
-                union(pr_list[0], pr_list[i])
+        for pr_set in self._file_to_prs.values():
+            if len(pr_set) < 2:
+                continue
+            members = iter(pr_set)
+            first = index[next(members)]
+            for pr in members:
+                union(first, index[pr])
 
         # Group by root
         groups: Dict[int, List[int]] = defaultdict(list)
         for pr in pr_numbers:
-            groups[find(pr)].append(pr)
+            groups[find(index[pr])].append(pr)
 
         return [g for g in groups.values() if len(g) > 1]
 
     def get_files_by_pr(self, pr_number: int, prs: List[PRNode]) -> List[str]:
         """Get list of changed files for a PR."""
+        if prs is self._analyzed_prs:
+            pr = self._pr_map.get(pr_number)
+            return pr.changed_files if pr else []
         for pr in prs:
             if pr.pr_number == pr_number:
                 return pr.changed_files
@@ -194,3 +237,20 @@ class ConflictPredictor:
     def get_prs_by_file(self, file_path: str) -> Set[int]:
         """Get all PRs that modify a specific file."""
         return self._file_to_prs.get(file_path, set()).copy()
+
+    def get_prs_by_dir(self, dir_path: str) -> Set[int]:
+        """Get all PRs that modify files anywhere under a directory."""
+        return self._ensure_dir_index().get(dir_path.rstrip("/"), set()).copy()
+
+    def _ensure_dir_index(self) -> Dict[str, Set[int]]:
+        """Build the directory -> PRs index on first use after analyze()."""
+        if self._dir_to_prs is None:
+            dir_to_prs: Dict[str, Set[int]] = defaultdict(set)
+            for file_path, pr_set in self._file_to_prs.items():
+                # String slicing is much cheaper than Path(...).parents
+                directory = file_path
+                while "/" in directory:
+                    directory = directory.rsplit("/", 1)[0]
+                    dir_to_prs[directory] |= pr_set
+            self._dir_to_prs = dir_to_prs
+        return self._dir_to_prs
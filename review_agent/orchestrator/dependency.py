@@ -1,9 +1,11 @@
 """Dependency analysis for Multi-PR Orchestration."""
 
-from typing import List, Dict, Set, Tuple
+import heapq
+from typing import List, Dict, Optional, Set, Tuple
 from collections import defaultdict
 
 from ..models import PRNode, PRStatus
+from .index import PRIndex
 
 
 class DependencyAnalyzer:
@@ -18,22 +20,32 @@ class DependencyAnalyzer:
     def __init__(self):
         self._graph: Dict[int, Set[int]] = defaultdict(set)  # PR -> depends on
         self._reverse_graph: Dict[int, Set[int]] = defaultdict(set)  # PR -> depended by
+        # (signature, order, groups) of the last analyze_all() call
+        self._analysis: Optional[Tuple[tuple, List[int], List[List[int]]]] = None
 
-    def build_dependency_graph(self, prs: List[PRNode]) -> None:
+    def build_dependency_graph(self, prs: List[PRNode], index: Optional[PRIndex] = None) -> None:
         """
         Build dependency graph from list of PRs.
 
         Args:
             prs: List of PRNode objects
+            index: Optional PRIndex already built from prs
         """
         self._graph.clear()
         self._reverse_graph.clear()
+        self._analysis = None
 
-        pr_by_branch = {pr.branch: pr.pr_number for pr in prs}
+        # Only branches that some PR targets can create a dependency;
+        # usually every PR targets main and there are none
+        bases = {pr.base for pr in prs}
+        if index is not None and index.matches(prs):
+            pr_by_branch = {b: index.branch_map[b] for b in bases if b in index.branch_map}
+        else:
+            pr_by_branch = {pr.branch: pr.pr_number for pr in prs if pr.branch in bases}
 
         for pr in prs:
             # Check if this PR's base is another PR's branch
-            if pr.base in pr_by_branch:
+            if pr_by_branch and pr.base in pr_by_branch:
                 dependency = pr_by_branch[pr.base]
                 self._graph[pr.pr_number].add(dependency)
                 self._reverse_graph[dependency].add(pr.pr_number)
@@ -43,14 +55,49 @@ class DependencyAnalyzer:
                 self._graph[pr.pr_number].add(dep)
                 self._reverse_graph[dep].add(pr.pr_number)
 
-    def topological_sort(self, prs: List[PRNode]) -> List[int]:
+    def analyze_all(
+        self,
+        prs: List[PRNode],
+        index: Optional[PRIndex] = None
+    ) -> Tuple[List[int], List[List[int]]]:
+        """
+        Compute merge order and parallel groups from a single graph build.
+
+        Results are cached by the PRs' dependency-relevant fields, so
+        repeated calls for the same PR set skip the graph work.
+
+        Args:
+            prs: List of PRNode objects
+            index: Optional PRIndex already built from prs
+
+        Returns:
+            Tuple of (topological order, parallel groups)
+
+        Raises:
+            ValueError: If circular dependency detected
+        """
+        signature = tuple(
+            (pr.pr_number, pr.branch, pr.base, frozenset(pr.depends_on)) for pr in prs
+        )
+        if self._analysis is None or self._analysis[0] != signature:
+            self.build_dependency_graph(prs, index)
+            pr_numbers = {pr.pr_number for pr in prs}
+            order = self._kahn_order(pr_numbers)
+            groups = self._levels(pr_numbers)
+            self._analysis = (signature, order, groups)
+
+        _, order, groups = self._analysis
+        return list(order), [list(group) for group in groups]
+
+    def topological_sort(self, prs: List[PRNode], index: Optional[PRIndex] = None) -> List[int]:
         """
         Return PRs in topological order (dependencies first).
 
-        Uses Kahn's algorithm for topological sorting.
+        Uses Kahn's algorithm with a min-heap, O((V + E) log V).
 
         Args:
             prs: List of PRNode objects
+            index: Optional PRIndex already built from prs
 
         Returns:
             List of PR numbers in merge order
@@ -58,9 +105,24 @@ class DependencyAnalyzer:
         Raises:
             ValueError: If circular dependency detected
         """
-        self.build_dependency_graph(prs)
+        return self.analyze_all(prs, index)[0]
+
+    def get_parallel_groups(self, prs: List[PRNode]) -> List[List[int]]:
+        """
+        Group PRs that can be reviewed in parallel.
+
+        PRs in the same group have no dependencies on each other.
+
+        Args:
+            prs: List of PRNode objects
+
+        Returns:
+            List of groups, where each group can run in parallel
+        """
+        return self.analyze_all(prs)[1]
 
-        pr_numbers = {pr.pr_number for pr in prs}
+    def _kahn_order(self, pr_numbers: Set[int]) -> List[int]:
+        """Topologically sort pr_numbers over the built graph."""
         in_degree = {pr: 0 for pr in pr_numbers}
 
         # Calculate in-degrees
@@ -69,14 +131,14 @@ class DependencyAnalyzer:
                 if dep in pr_numbers:
                     in_degree[pr] += 1
 
-        # Start with PRs that have no dependencies
+        # Start with PRs that have no dependencies; a min-heap pops the
+        # lowest PR number first for deterministic ordering
         queue = [pr for pr, degree in in_degree.items() if degree == 0]
+        heapq.heapify(queue)
         result = []
 
         while queue:
-            # Sort by PR number for deterministic ordering
-            queue.sort()
-            current = queue.pop(0)
+            current = heapq.heappop(queue)
             result.append(current)
 
             # Reduce in-degree for dependent PRs
@@ -84,7 +146,7 @@ class DependencyAnalyzer:
                 if dependent in in_degree:
                     in_degree[dependent] -= 1
                     if in_degree[dependent] == 0:
-                        queue.append(dependent)
+                        heapq.heappush(queue, dependent)
 
         if len(result) != len(pr_numbers):
             # Circular dependency detected
@@ -93,44 +155,40 @@ class DependencyAnalyzer:
 
         return result
 
-    def get_parallel_groups(self, prs: List[PRNode]) -> List[List[int]]:
+    def _levels(self, pr_numbers: Set[int]) -> List[List[int]]:
         """
-        Group PRs that can be reviewed in parallel.
-
-        PRs in the same group have no dependencies on each other.
-
-        Args:
-            prs: List of PRNode objects
+        Group pr_numbers into dependency levels over the built graph.
 
-        Returns:
-            List of groups, where each group can run in parallel
+        Layered Kahn's algorithm: each level is the set of PRs whose
+        in-degree drops to zero once the previous level is processed,
+        O(V + E) overall.
         """
-        self.build_dependency_graph(prs)
+        in_degree = {
+            pr: sum(1 for dep in self._graph[pr] if dep in pr_numbers)
+            for pr in pr_numbers
+        }
 
-        pr_numbers = {pr.pr_number for pr in prs}
-        processed = set()
+        current = sorted(pr for pr, degree in in_degree.items() if degree == 0)
         groups = []
-
-        while len(processed) < len(pr_numbers):
-            # Find all PRs whose dependencies are all processed
-            current_group = []
-
-            for pr_num in pr_numbers:
-                if pr_num in processed:
-                    continue
-
-                deps = self._graph[pr_num] & pr_numbers
-                if deps <= processed:
-                    current_group.append(pr_num)
-
-            if not current_group:
-                # Should not happen if no circular deps
-                remaining = pr_numbers - processed
-                raise ValueError(f"Cannot resolve dependencies for PRs: {remaining}")
-
-            current_group.sort()
-            groups.append(current_group)
-            processed.update(current_group)
+        placed = 0
+
+        while current:
+            groups.append(current)
+            placed += len(current)
+            next_level = []
+            for pr in current:
+                for dependent in self._reverse_graph[pr]:
+                    if dependent in in_degree:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            next_level.append(dependent)
+            next_level.sort()
+            current = next_level
+
+        if placed != len(pr_numbers):
+            # Should not happen if no circular deps
+            placed_prs = {pr for group in groups for pr in group}
+            raise ValueError(f"Cannot resolve dependencies for PRs: {pr_numbers - placed_prs}")
 
         return groups
 
@@ -155,3 +213,18 @@ class DependencyAnalyzer:
         """
         deps = self._graph.get(pr_number, set())
         return bool(deps - merged_prs)
+
+    def compute_blocked(self, merged_prs: Set[int]) -> Set[int]:
+        """
+        Get every PR blocked by unmerged dependencies, in one pass.
+
+        Args:
+            merged_prs: Set of already merged PR numbers
+
+        Returns:
+            Set of PR numbers with at least one unmerged dependency
+        """
+        return {
+            pr_number for pr_number, deps in self._graph.items()
+            if not deps <= merged_prs
+        }
@@ -0,0 +1,48 @@
+"""Shared PR index for Multi-PR Orchestration."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+from ..models import PRNode
+
+
+@dataclass
+class PRIndex:
+    """
+    Lookup tables over a list of PRs, built in one pass.
+
+    Dependency and conflict analysis both start from these tables, so the
+    orchestrator builds the index once and hands it to both.
+    """
+    prs: List[PRNode]
+    pr_map: Dict[int, PRNode] = field(default_factory=dict)          # PR number -> node
+    branch_map: Dict[str, int] = field(default_factory=dict)         # head branch -> PR number
+    file_to_prs: Dict[str, Set[int]] = field(default_factory=dict)   # file path -> PR numbers
+
+    @classmethod
+    def build(cls, prs: List[PRNode]) -> "PRIndex":
+        """
+        Build the index with a single pass over the PRs.
+
+        Args:
+            prs: List of PRNode objects
+
+        Returns:
+            PRIndex over prs
+        """
+        pr_map: Dict[int, PRNode] = {}
+        branch_map: Dict[str, int] = {}
+        file_to_prs: Dict[str, Set[int]] = defaultdict(set)
+
+        for pr in prs:
+            pr_map[pr.pr_number] = pr
+            branch_map[pr.branch] = pr.pr_number
+            for file_path in pr.changed_files:
+                file_to_prs[file_path].add(pr.pr_number)
+
+        return cls(prs=prs, pr_map=pr_map, branch_map=branch_map, file_to_prs=file_to_prs)
+
+    def matches(self, prs: List[PRNode]) -> bool:
+        """Check whether this index was built from prs."""
+        return prs is self.prs
@@ -1,7 +1,7 @@
 """Merge executor for Multi-PR Orchestration."""
 
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from github import Github, GithubException
@@ -9,9 +9,43 @@ from github.PullRequest import PullRequest as GHPullRequest
 from github.Repository import Repository as GHRepository
 
 from ..models import PRNode, PRStatus, MergeResult, OrchestratorConfig
+from ..tools import graphql_query
 from ..utils import get_logger
 
 
+# Polling schedule while GitHub computes mergeability (~9s worst case)
+MERGEABLE_POLL_INITIAL_DELAY = 0.1
+MERGEABLE_POLL_MAX_DELAY = 2.0
+MERGEABLE_POLL_ATTEMPTS = 8
+
+# Commit statuses and check runs of a commit in a single request
+CI_STATUS_QUERY = """
+query($owner: String!, $name: String!, $sha: GitObjectID!) {
+  repository(owner: $owner, name: $name) {
+    object(oid: $sha) {
+      ... on Commit {
+        statusCheckRollup {
+          state
+          contexts(first: 100) {
+            nodes {
+              __typename
+              ... on CheckRun { name status conclusion }
+              ... on StatusContext { context state }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Pause after a group that merged something, before dependent PRs are checked
+MERGE_SETTLE_DELAY = 2.0
+
+_PASSING_CONCLUSIONS = frozenset({"SUCCESS", "SKIPPED", "NEUTRAL"})
+
+
 class MergeExecutor:
     """
     Executes merge operations for PRs.
@@ -19,7 +53,7 @@ class MergeExecutor:
     Handles:
     - Conflict detection and auto-rebase
     - CI status checking
-    - Sequential merge execution
+    - Merge execution (concurrent within independent groups)
     - Rollback on failure
     """
 
@@ -38,26 +72,45 @@ class MergeExecutor:
         self.repo = repo
         self.config = config
         self.logger = get_logger()
+        # Caps in-flight GitHub API calls across all concurrent checks and
+        # merges, to stay clear of GitHub's secondary rate limits
+        self._gh_sem = asyncio.Semaphore(max(1, config.max_parallel_reviews))
 
-    async def check_mergeable(self, pr_number: int) -> tuple[bool, str]:
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking PyGithub call off the event loop, bounded by _gh_sem."""
+        async with self._gh_sem:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _get_pull(
+        self,
+        pr_number: int,
+        pulls: Optional[Dict[int, GHPullRequest]] = None
+    ) -> GHPullRequest:
+        """Fetch a PR, reusing the copy in pulls when given."""
+        if pulls is not None and pr_number in pulls:
+            return pulls[pr_number]
+        pr = await self._call(self.repo.get_pull, pr_number)
+        if pulls is not None:
+            pulls[pr_number] = pr
+        return pr
+
+    async def check_mergeable(
+        self,
+        pr_number: int,
+        pulls: Optional[Dict[int, GHPullRequest]] = None
+    ) -> tuple[bool, str]:
         """
         Check if a PR is mergeable.
 
         Args:
             pr_number: PR number to check
+            pulls: Optional PR cache shared across checks of one merge
 
         Returns:
             Tuple of (is_mergeable, reason)
         """
         try:
-            pr = self.repo.get_pull(pr_number)
-
-            # Wait for mergeable state to be computed
-            for _ in range(10):
-                if pr.mergeable is not None:
-                    break
-                await asyncio.sleep(1)
-                pr = self.repo.get_pull(pr_number)
+            pr = await self._await_mergeable(pr_number, pulls)
 
             if pr.mergeable is None:
                 return False, "Mergeable state unknown"
@@ -76,44 +129,97 @@ class MergeExecutor:
         except GithubException as e:
             return False, f"GitHub API error: {e}"
 
-    async def check_ci_status(self, pr_number: int) -> tuple[bool, str]:
+    async def _await_mergeable(
+        self,
+        pr_number: int,
+        pulls: Optional[Dict[int, GHPullRequest]] = None
+    ) -> GHPullRequest:
+        """
+        Fetch a PR and poll until GitHub has computed its mergeable state.
+
+        Backs off exponentially between refreshes. Sleeps do not hold the
+        API semaphore, so many PRs can poll at once.
+
+        Args:
+            pr_number: PR number to poll
+            pulls: Optional PR cache shared across checks of one merge
+
+        Returns:
+            The PR; mergeable is still None if polling gave up
+        """
+        pr = await self._get_pull(pr_number, pulls)
+
+        delay = MERGEABLE_POLL_INITIAL_DELAY
+        for _ in range(MERGEABLE_POLL_ATTEMPTS):
+            if pr.mergeable is not None:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MERGEABLE_POLL_MAX_DELAY)
+            # Conditional refresh of the same object (304 when unchanged)
+            await self._call(pr.update)
+
+        return pr
+
+    async def check_ci_status(
+        self,
+        pr_number: int,
+        pulls: Optional[Dict[int, GHPullRequest]] = None
+    ) -> tuple[bool, str]:
         """
         Check if CI checks have passed.
 
         Args:
             pr_number: PR number to check
+            pulls: Optional PR cache shared across checks of one merge
 
         Returns:
             Tuple of (all_passed, status_message)
         """
         try:
-            pr = self.repo.get_pull(pr_number)
-            commit = self.repo.get_commit(pr.head.sha)
-
-            # Get combined status
-            combined = commit.get_combined_status()
-
-            if combined.state == "pending":
-                return False, "CI checks still running"
-            if combined.state == "failure":
-                failed = [s.context for s in combined.statuses if s.state == "failure"]
-                return False, f"CI checks failed: {', '.join(failed)}"
-            if combined.state == "error":
-                return False, "CI checks errored"
-
-            # Also check check runs (GitHub Actions)
-            check_runs = commit.get_check_runs()
-            for run in check_runs:
-                if run.conclusion not in ("success", "skipped", "neutral"):
-                    if run.status == "in_progress":
-                        return False, f"Check '{run.name}' still running"
-                    return False, f"Check '{run.name}' failed: {run.conclusion}"
-
-            return True, "All checks passed"
+            pr = await self._get_pull(pr_number, pulls)
+        except GithubException as e:
+            return False, f"GitHub API error: {e}"
+        return await self._call(self._check_ci_status_sync, pr)
 
+    def _check_ci_status_sync(self, pr: GHPullRequest) -> tuple[bool, str]:
+        """Blocking implementation of check_ci_status (one GraphQL request)."""
+        try:
+            data = graphql_query(self.repo, CI_STATUS_QUERY, {"sha": pr.head.sha})
         except GithubException as e:
             return False, f"GitHub API error: {e}"
 
+        commit = (data.get("repository") or {}).get("object") or {}
+        rollup = commit.get("statusCheckRollup")
+        if rollup is None:
+            return True, "All checks passed"  # No statuses or check runs
+
+        contexts = rollup["contexts"]["nodes"]
+
+        # Commit statuses first, then check runs (GitHub Actions)
+        statuses = [c for c in contexts if c["__typename"] == "StatusContext"]
+        states = {c["state"] for c in statuses}
+        if states & {"PENDING", "EXPECTED"}:
+            return False, "CI checks still running"
+        if "FAILURE" in states:
+            failed = [c["context"] for c in statuses if c["state"] == "FAILURE"]
+            return False, f"CI checks failed: {', '.join(failed)}"
+        if "ERROR" in states:
+            return False, "CI checks errored"
+
+        for run in contexts:
+            if run["__typename"] != "CheckRun":
+                continue
+            if run["conclusion"] not in _PASSING_CONCLUSIONS:
+                if run["status"] != "COMPLETED":
+                    return False, f"Check '{run['name']}' still running"
+                return False, f"Check '{run['name']}' failed: {(run['conclusion'] or '').lower()}"
+
+        # Contexts beyond the first page are covered by the rollup state
+        if rollup["state"] != "SUCCESS":
+            return False, f"CI checks not passing: {rollup['state'].lower()}"
+
+        return True, "All checks passed"
+
     async def attempt_rebase(self, pr_number: int) -> bool:
         """
         Attempt to rebase a PR onto its base branch.
@@ -125,16 +231,16 @@ class MergeExecutor:
             True if rebase succeeded
         """
         try:
-            pr = self.repo.get_pull(pr_number)
+            pr = await self._get_pull(pr_number)
 
             # GitHub's update branch feature (equivalent to rebase)
-            pr.update_branch()
+            await self._call(pr.update_branch)
 
-            self.logger.info(f"PR #{pr_number} rebased successfully")
+            self.logger.info("PR #%d rebased successfully", pr_number)
             return True
 
         except GithubException as e:
-            self.logger.warning(f"Failed to rebase PR #{pr_number}: {e}")
+            self.logger.warning("Failed to rebase PR #%d: %s", pr_number, e)
             return False
 
     async def merge(self, pr_number: int) -> MergeResult:
@@ -147,8 +253,11 @@ class MergeExecutor:
         Returns:
             MergeResult with success/failure info
         """
+        # One PR fetch shared by the checks below; dropped after a rebase
+        pulls: Dict[int, GHPullRequest] = {}
+
         try:
-            pr = self.repo.get_pull(pr_number)
+            pr = await self._get_pull(pr_number, pulls)
 
             # Check if already merged
             if pr.merged:
@@ -161,12 +270,14 @@ class MergeExecutor:
                 )
 
             # Check mergeable
-            is_mergeable, reason = await self.check_mergeable(pr_number)
+            is_mergeable, reason = await self.check_mergeable(pr_number, pulls)
             if not is_mergeable:
                 # Try auto-rebase if enabled
                 if self.config.auto_rebase_on_conflict and "behind" in reason.lower():
                     if await self.attempt_rebase(pr_number):
-                        is_mergeable, reason = await self.check_mergeable(pr_number)
+                        # The head moved; refetch for the remaining checks
+                        pulls.clear()
+                        is_mergeable, reason = await self.check_mergeable(pr_number, pulls)
 
                 if not is_mergeable:
                     return MergeResult(
@@ -176,7 +287,7 @@ class MergeExecutor:
                     )
 
             # Check CI status
-            ci_passed, ci_status = await self.check_ci_status(pr_number)
+            ci_passed, ci_status = await self.check_ci_status(pr_number, pulls)
             if not ci_passed:
                 return MergeResult(
                     pr_number=pr_number,
@@ -184,8 +295,11 @@ class MergeExecutor:
                     error=ci_status
                 )
 
+            pr = pulls[pr_number]
+
             # Perform merge
-            merge_commit = pr.merge(
+            merge_commit = await self._call(
+                pr.merge,
                 merge_method=self.config.merge_method,
                 commit_message=f"Merge PR #{pr_number}: {pr.title}"
             )
@@ -193,9 +307,9 @@ class MergeExecutor:
             # Delete branch if configured
             if self.config.delete_branch_after_merge:
                 try:
-                    ref = self.repo.get_git_ref(f"heads/{pr.head.ref}")
-                    ref.delete()
-                    self.logger.info(f"Deleted branch {pr.head.ref}")
+                    ref = await self._call(self.repo.get_git_ref, f"heads/{pr.head.ref}")
+                    await self._call(ref.delete)
+                    self.logger.info("Deleted branch %s", pr.head.ref)
                 except GithubException:
                     pass  # Branch might already be deleted or protected
 
@@ -217,36 +331,69 @@ class MergeExecutor:
     async def execute_merge_plan(
         self,
         pr_order: List[int],
-        stop_on_failure: bool = True
+        stop_on_failure: bool = True,
+        parallel_groups: Optional[List[List[int]]] = None
     ) -> List[MergeResult]:
         """
         Execute a merge plan (ordered list of PRs).
 
+        PRs within a parallel group are independent and merge concurrently,
+        up to config.max_parallel_merges at a time. A group starts only
+        once the previous one has finished.
+
         Args:
             pr_order: Ordered list of PR numbers to merge
             stop_on_failure: Stop if any merge fails
+            parallel_groups: Optional groups of independent PRs, in merge
+                order; PRs not in pr_order are skipped. Defaults to one
+                PR per group (strictly sequential).
 
         Returns:
             List of MergeResult for each PR
         """
-        results = []
+        if parallel_groups is None:
+            groups = [[pr_number] for pr_number in pr_order]
+        else:
+            planned = set(pr_order)
+            groups = [[n for n in group if n in planned] for group in parallel_groups]
+            groups = [group for group in groups if group]
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_parallel_merges))
+        stopped = False
+
+        async def merge_one(pr_number: int) -> Optional[MergeResult]:
+            nonlocal stopped
+            async with semaphore:
+                if stopped:
+                    return None
+
+                self.logger.info("Merging PR #%d...", pr_number)
+                result = await self.merge(pr_number)
+
+                if result.success:
+                    self.logger.info("PR #%d merged successfully", pr_number)
+                else:
+                    self.logger.error("PR #%d merge failed: %s", pr_number, result.error)
+                    if stop_on_failure and not stopped:
+                        self.logger.warning("Stopping merge plan due to failure")
+                        stopped = True
+                return result
 
-        for pr_number in pr_order:
-            self.logger.info(f"Merging PR #{pr_number}...")
+        results = []
 
-            result = await self.merge(pr_number)
-            results.append(result)
+        for index, group in enumerate(groups):
+            group_results = [
+                r for r in await asyncio.gather(*(merge_one(n) for n in group))
+                if r is not None
+            ]
+            results.extend(group_results)
 
-            if result.success:
-                self.logger.info(f"PR #{pr_number} merged successfully")
-            else:
-                self.logger.error(f"PR #{pr_number} merge failed: {result.error}")
-                if stop_on_failure:
-                    self.logger.warning("Stopping merge plan due to failure")
-                    break
+            if stopped:
+                break
 
-            # Small delay between merges to let GitHub process
-            await asyncio.sleep(2)
+            # Let GitHub process new merges into the base before the next group
+            if index < len(groups) - 1 and any(r.success for r in group_results):
+                await asyncio.sleep(MERGE_SETTLE_DELAY)
 
         return results
 
@@ -262,19 +409,29 @@ class MergeExecutor:
         Returns:
             List of status dicts for each PR
         """
-        statuses = []
-
-        for pr_number in pr_order:
-            is_mergeable, merge_reason = await self.check_mergeable(pr_number)
-            ci_passed, ci_status = await self.check_ci_status(pr_number)
+        # Checks are independent network I/O; run them all concurrently.
+        # Individual API calls are bounded by _gh_sem, so a PR waiting on
+        # mergeability does not hold up the others.
+        async def check(pr_number: int) -> dict:
+            # Fetch the PR once up front so both checks share it
+            pulls: Dict[int, GHPullRequest] = {}
+            try:
+                await self._get_pull(pr_number, pulls)
+            except GithubException:
+                pass  # Each check reports the error itself
+
+            (is_mergeable, merge_reason), (ci_passed, ci_status) = await asyncio.gather(
+                self.check_mergeable(pr_number, pulls),
+                self.check_ci_status(pr_number, pulls),
+            )
 
-            statuses.append({
+            return {
                 "pr_number": pr_number,
                 "mergeable": is_mergeable,
                 "merge_reason": merge_reason,
                 "ci_passed": ci_passed,
                 "ci_status": ci_status,
                 "ready": is_mergeable and ci_passed
-            })
+            }
 
-        return statuses
+        return list(await asyncio.gather(*(check(pr_number) for pr_number in pr_order)))
@@ -1,8 +1,11 @@
 """Main PR Orchestrator for Multi-PR management."""
 
 import asyncio
+import contextlib
 import os
-from typing import List, Dict, Optional, Set
+import sys
+from collections import defaultdict
+from typing import AsyncIterator, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
 from github import Github, GithubException
@@ -16,11 +19,24 @@ from ..models import (
     OrchestrationPlan,
 )
 from ..config import ReviewConfig
-from ..tools import GitHubTool
+from ..tools import GitHubTool, list_open_prs, list_pr_files
 from ..utils import get_logger
 from .dependency import DependencyAnalyzer
 from .conflict import ConflictPredictor
 from .merge import MergeExecutor
+from .index import PRIndex
+
+# main imports this package, so run_review is imported on first use and then reused
+_run_review = None
+
+
+def _get_run_review():
+    """Return main.run_review, importing it on the first call."""
+    global _run_review
+    if _run_review is None:
+        from ..main import run_review
+        _run_review = run_review
+    return _run_review
 
 
 class PROrchestrator:
@@ -69,11 +85,23 @@ class PROrchestrator:
         # PR queue
         self._queue: Dict[int, PRNode] = {}
         self._merged: Set[int] = set()
+        self._blocked_cache: Optional[Set[int]] = None  # PRs with unmerged dependencies
+        self._status_view: Optional[Dict[int, dict]] = None  # Built lazily by get_queue_status
+
+        # Review worker pool, running while a plan or group is being reviewed
+        self._review_queue: Optional[asyncio.Queue] = None
+        self._review_workers: List[asyncio.Task] = []
+
+        # Changed files per (PR number, head SHA); a PR's files only change when its head moves
+        self._files_memo: Dict[Tuple[int, str], Tuple[str, ...]] = {}
 
     async def load_open_prs(self, base: str = "main") -> List[PRNode]:
         """
         Load all open PRs targeting a base branch.
 
+        PRs and their changed files come from paged GraphQL queries, about
+        one request per 100 PRs instead of one REST call per PR.
+
         Args:
             base: Base branch to filter PRs
 
@@ -82,22 +110,101 @@ class PROrchestrator:
         """
         self._queue.clear()
 
-        prs = self.repo.get_pulls(state="open", base=base)
+        async for node in self.iter_open_prs(base):
+            self._queue[node.pr_number] = node
 
-        for pr in prs:
-            node = PRNode(
-                pr_number=pr.number,
-                branch=pr.head.ref,
-                base=pr.base.ref,
-                changed_files=[f.filename for f in pr.get_files()],
-                created_at=pr.created_at,
-                updated_at=pr.updated_at,
-            )
-            self._queue[pr.number] = node
+        self._status_view = None
 
-        self.logger.info(f"Loaded {len(self._queue)} open PRs targeting {base}")
+        self.logger.info("Loaded %d open PRs targeting %s", len(self._queue), base)
         return list(self._queue.values())
 
+    async def iter_open_prs(self, base: str = "main") -> AsyncIterator[PRNode]:
+        """
+        Stream open PRs targeting a base branch, one page at a time.
+
+        The next page is fetched while the current page's PRs are being
+        completed and consumed, so consumers can start on the first PRs
+        after a single round trip. Does not touch the queue.
+
+        Args:
+            base: Base branch to filter PRs
+
+        Yields:
+            PRNode objects with their full changed file lists
+        """
+        # PyGithub calls block; run them off the event loop
+        page_task = asyncio.create_task(asyncio.to_thread(self._fetch_pr_page, base, None))
+        semaphore = asyncio.Semaphore(self.config.max_parallel_reviews)
+        files_memo: Dict[Tuple[int, str], Tuple[str, ...]] = {}
+
+        async def fetch_rest(data: dict):
+            async with semaphore:
+                data["changed_files"].extend(await asyncio.to_thread(
+                    self._fetch_more_files, data["number"], data["files_cursor"]
+                ))
+
+        try:
+            while page_task is not None:
+                pr_data, next_cursor = await page_task
+                page_task = None
+                if next_cursor is not None:
+                    # Prefetch the next page while this one is completed
+                    page_task = asyncio.create_task(
+                        asyncio.to_thread(self._fetch_pr_page, base, next_cursor)
+                    )
+
+                # Remaining file pages of large PRs are independent; fetch them concurrently
+                overflow = [data for data in pr_data if data["files_cursor"]]
+                if overflow:
+                    await asyncio.gather(*(fetch_rest(data) for data in overflow))
+
+                for data in pr_data:
+                    files_memo[(data["number"], data["headRefOid"])] = tuple(data["changed_files"])
+                    yield PRNode(
+                        pr_number=data["number"],
+                        branch=sys.intern(data["headRefName"]),
+                        base=sys.intern(data["baseRefName"]),
+                        changed_files=data["changed_files"],
+                        created_at=datetime.fromisoformat(data["createdAt"]),
+                        updated_at=datetime.fromisoformat(data["updatedAt"]),
+                    )
+        finally:
+            if page_task is not None:
+                page_task.cancel()
+
+        # Only a complete listing replaces the memo of known file lists
+        self._files_memo = files_memo
+
+    def _fetch_pr_page(self, base: str, cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+        """
+        Fetch one page of open PRs, reusing file lists of PRs whose head is unchanged.
+
+        Args:
+            base: Base branch to filter PRs
+            cursor: Page cursor, None for the first page
+
+        Returns:
+            Tuple of (PR dicts from list_open_prs, next page cursor or None),
+            with "changed_files" interned
+        """
+        pr_data, next_cursor = list_open_prs(self.repo, base, cursor)
+
+        for pr in pr_data:
+            known = self._files_memo.get((pr["number"], pr["headRefOid"]))
+            if known is not None:
+                # Head unchanged since the last load: skip any further file pages
+                pr["changed_files"] = list(known)
+                pr["files_cursor"] = None
+            else:
+                # Interned: the same paths recur across PRs and key the conflict index
+                pr["changed_files"] = [sys.intern(path) for path in pr["changed_files"]]
+
+        return pr_data, next_cursor
+
+    def _fetch_more_files(self, pr_number: int, cursor: str) -> List[str]:
+        """Fetch the changed file paths of a PR after a files page cursor."""
+        return [sys.intern(path) for path in list_pr_files(self.repo, pr_number, cursor)]
+
     async def analyze(self) -> OrchestrationPlan:
         """
         Analyze loaded PRs and create orchestration plan.
@@ -114,25 +221,32 @@ class PROrchestrator:
 
         prs = list(self._queue.values())
 
+        # One pass over the PRs shared by dependency and conflict analysis
+        index = PRIndex.build(prs)
+        self._blocked_cache = None  # The dependency graph is rebuilt below
+
         # Get dependency-based order
         try:
-            dep_order = self.dependency_analyzer.topological_sort(prs)
+            dep_order = self.dependency_analyzer.topological_sort(prs, index)
         except ValueError as e:
-            self.logger.error(f"Dependency analysis failed: {e}")
+            self.logger.error("Dependency analysis failed: %s", e)
             # Fall back to creation time order
             dep_order = sorted(
                 [pr.pr_number for pr in prs],
                 key=lambda n: self._queue[n].created_at
             )
 
-        # Find conflict pairs
-        self.conflict_predictor.analyze(prs)
-        conflict_pairs = self.conflict_predictor.get_all_conflict_pairs(prs)
+        # Find conflict pairs (one pass over the index's file -> PRs table)
+        conflict_pairs = self.conflict_predictor.get_all_conflict_pairs(prs, index)
 
         # Update PR nodes with conflict info
+        conflicts: Dict[int, Set[int]] = defaultdict(set)
         for pr_a, pr_b, files in conflict_pairs:
-            self._queue[pr_a].conflicts_with.append(pr_b)
-            self._queue[pr_b].conflicts_with.append(pr_a)
+            conflicts[pr_a].add(pr_b)
+            conflicts[pr_b].add(pr_a)
+        for pr in prs:
+            pr.conflicts_with = frozenset(conflicts.get(pr.pr_number, ()))
+        self._status_view = None
 
         # Get conflict-aware order
         final_order = self.conflict_predictor.get_conflict_free_order(prs, dep_order)
@@ -147,9 +261,8 @@ class PROrchestrator:
         )
 
         self.logger.info(
-            f"Analysis complete: {plan.total_prs} PRs, "
-            f"{len(parallel_groups)} parallel groups, "
-            f"{len(conflict_pairs)} potential conflicts"
+            "Analysis complete: %d PRs, %d parallel groups, %d potential conflicts",
+            plan.total_prs, len(parallel_groups), len(conflict_pairs)
         )
 
         return plan
@@ -165,13 +278,11 @@ class PROrchestrator:
         Returns:
             Review statistics
         """
-        from ..main import run_review
-
         if pr_number not in self._queue:
             raise ValueError(f"PR #{pr_number} not in queue")
 
         node = self._queue[pr_number]
-        node.status = PRStatus.REVIEWING
+        self._set_status(node, PRStatus.REVIEWING)
 
         review_config = config or ReviewConfig(
             repo=self.repo_name,
@@ -180,24 +291,32 @@ class PROrchestrator:
         )
 
         try:
-            stats = await run_review(review_config)
+            stats = await _get_run_review()(review_config)
             node.review_result = stats
 
             # Determine status based on review
             if stats.get("status") == "completed":
                 # Check for blocking issues
                 # (In real impl, would check issue severities)
-                node.status = PRStatus.REVIEW_PASSED
+                self._set_status(node, PRStatus.REVIEW_PASSED)
             else:
-                node.status = PRStatus.REVIEW_FAILED
+                self._set_status(node, PRStatus.REVIEW_FAILED)
 
             return stats
 
         except Exception as e:
-            self.logger.exception(f"Review failed for PR #{pr_number}")
-            node.status = PRStatus.REVIEW_FAILED
+            self.logger.exception("Review failed for PR #%d", pr_number)
+            self._set_status(node, PRStatus.REVIEW_FAILED)
             return {"status": "error", "error": str(e)}
 
+    def _set_status(self, node: PRNode, status: PRStatus) -> None:
+        """Record a PR status transition (all status changes go through here)."""
+        node.status = status
+        self._status_view = None
+        if status is PRStatus.MERGED:
+            self._merged.add(node.pr_number)
+            self._blocked_cache = None
+
     async def review_parallel_group(
         self,
         pr_numbers: List[int],
@@ -206,6 +325,9 @@ class PROrchestrator:
         """
         Review multiple PRs in parallel.
 
+        Reviews run on the orchestrator's worker pool, which is started
+        here if no pool is running yet.
+
         Args:
             pr_numbers: List of PR numbers to review
             config: Base review configuration
@@ -213,22 +335,162 @@ class PROrchestrator:
         Returns:
             Dict mapping PR number to review stats
         """
-        # Limit parallelism
-        semaphore = asyncio.Semaphore(self.config.max_parallel_reviews)
+        async with self._review_pool():
+            return await self._collect_reviews(self._submit_reviews(pr_numbers, config))
 
-        async def limited_review(pr_num: int) -> tuple[int, dict]:
-            async with semaphore:
-                stats = await self.review_pr(pr_num, config)
-                return pr_num, stats
+    @contextlib.asynccontextmanager
+    async def _review_pool(self):
+        """
+        Run max_parallel_reviews long-lived review workers for the block.
 
-        tasks = [limited_review(pr) for pr in pr_numbers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Nested uses share the outer pool, so reviews submitted from
+        different groups overlap instead of waiting on each other.
+        """
+        if self._review_workers:
+            yield
+            return
+
+        self._review_queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._review_worker())
+            for _ in range(max(1, self.config.max_parallel_reviews))
+        ]
+        self._review_workers = workers
+        try:
+            yield
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._review_workers = []
+            self._review_queue = None
+
+    async def _review_worker(self):
+        """Review queued PRs one at a time, resolving each PR's future with its stats."""
+        while True:
+            pr_num, config, future = await self._review_queue.get()
+            try:
+                # Failures become error stats, so futures only ever carry dicts
+                try:
+                    stats = await self.review_pr(pr_num, config)
+                except Exception as e:
+                    self.logger.exception("Review failed for PR #%d", pr_num)
+                    stats = {"status": "error", "error": repr(e)}
+                if not future.done():
+                    future.set_result(stats)
+            finally:
+                self._review_queue.task_done()
+
+    def _submit_reviews(
+        self,
+        pr_numbers: List[int],
+        config: Optional[ReviewConfig] = None
+    ) -> Dict[int, asyncio.Future]:
+        """Queue PRs for review on the running pool; returns a future per PR."""
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for pr_num in pr_numbers:
+            futures[pr_num] = loop.create_future()
+            self._review_queue.put_nowait((pr_num, config, futures[pr_num]))
+        return futures
+
+    async def _collect_reviews(self, futures: Dict[int, asyncio.Future]) -> Dict[int, dict]:
+        """Wait for submitted reviews and map each PR to its stats."""
+        results = await asyncio.gather(*futures.values())
+        return dict(zip(futures, results))
+
+    async def _review_in_dependency_order(
+        self,
+        plan: OrchestrationPlan,
+        config: Optional[ReviewConfig] = None
+    ) -> Dict[int, dict]:
+        """
+        Review every PR of a plan, starting each once its dependencies are reviewed.
 
-        return {
-            pr_num: stats if not isinstance(stats, Exception) else {"error": str(stats)}
-            for pr_num, stats in results
+        Unlike group-by-group execution there is no barrier between parallel
+        groups: a PR waits only for the PRs it actually depends on.
+
+        Args:
+            plan: The plan whose PRs to review
+            config: Base review configuration
+
+        Returns:
+            Dict mapping PR number to review stats
+        """
+        plan_prs = [pr_num for group in plan.parallel_groups for pr_num in group]
+        in_plan = set(plan_prs)
+        waiting_on = {
+            pr_num: len(self.dependency_analyzer.get_dependencies(pr_num) & in_plan)
+            for pr_num in plan_prs
         }
 
+        results: Dict[int, dict] = {}
+        pr_of: Dict[asyncio.Future, int] = {}
+
+        def submit(pr_numbers: List[int]):
+            for pr_num in pr_numbers:
+                del waiting_on[pr_num]
+            for pr_num, future in self._submit_reviews(pr_numbers, config).items():
+                pr_of[future] = pr_num
+
+        async with self._review_pool():
+            self.logger.info("Reviewing %d PRs in dependency order", len(plan_prs))
+            submit([pr_num for pr_num in plan_prs if waiting_on[pr_num] == 0])
+
+            while pr_of:
+                done, _ = await asyncio.wait(pr_of, return_when=asyncio.FIRST_COMPLETED)
+                ready = []
+                for future in done:
+                    pr_num = pr_of.pop(future)
+                    results[pr_num] = future.result()
+                    for dependent in self.dependency_analyzer.get_dependents(pr_num):
+                        if dependent in waiting_on:
+                            waiting_on[dependent] -= 1
+                            if waiting_on[dependent] == 0:
+                                ready.append(dependent)
+
+                if not pr_of and not ready and waiting_on:
+                    # Unresolvable (circular) dependencies: review the rest anyway
+                    ready = list(waiting_on)
+                submit(sorted(ready))
+
+        return results
+
+    @staticmethod
+    def _merge_batches(plan: OrchestrationPlan) -> List[List[int]]:
+        """
+        Split the plan's parallel groups into batches that can merge concurrently.
+
+        Parallel groups only account for dependencies. PRs predicted to
+        conflict must merge one after another, so that the later one is
+        re-checked (and rebased if needed) against the updated base.
+
+        Args:
+            plan: Analyzed orchestration plan
+
+        Returns:
+            Batches in merge order, each ordered by plan.pr_order
+        """
+        position = {pr_num: i for i, pr_num in enumerate(plan.pr_order)}
+        conflicts: Dict[int, Set[int]] = defaultdict(set)
+        for pr_a, pr_b in plan.conflict_pairs:
+            conflicts[pr_a].add(pr_b)
+            conflicts[pr_b].add(pr_a)
+
+        batches: List[List[int]] = []
+        for group in plan.parallel_groups:
+            group_batches: List[List[int]] = []
+            for pr_num in sorted(group, key=lambda n: position.get(n, len(position))):
+                # First batch of this group without a conflicting PR
+                for batch in group_batches:
+                    if conflicts[pr_num].isdisjoint(batch):
+                        batch.append(pr_num)
+                        break
+                else:
+                    group_batches.append([pr_num])
+            batches.extend(group_batches)
+        return batches
+
     async def execute_plan(
         self,
         plan: OrchestrationPlan,
@@ -258,14 +520,13 @@ class PROrchestrator:
             }
         }
 
-        # Review PRs by parallel groups
-        for group in plan.parallel_groups:
-            self.logger.info(f"Reviewing parallel group: {group}")
-
-            group_results = await self.review_parallel_group(group, review_config)
-            results["reviews"].update(group_results)
+        # Review PRs as soon as their dependencies are reviewed
+        review_results = await self._review_in_dependency_order(plan, review_config)
 
-            for pr_num, stats in group_results.items():
+        for group in plan.parallel_groups:
+            for pr_num in group:
+                stats = review_results[pr_num]
+                results["reviews"][pr_num] = stats
                 results["summary"]["reviewed"] += 1
                 if stats.get("status") == "completed":
                     results["summary"]["passed"] += 1
@@ -280,8 +541,16 @@ class PROrchestrator:
             ]
 
             if ready_prs:
-                self.logger.info(f"Merging {len(ready_prs)} PRs: {ready_prs}")
-                merge_results = await self.merge_executor.execute_merge_plan(ready_prs)
+                self.logger.info("Merging %d PRs: %s", len(ready_prs), ready_prs)
+                merge_results = await self.merge_executor.execute_merge_plan(
+                    ready_prs,
+                    parallel_groups=self._merge_batches(plan)
+                )
+                for r in merge_results:
+                    self._set_status(
+                        self._queue[r.pr_number],
+                        PRStatus.MERGED if r.success else PRStatus.FAILED
+                    )
                 results["merges"] = [
                     {
                         "pr_number": r.pr_number,
@@ -305,10 +574,24 @@ class PROrchestrator:
             Dry run results
         """
         if plan is None:
-            await self.load_open_prs()
-            plan = await self.analyze()
+            prs = await self.load_open_prs()
 
-        merge_statuses = await self.merge_executor.dry_run(plan.pr_order)
+            # Readiness checks only need the PR numbers, so their API calls
+            # run while the plan is computed
+            merge_task = asyncio.create_task(
+                self.merge_executor.dry_run([pr.pr_number for pr in prs])
+            )
+            await asyncio.sleep(0)  # Let the checks issue their first requests
+            try:
+                plan = await self.analyze()
+            except BaseException:
+                merge_task.cancel()
+                raise
+
+            by_pr = {status["pr_number"]: status for status in await merge_task}
+            merge_statuses = [by_pr[pr_number] for pr_number in plan.pr_order]
+        else:
+            merge_statuses = await self.merge_executor.dry_run(plan.pr_order)
 
         return {
             "plan": {
@@ -321,17 +604,25 @@ class PROrchestrator:
         }
 
     def get_queue_status(self) -> Dict[int, dict]:
-        """Get current status of all PRs in queue."""
-        return {
-            pr_num: {
-                "branch": node.branch,
-                "status": node.status.value,
-                "conflicts_with": node.conflicts_with,
-                "depends_on": node.depends_on,
-                "review_result": node.review_result,
+        """
+        Get current status of all PRs in queue.
+
+        The view is rebuilt only after the queue or a status changes, so
+        frequent polling is cheap. The returned dict is shared between
+        calls; callers must not mutate it.
+        """
+        if self._status_view is None:
+            self._status_view = {
+                pr_num: {
+                    "branch": node.branch,
+                    "status": node.status.value,
+                    "conflicts_with": sorted(node.conflicts_with),
+                    "depends_on": sorted(node.depends_on),
+                    "review_result": node.review_result,
+                }
+                for pr_num, node in self._queue.items()
             }
-            for pr_num, node in self._queue.items()
-        }
+        return self._status_view
 
     def get_pr(self, pr_number: int) -> Optional[PRNode]:
         """Get a specific PR from the queue."""
@@ -339,4 +630,7 @@ class PROrchestrator:
 
     def is_pr_blocked(self, pr_number: int) -> bool:
         """Check if a PR is blocked by dependencies."""
-        return self.dependency_analyzer.is_blocked(pr_number, self._merged)
+        # Recomputed only after a merge or re-analysis
+        if self._blocked_cache is None:
+            self._blocked_cache = self.dependency_analyzer.compute_blocked(self._merged)
+        return pr_number in self._blocked_cache
@@ -1,7 +1,9 @@
 """Pipeline stages for PR review."""
 
-from .stage1_identify import identify_issues, identify_issues_sync
+from .stage1_identify import identify_issues, identify_issues_stream, identify_issues_sync
 from .stage2_validate import validate_issues, validate_issues_sync
+from .fused_review import identify_and_validate, identify_and_validate_sync
+from .review_core import review_core, ReviewCoreResult, would_report, filter_reportable_issues
 from .stage3_test_gen import generate_tests, generate_tests_sync
 from .stage4_coverage import CoverageGate, run_coverage_gate, run_coverage_gate_sync
 from .feedback_loop import (
@@ -14,9 +16,16 @@ from .feedback_loop import (
 
 __all__ = [
     "identify_issues",
+    "identify_issues_stream",
     "identify_issues_sync",
     "validate_issues",
     "validate_issues_sync",
+    "identify_and_validate",
+    "identify_and_validate_sync",
+    "review_core",
+    "ReviewCoreResult",
+    "would_report",
+    "filter_reportable_issues",
     "generate_tests",
     "generate_tests_sync",
     "CoverageGate",
@@ -14,8 +14,10 @@ This is the CORE of the system. Without this loop, everything else is useless.
 import asyncio
 import hashlib
 import os
+import re
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Tuple, Set, Dict, Any
+from typing import List, Optional, Tuple, Set, Dict, Any, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -30,12 +32,14 @@ from claude_agent_sdk import (
     ToolUseBlock,
     ToolResultBlock,
     ResultMessage,
+    UserMessage,
 )
 
-from ..models import ValidatedIssue, PotentialIssue
+from ..models import ValidatedIssue, PotentialIssue, SEVERITY_RANK
 from ..config import ReviewConfig, MergeRules
-from ..tools import GitHubTool, StorageTool
-from .stage1_identify import identify_issues
+from ..tools import GitHubTool, StorageTool, iter_file_hunks
+from ..tools.diff_parser import FileDiff
+from .stage1_identify import identify_issues_stream
 from .stage2_validate import validate_issues
 
 
@@ -62,6 +66,8 @@ class LoopConfig:
     test_command: str = "pytest"         # Command to run tests
     require_tests_pass: bool = False     # Require tests to pass before merge
     working_dir: Optional[str] = None    # Working directory for git operations
+    max_parallel_fixes: int = 4          # Concurrent fix sessions (one per file at a time)
+    local_diff: bool = False             # Diff the checkout with git (histogram, whitespace-stable)
 
 
 @dataclass
@@ -97,17 +103,25 @@ def _issue_hash(issue: ValidatedIssue) -> str:
     # Normalize description by removing line number references
     desc = issue.issue.description[:100].lower()
     key = f"{issue.issue.file_path}:{issue.issue.issue_type}:{desc}"
-    return hashlib.sha256(key.encode()).hexdigest()[:16]
+    # An in-memory dedup key, not a security boundary: 64-bit blake2b
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+# Old and new file paths in unified diff headers ("--- /dev/null" never matches)
+_DIFF_FILE_RE = re.compile(r"^(?:\+\+\+ b/|--- a/)(.+)$", re.MULTILINE)
 
 
 def _get_changed_files_from_diff(diff_text: str) -> Set[str]:
     """Extract list of changed files from diff text."""
-    files = set()
-    for line in diff_text.split('\n'):
-        if line.startswith('+++ b/') or line.startswith('--- a/'):
-            files.add(line[6:])
-    files.discard('/dev/null')
-    return files
+    return set(_DIFF_FILE_RE.findall(diff_text))
+
+
+def _diff_sections(file_diffs: List[FileDiff]) -> Dict[str, Tuple[str, str]]:
+    """Map each changed file to (digest, formatted hunks) of its diff section."""
+    return {
+        file_diff.new_path: (hashlib.blake2b(chunk.encode(), digest_size=16).hexdigest(), chunk)
+        for file_diff, chunk in zip(file_diffs, iter_file_hunks(file_diffs))
+    }
 
 
 FIX_PROMPT = """You are a senior developer fixing a code issue.
@@ -157,6 +171,17 @@ async def run_feedback_loop(
     unfixable_issues: Set[str] = set()
     fixed_in_iteration: Dict[int, Set[str]] = {}
 
+    # Unknown min_severity_to_fix values fix everything
+    min_rank = SEVERITY_RANK.get(config.min_severity_to_fix, 0)
+
+    # Per-file diff digests and valid issues of the last analyzed iteration
+    file_digests: Dict[str, str] = {}
+    valid_by_file: Dict[str, List[ValidatedIssue]] = {}
+
+    # Formatted per-file sections of the last diff and that diff's digest
+    sections: Dict[str, Tuple[str, str]] = {}
+    sections_digest: Optional[bytes] = None
+
     print(f"\n{'='*60}")
     print(f"FEEDBACK LOOP: {repo} PR #{pr_number}")
     print(f"{'='*60}")
@@ -174,6 +199,15 @@ async def run_feedback_loop(
     print(f"PR branch: {pr_branch}")
     await _checkout_branch(pr_branch, working_dir)
 
+    # Local diffs compare against the base branch as fetched from origin
+    diff_base = None
+    if config.local_diff:
+        base_branch = github.pr.base.ref
+        if await _fetch_branch(base_branch, working_dir):
+            diff_base = f"origin/{base_branch}"
+        else:
+            print(f"  WARN: Could not fetch {base_branch}, using the GitHub diff")
+
     for iteration in range(1, config.max_iterations + 1):
         start_time = datetime.now()
         print(f"\n{'-'*60}")
@@ -191,8 +225,18 @@ async def run_feedback_loop(
         try:
             # Step 1: Fetch latest and get diff
             print("[1/5] Fetching PR diff...")
-            await _pull_latest(working_dir)
-            diff_text = github.get_diff()
+            if diff_base:
+                # The local diff reads the checkout, so it has to follow the pull
+                await _pull_latest(working_dir)
+                diff_text = await _local_diff(diff_base, working_dir)
+                if diff_text is None:
+                    diff_text = await asyncio.to_thread(_fetch_pr_diff, github)
+            else:
+                # The GitHub diff doesn't depend on the local pull: run both at once
+                _, diff_text = await asyncio.gather(
+                    _pull_latest(working_dir),
+                    asyncio.to_thread(_fetch_pr_diff, github),
+                )
 
             if not diff_text.strip():
                 print("  OK: No changes in PR")
@@ -207,40 +251,59 @@ async def run_feedback_loop(
             if len(changed_files) > 5:
                 print(f"    ... and {len(changed_files) - 5} more")
 
-            # Step 2: Identify issues
+            # Step 2: Identify issues (only in files whose diff changed)
             print("\n[2/5] Identifying issues...")
-            from ..tools import parse_pr_diff, format_hunks
-            file_diffs = parse_pr_diff(diff_text)
-            hunks_text = format_hunks(file_diffs)
-
-            potential_issues = await identify_issues(hunks_text)
+            # Parsing and formatting are pure functions of the diff: reuse the
+            # previous iteration's sections when the diff is byte-identical
+            diff_digest = hashlib.blake2b(diff_text.encode(), digest_size=16).digest()
+            if diff_digest != sections_digest:
+                from ..tools import parse_pr_diff
+                sections = _diff_sections(parse_pr_diff(diff_text))
+                sections_digest = diff_digest
+            stale_files = [
+                path for path, (digest, _) in sections.items()
+                if file_digests.get(path) != digest
+            ]
+            carried_issues = [
+                issue for path in sections if path not in stale_files
+                for issue in valid_by_file.get(path, ())
+            ]
+            if len(stale_files) < len(sections):
+                print(f"  Reusing results for {len(sections) - len(stale_files)} unchanged files")
 
-            # Filter by severity and changed files
-            severity_order = ["low", "medium", "high", "critical"]
-            try:
-                min_idx = severity_order.index(config.min_severity_to_fix)
-            except ValueError:
-                min_idx = 0
+            # Files are packed into size-bounded batches identified concurrently
+            potential_issues = await identify_issues_stream(
+                sections[path][1] for path in stale_files
+            )
 
+            # Filter by severity and changed files (unknown severities are dropped)
             potential_issues = [
                 i for i in potential_issues
-                if (i.severity.lower() in severity_order and
-                    severity_order.index(i.severity.lower()) >= min_idx and
-                    i.file_path in changed_files)
+                if SEVERITY_RANK.get(i.severity, -1) >= min_rank and i.file_path in changed_files
             ]
 
-            if not potential_issues:
+            if not potential_issues and not carried_issues:
                 print("  OK: No issues found - PR is clean!")
                 status.result = LoopResult.READY_TO_MERGE
                 statuses.append(status)
                 break
 
             print(f"  Found {len(potential_issues)} potential issues")
+            if carried_issues:
+                print(f"  Carried forward {len(carried_issues)} issues from unchanged files")
 
             # Step 3: Validate issues
             print("\n[3/5] Validating issues...")
-            validated_issues = await validate_issues(potential_issues, parallel=True)
-            valid_issues = [i for i in validated_issues if i.is_valid]
+            validated_issues = []
+            if potential_issues:
+                validated_issues = await validate_issues(potential_issues, parallel=True)
+            valid_issues = [i for i in validated_issues if i.is_valid] + carried_issues
+
+            # Remember this iteration's results for files that stay unchanged
+            file_digests = {path: digest for path, (digest, _) in sections.items()}
+            valid_by_file = {}
+            for issue in valid_issues:
+                valid_by_file.setdefault(issue.issue.file_path, []).append(issue)
 
             status.issues_found = len(valid_issues)
             print(f"  OK: {len(valid_issues)} valid issues confirmed")
@@ -287,7 +350,9 @@ async def run_feedback_loop(
                 break
 
             print(f"\n[4/5] Fixing {len(valid_issues)} issues...")
-            fix_results = await _fix_issues_batch(valid_issues, attempted_issues, working_dir)
+            fix_results = await _fix_issues_batch(
+                valid_issues, attempted_issues, working_dir, config.max_parallel_fixes
+            )
 
             # Count successes
             successful_fixes = [r for r in fix_results if r.success and r.changes_made]
@@ -379,15 +444,36 @@ async def _fix_issues_batch(
     issues: List[ValidatedIssue],
     attempted_issues: Set[str],
     working_dir: str,
+    max_parallel: int = 4,
 ) -> List[FixResult]:
-    """Fix multiple issues, tracking results."""
-    results = []
+    """
+    Fix multiple issues concurrently, tracking results.
+
+    Fix sessions for different files run in parallel (up to max_parallel);
+    issues in the same file are fixed one after another so two Edit
+    sessions never race on a file. Duplicate issues (same issue hash and
+    code snippet, e.g. fanned out by Stage 2 deduplication) get a single
+    fix session.
 
-    for i, issue in enumerate(issues, 1):
+    Returns:
+        One FixResult per distinct issue, in input order
+    """
+    distinct: Dict[Tuple[str, str], ValidatedIssue] = {}
+    for issue in issues:
+        distinct.setdefault((_issue_hash(issue), issue.issue.code_snippet), issue)
+    if len(distinct) < len(issues):
+        print(f"  Skipping {len(issues) - len(distinct)} duplicate issues")
+        issues = list(distinct.values())
+
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    file_locks: Dict[str, asyncio.Lock] = {
+        issue.issue.file_path: asyncio.Lock() for issue in issues
+    }
+
+    async def fix_one(i: int, issue: ValidatedIssue) -> FixResult:
         issue_id = _issue_hash(issue)
         attempted_issues.add(issue_id)
-
-        print(f"  [{i}/{len(issues)}] {issue.issue.file_path}:{issue.issue.line_start} ({issue.issue.issue_type})")
+        tag = f"[{i}/{len(issues)}]"
 
         result = FixResult(
             issue_hash=issue_id,
@@ -395,42 +481,59 @@ async def _fix_issues_batch(
             success=False
         )
 
-        try:
-            # Check file exists
-            file_path = Path(working_dir) / issue.issue.file_path
-            if not file_path.exists():
-                result.error = "File not found"
-                print(f"      FAIL: File not found")
-                results.append(result)
-                continue
-
-            # Get content before fix
-            before_content = file_path.read_text()
-
-            # Attempt fix
-            success = await _fix_single_issue(issue, working_dir)
-
-            # Check if file changed
-            after_content = file_path.read_text()
-            changes_made = before_content != after_content
-
-            result.success = success
-            result.changes_made = changes_made
-
-            if success and changes_made:
-                print(f"      OK: Fixed")
-            elif success and not changes_made:
-                print(f"      WARN: No changes made")
-            else:
-                print(f"      FAIL: Could not fix")
+        async with file_locks[issue.issue.file_path], semaphore:
+            print(f"  {tag} {issue.issue.file_path}:{issue.issue.line_start} ({issue.issue.issue_type})")
 
-        except Exception as e:
-            result.error = str(e)
-            print(f"      ERROR: {e}")
+            try:
+                # Check file exists
+                file_path = Path(working_dir) / issue.issue.file_path
+                if not file_path.exists():
+                    result.error = "File not found"
+                    print(f"      {tag} FAIL: File not found")
+                    return result
+
+                # Fingerprint the file before the fix (bytes, no decode)
+                before_stat = file_path.stat()
+                before_digest = _file_digest(file_path)
+
+                # Attempt fix
+                success = await _fix_single_issue(issue, working_dir)
+
+                # Check if file changed: an untouched file keeps its mtime
+                # and size; otherwise compare sizes, then digests
+                after_stat = file_path.stat()
+                if (after_stat.st_mtime_ns, after_stat.st_size) == (before_stat.st_mtime_ns, before_stat.st_size):
+                    changes_made = False
+                else:
+                    changes_made = (
+                        after_stat.st_size != before_stat.st_size
+                        or _file_digest(file_path) != before_digest
+                    )
+
+                result.success = success
+                result.changes_made = changes_made
+
+                if success and changes_made:
+                    print(f"      {tag} OK: Fixed")
+                elif success and not changes_made:
+                    print(f"      {tag} WARN: No changes made")
+                else:
+                    print(f"      {tag} FAIL: Could not fix")
+
+            except Exception as e:
+                result.error = str(e)
+                print(f"      {tag} ERROR: {e}")
+
+        return result
 
-        results.append(result)
+    return list(await asyncio.gather(
+        *(fix_one(i, issue) for i, issue in enumerate(issues, 1))
+    ))
 
-    return results
+
+def _file_digest(path: Path) -> bytes:
+    """Hash a file's bytes for change detection."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
 
 
 async def _fix_single_issue(issue: ValidatedIssue, working_dir: str) -> bool:
@@ -461,7 +564,7 @@ RULES:
     )
 
     try:
-        edit_count = 0
+        edit_ids: Set[str] = set()
 
         async with ClaudeSDKClient(options=options) as client:
             await client.query(prompt)
@@ -470,9 +573,19 @@ RULES:
                 if isinstance(message, AssistantMessage):
                     for block in message.content:
                         if isinstance(block, ToolUseBlock) and block.name == "Edit":
-                            edit_count += 1
+                            edit_ids.add(block.id)
+                elif isinstance(message, UserMessage) and isinstance(message.content, list):
+                    # The fix is in once an Edit succeeds; leaving the session
+                    # here skips the model's closing commentary
+                    if any(
+                        isinstance(block, ToolResultBlock)
+                        and block.tool_use_id in edit_ids
+                        and not block.is_error
+                        for block in message.content
+                    ):
+                        break
 
-        return edit_count > 0
+        return bool(edit_ids)
 
     except Exception as e:
         print(f"      Fix error: {e}")
@@ -481,24 +594,39 @@ RULES:
 
 async def _run_tests(test_command: str, working_dir: str) -> bool:
     """Run tests and return True if they pass."""
+    # Output is streamed; only the last lines are kept for the failure report
+    tail: Deque[bytes] = deque(maxlen=10)
+
+    async def read_output(stream: asyncio.StreamReader):
+        partial = b""
+        while chunk := await stream.read(1 << 16):
+            *lines, partial = (partial + chunk).split(b"\n")
+            tail.extend(line for line in lines if line.strip())
+        if partial.strip():
+            tail.append(partial)
+
     try:
         proc = await asyncio.create_subprocess_shell(
             test_command,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             cwd=working_dir
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(read_output(proc.stdout), proc.wait()), timeout=300
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            raise
 
         if proc.returncode == 0:
             return True
         else:
-            output = stdout.decode() + stderr.decode()
-            if output:
-                lines = output.strip().split('\n')
-                print(f"    Test output (last 10 lines):")
-                for line in lines[-10:]:
-                    print(f"      {line}")
+            if tail:
+                print(f"    Test output (last {len(tail)} lines):")
+                for line in tail:
+                    print(f"      {line.decode(errors='replace').rstrip()}")
             return False
 
     except asyncio.TimeoutError:
@@ -509,6 +637,12 @@ async def _run_tests(test_command: str, working_dir: str) -> bool:
         return False
 
 
+def _fetch_pr_diff(github: GitHubTool) -> str:
+    """Fetch the PR's current diff from GitHub (blocking)."""
+    github.refresh()  # Previous iteration may have pushed new commits
+    return github.get_diff()
+
+
 async def _get_pr_branch(github: GitHubTool) -> str:
     """Get the PR's head branch name."""
     try:
@@ -520,16 +654,10 @@ async def _get_pr_branch(github: GitHubTool) -> str:
 async def _checkout_branch(branch: str, working_dir: str) -> bool:
     """Checkout the specified branch."""
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "git", "checkout", branch,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        _, stderr = await proc.communicate()
-        if proc.returncode != 0:
-            print(f"  Checkout warning: {stderr.decode().strip()}")
-        return proc.returncode == 0
+        returncode, _, stderr = await _run_git(working_dir, "checkout", branch)
+        if returncode != 0:
+            print(f"  Checkout warning: {stderr.strip()}")
+        return returncode == 0
     except Exception as e:
         print(f"  Checkout error: {e}")
         return False
@@ -538,33 +666,61 @@ async def _checkout_branch(branch: str, working_dir: str) -> bool:
 async def _pull_latest(working_dir: str) -> bool:
     """Pull latest changes from remote."""
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "git", "pull", "--rebase",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        await proc.communicate()
-        return proc.returncode == 0
+        returncode, _, _ = await _run_git(working_dir, "pull", "--rebase")
+        return returncode == 0
     except Exception:
         return False
 
 
+async def _fetch_branch(branch: str, working_dir: str) -> bool:
+    """Fetch a branch from origin."""
+    try:
+        returncode, _, _ = await _run_git(working_dir, "fetch", "origin", branch)
+        return returncode == 0
+    except Exception:
+        return False
+
+
+async def _local_diff(base: str, working_dir: str) -> Optional[str]:
+    """
+    Diff HEAD against its merge base with base in the local checkout.
+
+    Uses the histogram algorithm with rename detection and ignores
+    end-of-line whitespace, which gives fewer and smaller hunks than the
+    patches GitHub serves. Returns None if git fails.
+    """
+    try:
+        returncode, stdout, _ = await _run_git(
+            working_dir, "diff", "--no-color", "--no-ext-diff",
+            "--diff-algorithm=histogram", "--ignore-space-at-eol", "-M",
+            f"{base}...HEAD",
+        )
+        return stdout if returncode == 0 else None
+    except Exception:
+        return None
+
+
 async def _revert_changes(working_dir: str) -> bool:
     """Revert all uncommitted changes."""
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "git", "checkout", "--", ".",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        await proc.communicate()
-        return proc.returncode == 0
+        returncode, _, _ = await _run_git(working_dir, "checkout", "--", ".")
+        return returncode == 0
     except Exception:
         return False
 
 
+async def _run_git(working_dir: str, *args: str) -> Tuple[int, str, str]:
+    """Run a git command. Returns (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=working_dir
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
 async def _commit_and_push(
     prefix: str,
     iteration: int,
@@ -573,77 +729,47 @@ async def _commit_and_push(
 ) -> Optional[str]:
     """Commit and push fixes. Returns commit SHA or None."""
     try:
-        # Check for changes
-        status_proc = await asyncio.create_subprocess_exec(
-            "git", "status", "--porcelain",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        stdout, _ = await status_proc.communicate()
-
-        if not stdout.decode().strip():
-            return None
+        msg = f"{prefix}Auto-fix issues (iteration {iteration})"
 
-        # Stage files
         if files:
-            add_proc = await asyncio.create_subprocess_exec(
-                "git", "add", "--", *files,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir
-            )
-            await add_proc.communicate()
+            # Stage only the fixed files; `add` also picks up files the
+            # fixer created, and git reports when nothing changed
+            await _run_git(working_dir, "add", "--", *files)
+            returncode, stdout, stderr = await _run_git(working_dir, "commit", "-m", msg, "--", *files)
         else:
-            add_proc = await asyncio.create_subprocess_exec(
-                "git", "add", "-A",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=working_dir
-            )
-            await add_proc.communicate()
+            # Check for changes
+            _, stdout, _ = await _run_git(working_dir, "status", "--porcelain")
 
-        # Commit
-        msg = f"{prefix}Auto-fix issues (iteration {iteration})"
-        commit_proc = await asyncio.create_subprocess_exec(
-            "git", "commit", "-m", msg,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        stdout, stderr = await commit_proc.communicate()
+            if not stdout.strip():
+                return None
+
+            await _run_git(working_dir, "add", "-A")
+            returncode, stdout, stderr = await _run_git(working_dir, "commit", "-m", msg)
 
-        if commit_proc.returncode != 0:
-            output = stdout.decode() + stderr.decode()
-            if "nothing to commit" in output:
+        if returncode != 0:
+            output = stdout + stderr
+            if any(m in output for m in ("nothing to commit", "nothing added to commit", "no changes added")):
                 return None
-            print(f"    Commit error: {stderr.decode()}")
+            print(f"    Commit error: {stderr}")
             return None
 
-        # Get commit SHA
-        sha_proc = await asyncio.create_subprocess_exec(
-            "git", "rev-parse", "HEAD",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
+        # Reading the commit SHA and the leftover status doesn't depend on
+        # the push: run them all at once
+        (_, sha_out, _), (push_code, _, push_err), (_, leftover, _) = await asyncio.gather(
+            _run_git(working_dir, "rev-parse", "HEAD"),
+            _run_git(working_dir, "push"),
+            _run_git(working_dir, "status", "--porcelain"),
         )
-        stdout, _ = await sha_proc.communicate()
-        commit_sha = stdout.decode().strip()
 
-        # Push
-        push_proc = await asyncio.create_subprocess_exec(
-            "git", "push",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=working_dir
-        )
-        _, stderr = await push_proc.communicate()
+        if leftover.strip():
+            stray = [line[3:] for line in leftover.splitlines() if line]
+            print(f"    Warning: left uncommitted changes outside the fixed files: {', '.join(stray)}")
 
-        if push_proc.returncode != 0:
-            print(f"    Push error: {stderr.decode()}")
+        if push_code != 0:
+            print(f"    Push error: {push_err}")
             return None
 
-        return commit_sha
+        return sha_out.strip()
 
     except Exception as e:
         print(f"    Git error: {e}")
@@ -0,0 +1,187 @@
+"""Fused Stage 1 + 2: Identify and validate issues in a single session for small PRs."""
+
+import asyncio
+from typing import List, Any
+
+from claude_agent_sdk import (
+    ClaudeSDKClient,
+    tool,
+    create_sdk_mcp_server,
+    AssistantMessage,
+    TextBlock,
+    ToolUseBlock,
+    ResultMessage,
+)
+
+from ..models import ValidatedIssue
+from ..tools import StorageTool
+from .stage1_identify import parse_issue
+from .stage2_validate import _validation_options
+
+
+FUSED_PROMPT = """
+You are an expert code reviewer. Analyze the following code changes (hunks), identify
+potential issues, and validate each one with evidence before reporting it.
+
+## Available Tools
+1. **serena** - Search the codebase for related code, usage patterns, and context
+2. **context7** - Look up library documentation if an issue involves external libraries
+
+## Categories to Look For
+1. **Bugs and Logic Errors** - Off-by-one errors, null pointer issues, incorrect conditions
+2. **Security Vulnerabilities** - XSS, SQL injection, command injection, path traversal
+3. **Performance Issues** - N+1 queries, unnecessary loops, memory leaks
+4. **Type Errors** - Type mismatches, incorrect type assertions
+5. **Unused Code** - Dead code, unused variables, unreachable code
+6. **Best Practice Violations** - Anti-patterns, code smells, maintainability issues
+
+## For Each Candidate Issue
+1. Search the codebase to check whether the issue is handled elsewhere
+2. Check library documentation if it involves an external API
+3. Decide whether it is a REAL issue or a FALSE POSITIVE
+
+Then call `store_validated_issue` with:
+- file_path, line_start, line_end: location of the issue
+- issue_type: one of [bug, security, performance, logic_error, type_error, unused_code, best_practice]
+- severity: one of [critical, high, medium, low]
+- description: clear explanation of what the issue is and why it matters
+- code_snippet: the problematic code
+- is_valid: true if real, false if a false positive
+- evidence: list of evidence strings supporting your verdict
+- library_reference: relevant documentation reference (empty string if none)
+- mitigation: how to fix it (empty string if not valid)
+- confidence: 0.0 to 1.0
+
+## Severity Guidelines
+- **critical**: Security vulnerabilities, data loss risks, crashes
+- **high**: Bugs that affect functionality, serious performance issues
+- **medium**: Code quality issues, minor bugs, maintainability concerns
+- **low**: Style issues, minor improvements, suggestions
+
+## Code Changes to Analyze
+{hunks}
+
+Now review the code. Call store_validated_issue once for each candidate issue.
+"""
+
+
+FUSED_SYSTEM_PROMPT = """You are a senior code reviewer. Find potential problems in the
+changes, then confirm or reject each one with evidence from the codebase and
+documentation before reporting it. Be thorough but objective."""
+
+
+def _make_store_validated_issue_tool(storage: StorageTool[dict]):
+    """Create a store_validated_issue tool bound to a per-call storage."""
+
+    @tool(
+        "store_validated_issue",
+        "Store an issue together with its validation verdict",
+        {
+            "file_path": str,
+            "line_start": int,
+            "line_end": int,
+            "issue_type": str,
+            "severity": str,
+            "description": str,
+            "code_snippet": str,
+            "is_valid": bool,
+            "evidence": list,  # List[str]
+            "library_reference": str,
+            "mitigation": str,
+            "confidence": float,
+        }
+    )
+    async def store_validated_issue(args: dict[str, Any]) -> dict[str, Any]:
+        """Store a validated issue."""
+        return storage.store(args)
+
+    return store_validated_issue
+
+
+async def identify_and_validate(hunks_text: str) -> List[ValidatedIssue]:
+    """
+    Stages 1 + 2 fused: identify and validate issues in one agent session.
+
+    Intended for small PRs, where a separate validation session per issue
+    costs more round-trips than the review itself.
+
+    Args:
+        hunks_text: Formatted string of code changes
+
+    Returns:
+        List of ValidatedIssue objects (including false positives)
+    """
+    # Per-call storage so concurrent calls don't share results
+    issue_storage: StorageTool[dict] = StorageTool()
+
+    review_server = create_sdk_mcp_server(
+        name="review-fused",
+        version="1.0.0",
+        tools=[_make_store_validated_issue_tool(issue_storage)]
+    )
+    options = _validation_options(
+        review_server,
+        max_turns=40,
+        store_tool="store_validated_issue",
+        system_prompt=FUSED_SYSTEM_PROMPT,
+    )
+
+    print("  [Fused] Starting combined identification and validation...")
+    issue_count = 0
+
+    async with ClaudeSDKClient(options=options) as client:
+        await client.query(FUSED_PROMPT.format(hunks=hunks_text))
+
+        async for message in client.receive_response():
+            if isinstance(message, AssistantMessage):
+                for block in message.content:
+                    if isinstance(block, TextBlock):
+                        text = block.text.strip()
+                        if text and len(text) > 10:
+                            preview = text[:100] + "..." if len(text) > 100 else text
+                            print(f"  [Fused] Analyzing: {preview}")
+                    elif isinstance(block, ToolUseBlock):
+                        if block.name == "mcp__validate__store_validated_issue":
+                            issue_count += 1
+                            file_path = block.input.get("file_path", "unknown")
+                            verdict = "valid" if block.input.get("is_valid") else "false positive"
+                            print(f"  [Fused] Issue #{issue_count}: {file_path} ({verdict})")
+                        else:
+                            print(f"  [Fused] Using tool: {block.name.split('__')[-1]}")
+
+            elif isinstance(message, ResultMessage):
+                duration_sec = message.duration_ms / 1000
+                print(f"  [Fused] Completed in {duration_sec:.1f}s - Reviewed {issue_count} issues")
+                if message.is_error:
+                    print(f"  [Fused] Error: {message}")
+
+    return parse_validated_issues(issue_storage.values)
+
+
+def parse_validated_issues(values: List[dict]) -> List[ValidatedIssue]:
+    """
+    Convert stored store_validated_issue arguments to ValidatedIssue objects.
+
+    Entries that cannot be parsed are skipped with a warning.
+    """
+    validated = []
+    for data in values:
+        try:
+            validated.append(ValidatedIssue(
+                issue=parse_issue(data),
+                is_valid=bool(data.get("is_valid", False)),
+                evidence=data.get("evidence", []),
+                library_reference=data.get("library_reference") or None,
+                mitigation=data.get("mitigation") or None,
+                confidence=float(data.get("confidence", 0.0)),
+            ))
+        except (ValueError, TypeError) as e:
+            print(f"Warning: Failed to parse issue: {e}")
+
+    return validated
+
+
+# Synchronous wrapper
+def identify_and_validate_sync(hunks_text: str) -> List[ValidatedIssue]:
+    """Synchronous wrapper for identify_and_validate."""
+    return asyncio.run(identify_and_validate(hunks_text))
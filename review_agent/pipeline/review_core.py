@@ -0,0 +1,157 @@
+"""Shared Stage 1 + 2 review core used by the review and testgen commands."""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from ..config import ReviewConfig
+from ..models import PotentialIssue, ValidatedIssue, SEVERITY_RANK
+from ..tools import parse_pr_diff, format_hunks, iter_file_hunks
+from ..tools.diff_parser import FileDiff
+from ..utils import get_logger
+from .stage1_identify import identify_issues_stream
+from .stage2_validate import validate_issues
+from .fused_review import identify_and_validate
+
+
+# ReviewConfig flag controlling whether each severity is reported
+_REPORT_FLAG_NAMES = {
+    "low": "report_low",
+    "medium": "report_medium",
+    "high": "report_high",
+    "critical": "report_critical",
+}
+
+
+@dataclass
+class ReviewCoreResult:
+    """Output of review_core."""
+    file_diffs: List[FileDiff]
+    potential_issues: List[PotentialIssue] = field(default_factory=list)  # After reportability filtering
+    validated_issues: List[ValidatedIssue] = field(default_factory=list)
+    skipped: int = 0  # Stage 1 issues dropped as never reportable
+
+
+async def review_core(diff_text: str, config: ReviewConfig) -> ReviewCoreResult:
+    """
+    Run Stages 1 and 2 over a PR diff.
+
+    Parses the diff once, identifies issues (fused with validation for
+    small PRs), drops issues that could never be reported, and validates
+    the rest.
+
+    Args:
+        diff_text: Raw unified diff of the PR
+        config: Review configuration
+
+    Returns:
+        ReviewCoreResult with the parsed diff and issues of both stages
+    """
+    logger = get_logger()
+
+    # Parse diff into hunks
+    file_diffs = parse_pr_diff(diff_text)
+
+    logger.info(f"Analyzing {len(file_diffs)} changed files...")
+
+    total_hunks = sum(len(fd.hunks) for fd in file_diffs)
+    fused = total_hunks < config.fuse_below_hunks
+    fused_results: List[ValidatedIssue] = []
+
+    if fused:
+        # Small PR: one session identifies and validates (half the round-trips)
+        logger.info(f"Small PR ({total_hunks} hunks): identifying and validating in one pass...")
+        fused_results = await identify_and_validate(format_hunks(file_diffs))
+        potential_issues = [v.issue for v in fused_results]
+    else:
+        # Stage 1: Identify potential issues (files are formatted lazily and batched)
+        logger.info("Stage 1: Identifying potential issues...")
+        potential_issues = await identify_issues_stream(
+            iter_file_hunks(file_diffs),
+            max_parallel=config.max_parallel
+        )
+    logger.info(f"Stage 1 complete: Found {len(potential_issues)} potential issues")
+
+    # Drop issues that could never be reported before the expensive Stage 2
+    filtered_issues = [issue for issue in potential_issues if would_report(issue, config)]
+
+    skipped = len(potential_issues) - len(filtered_issues)
+    if skipped:
+        logger.info(
+            f"Filtered out {skipped} issues below {config.min_severity} severity "
+            f"or excluded from reporting"
+        )
+
+    if not filtered_issues:
+        return ReviewCoreResult(file_diffs=file_diffs, skipped=skipped)
+
+    if fused:
+        validated_issues = [v for v in fused_results if would_report(v.issue, config)]
+    else:
+        # Stage 2: Validate issues with evidence
+        logger.info("Stage 2: Validating issues with evidence...")
+        validated_issues = await validate_issues(
+            filtered_issues,
+            parallel=config.parallel_validation,
+            max_parallel=config.max_parallel,
+            batch_size=config.validation_batch_size,
+            use_cache=config.cache_validations,
+            repo=config.repo,
+        )
+
+    return ReviewCoreResult(
+        file_diffs=file_diffs,
+        potential_issues=filtered_issues,
+        validated_issues=validated_issues,
+        skipped=skipped,
+    )
+
+
+def would_report(issue: PotentialIssue, config: ReviewConfig) -> bool:
+    """
+    Check whether an issue could be reported if Stage 2 confirms it.
+
+    Applies the same severity rules as filter_reportable_issues plus the
+    min_severity cut, assuming the best-case confidence of 1.0.
+    """
+    if config.min_confidence > 1.0:
+        return False
+
+    rank = SEVERITY_RANK.get(issue.severity)
+    if (rank or 0) < SEVERITY_RANK[config.min_severity]:
+        return False
+
+    # Unknown severities are always reported
+    return rank is None or _severity_reported(issue.severity, config)
+
+
+def _severity_reported(severity: str, config: ReviewConfig) -> bool:
+    """Check the per-severity report_* flag."""
+    return getattr(config, _REPORT_FLAG_NAMES[severity])
+
+
+def filter_reportable_issues(
+    validated_issues: List[ValidatedIssue],
+    config: ReviewConfig
+) -> List[ValidatedIssue]:
+    """Filter issues based on confidence and severity settings."""
+    reportable = []
+    allowed_ranks = {
+        SEVERITY_RANK[sev] for sev in _REPORT_FLAG_NAMES
+        if _severity_reported(sev, config)
+    }
+
+    for issue in validated_issues:
+        # Skip if not valid or below confidence threshold
+        if not issue.is_valid:
+            continue
+        if issue.confidence < config.min_confidence:
+            continue
+
+        # Check severity settings (unknown severities are always reported)
+        rank = SEVERITY_RANK.get(issue.issue.severity)
+        if rank is not None and rank not in allowed_ranks:
+            continue
+
+        reportable.append(issue)
+
+    return reportable
@@ -1,7 +1,8 @@
 """Stage 1: Issue Identification - Find all potential issues in code changes."""
 
 import asyncio
-from typing import List, Any
+from itertools import chain
+from typing import Iterable, List, Any
 
 from claude_agent_sdk import (
     ClaudeSDKClient,
@@ -55,27 +56,34 @@ Call the `store_issue` tool with:
 Now analyze the code and identify all potential issues. Call store_issue for each one found.
 """
 
+# Approximate prompt budget (characters of formatted hunks) per Stage 1 call
+DEFAULT_BATCH_CHARS = 60_000
 
-# Define the store_issue tool
-_issue_storage: StorageTool[dict] = StorageTool()
+# Maximum concurrent Stage 1 agent sessions
+DEFAULT_MAX_PARALLEL = 8
 
 
-@tool(
-    "store_issue",
-    "Store a potential issue found in the code review",
-    {
-        "file_path": str,
-        "line_start": int,
-        "line_end": int,
-        "issue_type": str,
-        "severity": str,
-        "description": str,
-        "code_snippet": str,
-    }
-)
-async def store_issue(args: dict[str, Any]) -> dict[str, Any]:
-    """Store a potential issue found during code review."""
-    return _issue_storage.store(args)
+def _make_store_issue_tool(storage: StorageTool[dict]):
+    """Create a store_issue tool bound to a per-call storage."""
+
+    @tool(
+        "store_issue",
+        "Store a potential issue found in the code review",
+        {
+            "file_path": str,
+            "line_start": int,
+            "line_end": int,
+            "issue_type": str,
+            "severity": str,
+            "description": str,
+            "code_snippet": str,
+        }
+    )
+    async def store_issue(args: dict[str, Any]) -> dict[str, Any]:
+        """Store a potential issue found during code review."""
+        return storage.store(args)
+
+    return store_issue
 
 
 async def identify_issues(hunks_text: str) -> List[PotentialIssue]:
@@ -91,14 +99,14 @@ async def identify_issues(hunks_text: str) -> List[PotentialIssue]:
     Returns:
         List of PotentialIssue objects
     """
-    global _issue_storage
-    _issue_storage = StorageTool()
+    # Per-call storage so concurrent calls don't share results
+    issue_storage: StorageTool[dict] = StorageTool()
 
     # Create MCP server with our tool
     review_server = create_sdk_mcp_server(
         name="review-stage1",
         version="1.0.0",
-        tools=[store_issue]
+        tools=[_make_store_issue_tool(issue_storage)]
     )
 
     # Configure agent options
@@ -157,24 +165,81 @@ potential problems - false positives will be filtered in the next stage.""",
 
     # Convert stored dicts to PotentialIssue objects
     issues = []
-    for data in _issue_storage.values:
+    for data in issue_storage.values:
         try:
-            issue = PotentialIssue(
-                file_path=data.get("file_path", ""),
-                line_start=int(data.get("line_start", 0)),
-                line_end=int(data.get("line_end", 0)),
-                issue_type=data.get("issue_type", "bug"),
-                severity=data.get("severity", "medium"),
-                description=data.get("description", ""),
-                code_snippet=data.get("code_snippet", ""),
-            )
-            issues.append(issue)
+            issues.append(parse_issue(data))
         except (ValueError, TypeError) as e:
             print(f"Warning: Failed to parse issue: {e}")
 
     return issues
 
 
+def parse_issue(data: dict) -> PotentialIssue:
+    """
+    Build a PotentialIssue from the arguments of an issue-storing tool call.
+
+    Raises:
+        ValueError, TypeError: If the line numbers are not integers
+    """
+    return PotentialIssue(
+        file_path=data.get("file_path", ""),
+        line_start=int(data.get("line_start", 0)),
+        line_end=int(data.get("line_end", 0)),
+        issue_type=data.get("issue_type", "bug"),
+        severity=data.get("severity", "medium"),
+        description=data.get("description", ""),
+        code_snippet=data.get("code_snippet", ""),
+    )
+
+
+async def identify_issues_stream(
+    hunk_chunks: Iterable[str],
+    max_chars: int = DEFAULT_BATCH_CHARS,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+) -> List[PotentialIssue]:
+    """
+    Stage 1 over a stream of per-file hunk chunks.
+
+    Packs consecutive chunks into batches of at most max_chars (a single
+    larger chunk forms its own batch) and identifies issues in the
+    batches concurrently, at most max_parallel at a time.
+
+    Args:
+        hunk_chunks: Formatted per-file hunks (see tools.iter_file_hunks)
+        max_chars: Approximate prompt budget per batch
+        max_parallel: Maximum concurrent Stage 1 agent sessions
+
+    Returns:
+        List of PotentialIssue objects from all batches
+    """
+    batches: List[str] = []
+    current: List[str] = []
+    current_size = 0
+
+    for chunk in hunk_chunks:
+        if current and current_size + len(chunk) > max_chars:
+            batches.append("\n".join(current))
+            current = []
+            current_size = 0
+        current.append(chunk)
+        current_size += len(chunk)
+
+    if current:
+        batches.append("\n".join(current))
+
+    if not batches:
+        return []
+
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def bounded(batch: str) -> List[PotentialIssue]:
+        async with semaphore:
+            return await identify_issues(batch)
+
+    results = await asyncio.gather(*(bounded(batch) for batch in batches))
+    return list(chain.from_iterable(results))
+
+
 # Synchronous wrapper for non-async contexts
 def identify_issues_sync(hunks_text: str) -> List[PotentialIssue]:
     """Synchronous wrapper for identify_issues."""
@@ -1,7 +1,9 @@
 """Stage 2: Issue Validation - Validate issues with evidence from codebase."""
 
 import asyncio
-from typing import List, Any
+import hashlib
+from dataclasses import replace
+from typing import Dict, List, Any
 
 from claude_agent_sdk import (
     ClaudeSDKClient,
@@ -16,6 +18,7 @@ from claude_agent_sdk import (
 
 from ..models import PotentialIssue, ValidatedIssue
 from ..tools import StorageTool
+from ..utils import JsonCache
 
 
 STAGE2_PROMPT = """
@@ -62,54 +65,115 @@ Now investigate this issue and provide your verdict.
 """
 
 
-_verdict_storage: StorageTool[dict] = StorageTool()
+STAGE2_BATCH_PROMPT = """
+You are validating {count} potential code issues. For each one, determine if it is a REAL issue or a FALSE POSITIVE.
 
+## Available Tools
+1. **serena** - Search the codebase for related code, usage patterns, and context
+2. **context7** - Look up library documentation if an issue involves external libraries
 
-@tool(
-    "store_verdict",
-    "Store the validation verdict for an issue",
-    {
-        "is_valid": bool,
-        "evidence": list,  # List[str]
-        "library_reference": str,
-        "mitigation": str,
-        "confidence": float,
-    }
-)
-async def store_verdict(args: dict[str, Any]) -> dict[str, Any]:
-    """Store the validation verdict."""
-    return _verdict_storage.store(args)
+## Potential Issues to Validate
+{issues}
 
+## Validation Process
+For each issue, use `serena` and `context7` as needed to gather evidence, then decide
+whether it needs fixing or is an acceptable pattern / intentional design.
 
-async def validate_single_issue(issue: PotentialIssue) -> ValidatedIssue:
-    """
-    Validate a single potential issue with evidence.
+## Call store_verdict once per issue with:
+- index: the issue number shown above
+- is_valid: true if this is a real issue, false if it's a false positive
+- evidence: list of findings from your investigation (what you found in codebase/docs)
+- library_reference: relevant documentation URL or quote (if applicable)
+- mitigation: how to fix the issue (if it's valid)
+- confidence: your confidence level from 0.0 to 1.0
 
-    Uses serena for codebase search and context7 for library docs.
+Now investigate every issue and store a verdict for each.
+"""
 
-    Args:
-        issue: The potential issue to validate
+BATCH_ISSUE_TEMPLATE = """### Issue {index}
+- **File:** {file_path}
+- **Lines:** {line_start}-{line_end}
+- **Type:** {issue_type}
+- **Severity:** {severity}
+- **Description:** {description}
+- **Code:**
+```
+{code_snippet}
+```
+"""
 
-    Returns:
-        ValidatedIssue with evidence and verdict
-    """
-    print(f"  [Validate] {issue.file_path}:{issue.line_start} ({issue.severity})")
+# Maximum concurrent Stage 2 agent sessions in parallel mode
+DEFAULT_MAX_PARALLEL = 8
 
-    global _verdict_storage
-    _verdict_storage = StorageTool()
+# Issues per session in batched validation
+DEFAULT_BATCH_SIZE = 8
 
-    # Create MCP server with verdict tool
-    validate_server = create_sdk_mcp_server(
-        name="review-stage2",
-        version="1.0.0",
-        tools=[store_verdict]
+
+def _make_store_verdict_tool(storage: StorageTool[dict]):
+    """Create a store_verdict tool bound to a per-call storage."""
+
+    @tool(
+        "store_verdict",
+        "Store the validation verdict for an issue",
+        {
+            "is_valid": bool,
+            "evidence": list,  # List[str]
+            "library_reference": str,
+            "mitigation": str,
+            "confidence": float,
+        }
     )
+    async def store_verdict(args: dict[str, Any]) -> dict[str, Any]:
+        """Store the validation verdict."""
+        return storage.store(args)
+
+    return store_verdict
+
+
+def _make_store_batch_verdict_tool(storage: StorageTool[dict]):
+    """Create a store_verdict tool that records which batch issue it is for."""
+
+    @tool(
+        "store_verdict",
+        "Store the validation verdict for one issue of the batch",
+        {
+            "index": int,
+            "is_valid": bool,
+            "evidence": list,  # List[str]
+            "library_reference": str,
+            "mitigation": str,
+            "confidence": float,
+        }
+    )
+    async def store_verdict(args: dict[str, Any]) -> dict[str, Any]:
+        """Store the validation verdict."""
+        return storage.store(args)
+
+    return store_verdict
 
-    # Configure agent with serena and context7 MCP servers
-    options = ClaudeAgentOptions(
-        system_prompt="""You are a senior code reviewer validating potential issues.
+
+VALIDATION_SYSTEM_PROMPT = """You are a senior code reviewer validating potential issues.
 Your goal is to determine if an issue is real or a false positive by gathering
-evidence from the codebase and documentation. Be thorough but objective.""",
+evidence from the codebase and documentation. Be thorough but objective."""
+
+
+def _validation_options(
+    validate_server,
+    max_turns: int,
+    store_tool: str = "store_verdict",
+    system_prompt: str = VALIDATION_SYSTEM_PROMPT,
+) -> ClaudeAgentOptions:
+    """
+    Configure a validation agent with serena and context7 MCP servers.
+
+    Args:
+        validate_server: MCP server providing the result-storing tool
+        max_turns: Maximum agent turns
+        store_tool: Name of the storing tool on validate_server
+        system_prompt: Agent system prompt
+    """
+    return ClaudeAgentOptions(
+        system_prompt=system_prompt,
 
         mcp_servers={
             "validate": validate_server,
@@ -131,7 +195,7 @@ evidence from the codebase and documentation. Be thorough but objective.""",
         },
 
         allowed_tools=[
-            "mcp__validate__store_verdict",
+            f"mcp__validate__{store_tool}",
             # serena tools
             "mcp__serena__search_codebase",
             "mcp__serena__find_references",
@@ -142,9 +206,36 @@ evidence from the codebase and documentation. Be thorough but objective.""",
         ],
 
         permission_mode="acceptEdits",
-        max_turns=20,
+        max_turns=max_turns,
     )
 
+
+async def validate_single_issue(issue: PotentialIssue) -> ValidatedIssue:
+    """
+    Validate a single potential issue with evidence.
+
+    Uses serena for codebase search and context7 for library docs.
+
+    Args:
+        issue: The potential issue to validate
+
+    Returns:
+        ValidatedIssue with evidence and verdict
+    """
+    print(f"  [Validate] {issue.file_path}:{issue.line_start} ({issue.severity})")
+
+    # Per-call storage so parallel validations don't share verdicts
+    verdict_storage: StorageTool[dict] = StorageTool()
+
+    # Create MCP server with verdict tool
+    validate_server = create_sdk_mcp_server(
+        name="review-stage2",
+        version="1.0.0",
+        tools=[_make_store_verdict_tool(verdict_storage)]
+    )
+
+    options = _validation_options(validate_server, max_turns=20)
+
     prompt = STAGE2_PROMPT.format(
         file_path=issue.file_path,
         line_start=issue.line_start,
@@ -172,22 +263,14 @@ evidence from the codebase and documentation. Be thorough but objective.""",
 
             elif isinstance(message, ResultMessage):
                 duration_sec = message.duration_ms / 1000
-                verdict = "valid" if _verdict_storage.values and _verdict_storage.values[0].get("is_valid") else "false positive"
+                verdict = "valid" if verdict_storage.values and verdict_storage.values[0].get("is_valid") else "false positive"
                 print(f"    Result: {verdict} ({duration_sec:.1f}s)")
                 if message.is_error:
                     print(f"    Error: {message}")
 
     # Build ValidatedIssue from verdict
-    if _verdict_storage.values:
-        verdict = _verdict_storage.values[0]
-        return ValidatedIssue(
-            issue=issue,
-            is_valid=verdict.get("is_valid", False),
-            evidence=verdict.get("evidence", []),
-            library_reference=verdict.get("library_reference"),
-            mitigation=verdict.get("mitigation"),
-            confidence=float(verdict.get("confidence", 0.0)),
-        )
+    if verdict_storage.values:
+        return _from_verdict(issue, verdict_storage.values[0])
     else:
         # No verdict stored - assume inconclusive
         return ValidatedIssue(
@@ -198,9 +281,148 @@ evidence from the codebase and documentation. Be thorough but objective.""",
         )
 
 
+def _from_verdict(issue: PotentialIssue, verdict: dict) -> ValidatedIssue:
+    """Build a ValidatedIssue from a stored verdict."""
+    return ValidatedIssue(
+        issue=issue,
+        is_valid=verdict.get("is_valid", False),
+        evidence=verdict.get("evidence", []),
+        library_reference=verdict.get("library_reference"),
+        mitigation=verdict.get("mitigation"),
+        confidence=float(verdict.get("confidence", 0.0)),
+    )
+
+
+async def validate_issue_batch(issues: List[PotentialIssue]) -> List[ValidatedIssue]:
+    """
+    Validate several potential issues in one agent session.
+
+    Issues the agent leaves without a verdict are re-validated
+    concurrently, each with validate_single_issue.
+
+    Args:
+        issues: Potential issues to validate together
+
+    Returns:
+        ValidatedIssue objects in the same order as issues
+    """
+    print(f"  [Validate] Batch of {len(issues)} issues")
+
+    verdict_storage: StorageTool[dict] = StorageTool()
+
+    validate_server = create_sdk_mcp_server(
+        name="review-stage2",
+        version="1.0.0",
+        tools=[_make_store_batch_verdict_tool(verdict_storage)]
+    )
+    options = _validation_options(validate_server, max_turns=10 + 10 * len(issues))
+
+    issues_text = "\n".join(
+        BATCH_ISSUE_TEMPLATE.format(
+            index=index,
+            file_path=issue.file_path,
+            line_start=issue.line_start,
+            line_end=issue.line_end,
+            issue_type=issue.issue_type,
+            severity=issue.severity,
+            description=issue.description,
+            code_snippet=issue.code_snippet,
+        )
+        for index, issue in enumerate(issues)
+    )
+
+    async with ClaudeSDKClient(options=options) as client:
+        await client.query(STAGE2_BATCH_PROMPT.format(count=len(issues), issues=issues_text))
+
+        async for message in client.receive_response():
+            if isinstance(message, AssistantMessage):
+                for block in message.content:
+                    if isinstance(block, ToolUseBlock):
+                        tool_name = block.name.split("__")[-1]
+                        print(f"    Using tool: {tool_name}")
+
+            elif isinstance(message, ResultMessage):
+                duration_sec = message.duration_ms / 1000
+                print(f"    Batch result: {len(verdict_storage.values)}/{len(issues)} verdicts ({duration_sec:.1f}s)")
+                if message.is_error:
+                    print(f"    Error: {message}")
+
+    verdicts: Dict[int, dict] = {}
+    for verdict in verdict_storage.values:
+        try:
+            index = int(verdict.get("index", -1))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(issues):
+            verdicts.setdefault(index, verdict)
+
+    missing = [index for index in range(len(issues)) if index not in verdicts]
+    for index in missing:
+        print(f"    No batch verdict for {issues[index].file_path}:{issues[index].line_start}, validating alone")
+    fallbacks = dict(zip(missing, await asyncio.gather(
+        *(validate_single_issue(issues[index]) for index in missing)
+    )))
+
+    return [
+        _from_verdict(issue, verdicts[index]) if index in verdicts else fallbacks[index]
+        for index, issue in enumerate(issues)
+    ]
+
+
+async def validate_issues_batched(
+    potential_issues: List[PotentialIssue],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+) -> List[ValidatedIssue]:
+    """
+    Validate issues in multi-issue batches, batches running concurrently.
+
+    Args:
+        potential_issues: Potential issues to validate
+        batch_size: Issues per validation session
+        max_parallel: Maximum concurrent batch sessions
+
+    Returns:
+        ValidatedIssue objects in the same order as potential_issues
+    """
+    batches = [
+        potential_issues[i:i + batch_size]
+        for i in range(0, len(potential_issues), batch_size)
+    ]
+    print(f"  Starting {len(batches)} batched validations (max {max_parallel} at once)...")
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def bounded(batch: List[PotentialIssue]) -> List[ValidatedIssue]:
+        async with semaphore:
+            return await validate_issue_batch(batch)
+
+    batch_results = await asyncio.gather(*(bounded(b) for b in batches), return_exceptions=True)
+
+    results = []
+    for batch, batch_result in zip(batches, batch_results):
+        if isinstance(batch_result, Exception):
+            print(f"  Warning: Failed to validate batch: {batch_result}")
+            results.extend(
+                ValidatedIssue(
+                    issue=issue,
+                    is_valid=False,
+                    evidence=[f"Validation failed: {batch_result}"],
+                    confidence=0.0,
+                )
+                for issue in batch
+            )
+        else:
+            results.extend(batch_result)
+    return results
+
+
 async def validate_issues(
     potential_issues: List[PotentialIssue],
-    parallel: bool = False
+    parallel: bool = False,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    batch_size: int = 1,
+    use_cache: bool = False,
+    repo: str = "",
 ) -> List[ValidatedIssue]:
     """
     Stage 2: Validate all potential issues with evidence.
@@ -211,6 +433,14 @@ async def validate_issues(
     Args:
         potential_issues: List of potential issues from Stage 1
         parallel: Whether to validate issues in parallel (uses more resources)
+        max_parallel: Maximum concurrent validations in parallel mode
+        batch_size: Issues per validation session; above 1, issues are
+            validated in batches, concurrently only in parallel mode (see
+            validate_issues_batched)
+        use_cache: Reuse and record verdicts in the persistent validation
+            cache, keyed by repo and issue content
+        repo: Repository the issues belong to ("owner/repo"); scopes
+            cached verdicts so identical issues in other repos don't share them
 
     Returns:
         List of ValidatedIssue objects
@@ -218,13 +448,106 @@ async def validate_issues(
     if not potential_issues:
         return []
 
+    # Validate each distinct issue once, then fan verdicts back out
+    groups: Dict[tuple, List[PotentialIssue]] = {}
+    for issue in potential_issues:
+        groups.setdefault(_dedupe_key(issue), []).append(issue)
+
+    unique_issues = [duplicates[0] for duplicates in groups.values()]
+    if len(unique_issues) < len(potential_issues):
+        print(f"Stage 2: Skipping {len(potential_issues) - len(unique_issues)} duplicate issues")
+
+    # Reuse verdicts for issues already validated in earlier reviews
+    cache = JsonCache("validations") if use_cache else None
+    cache_keys = [_cache_key(issue, repo) for issue in unique_issues]
+    cached = cache.get_many(cache_keys) if cache else {}
+    if cached:
+        print(f"Stage 2: Reusing {len(cached)} cached verdicts")
+
+    pending = [issue for issue, key in zip(unique_issues, cache_keys) if key not in cached]
+    if not pending:
+        fresh = []
+    elif batch_size > 1 and len(pending) > 1:
+        print(f"Stage 2: Validating {len(pending)} potential issues in batches of {batch_size}...")
+        fresh = await validate_issues_batched(pending, batch_size, max_parallel if parallel else 1)
+    else:
+        fresh = await _validate_unique(pending, parallel, max_parallel)
+
+    if cache:
+        # Failed and inconclusive validations carry zero confidence; don't pin them
+        cache.set_many({
+            _cache_key(result.issue, repo): _to_verdict(result)
+            for result in fresh if result.confidence > 0
+        })
+
+    fresh_iter = iter(fresh)
+    results = [
+        _from_verdict(issue, cached[key]) if key in cached else next(fresh_iter)
+        for issue, key in zip(unique_issues, cache_keys)
+    ]
+
+    by_key = dict(zip(groups, results))
+    validated = []
+    for issue in potential_issues:
+        result = by_key[_dedupe_key(issue)]
+        validated.append(result if result.issue is issue else replace(result, issue=issue))
+    return validated
+
+
+def _cache_key(issue: PotentialIssue, repo: str) -> str:
+    """Content hash identifying an issue in a repo across reviews."""
+    content = "\0".join((
+        repo,
+        issue.file_path,
+        str(issue.line_start),
+        str(issue.line_end),
+        issue.code_snippet,
+        issue.description,
+    ))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _to_verdict(result: ValidatedIssue) -> dict:
+    """Serialize a ValidatedIssue's verdict (inverse of _from_verdict)."""
+    return {
+        "is_valid": result.is_valid,
+        "evidence": result.evidence,
+        "library_reference": result.library_reference,
+        "mitigation": result.mitigation,
+        "confidence": result.confidence,
+    }
+
+
+def _dedupe_key(issue: PotentialIssue) -> tuple:
+    """Key under which duplicate Stage 1 issues share one validation."""
+    return (
+        issue.file_path,
+        issue.line_start,
+        issue.line_end,
+        issue.issue_type,
+        issue.description,
+    )
+
+
+async def _validate_unique(
+    potential_issues: List[PotentialIssue],
+    parallel: bool,
+    max_parallel: int,
+) -> List[ValidatedIssue]:
+    """Validate already-deduplicated issues, preserving order."""
     print(f"Stage 2: Validating {len(potential_issues)} potential issues...")
     print(f"  Mode: {'parallel' if parallel else 'sequential'}")
 
     if parallel:
         # Parallel validation (faster but more resource intensive)
-        print(f"  Starting {len(potential_issues)} parallel validations...")
-        tasks = [validate_single_issue(issue) for issue in potential_issues]
+        print(f"  Starting {len(potential_issues)} parallel validations (max {max_parallel} at once)...")
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def bounded(issue: PotentialIssue) -> ValidatedIssue:
+            async with semaphore:
+                return await validate_single_issue(issue)
+
+        tasks = [bounded(issue) for issue in potential_issues]
         validated = await asyncio.gather(*tasks, return_exceptions=True)
         print("  All parallel validations completed")
 
@@ -255,15 +255,15 @@ class CoverageGate:
         # Issue conditions
         critical_issues = [
             i for i in issues
-            if i.is_valid and i.issue.severity.lower() == "critical"
+            if i.is_valid and i.issue.severity == "critical"
         ]
         high_issues = [
             i for i in issues
-            if i.is_valid and i.issue.severity.lower() == "high"
+            if i.is_valid and i.issue.severity == "high"
         ]
         medium_issues = [
             i for i in issues
-            if i.is_valid and i.issue.severity.lower() == "medium"
+            if i.is_valid and i.issue.severity == "medium"
         ]
 
         conditions["no_critical_issues"] = len(critical_issues) == 0
@@ -1,13 +1,17 @@
 """Tools for PR review agent."""
 
 from .storage_tool import StorageTool
-from .github_tool import GitHubTool
-from .diff_parser import parse_pr_diff, format_hunks, get_changed_functions
+from .github_tool import GitHubTool, graphql_query, list_open_prs, list_pr_files
+from .diff_parser import parse_pr_diff, format_hunks, iter_file_hunks, get_changed_functions
 
 __all__ = [
     "StorageTool",
     "GitHubTool",
+    "graphql_query",
+    "list_open_prs",
+    "list_pr_files",
     "parse_pr_diff",
     "format_hunks",
+    "iter_file_hunks",
     "get_changed_functions",
 ]
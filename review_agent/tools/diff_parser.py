@@ -1,10 +1,28 @@
 """Git diff parsing utilities."""
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional
+import hashlib
 import re
 
 
+FILE_HEADER_RE = re.compile(r'^diff --git a/(.*) b/(.*)$')
+HUNK_HEADER_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$')
+
+# Patterns for changed-function detection, keyed by language
+FUNCTION_PATTERNS = {
+    'python': re.compile(r'^\+\s*(?:async\s+)?def\s+(\w+)\s*\('),
+    'javascript': re.compile(r'^\+\s*(?:async\s+)?(?:function\s+(\w+)|(\w+)\s*(?:=|:)\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))'),
+    'typescript': re.compile(r'^\+\s*(?:async\s+)?(?:function\s+(\w+)|(\w+)\s*(?:=|:)\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))'),
+}
+
+
+# LRU of parsed diffs keyed by blake2b digest of the diff text
+PARSE_CACHE_SIZE = 64
+_PARSE_CACHE: "OrderedDict[bytes, List[FileDiff]]" = OrderedDict()
+
+
 @dataclass
 class Hunk:
     """Represents a single hunk from a git diff."""
@@ -31,6 +49,10 @@ def parse_pr_diff(diff_text: str) -> List[FileDiff]:
     """
     Parse a unified diff string into structured FileDiff objects.
 
+    Results are memoized by a digest of the diff text, so re-reviewing an
+    unchanged head (feedback loop iterations, testgen after review) skips
+    the re-parse. Callers must treat the returned FileDiffs as read-only.
+
     Args:
         diff_text: Raw unified diff output from git
 
@@ -40,23 +62,32 @@ def parse_pr_diff(diff_text: str) -> List[FileDiff]:
     if not diff_text or not diff_text.strip():
         return []
 
+    key = hashlib.blake2b(diff_text.encode(), digest_size=16).digest()
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        _PARSE_CACHE.move_to_end(key)
+        return list(cached)
+
+    file_diffs = _parse_diff_text(diff_text)
+    _PARSE_CACHE[key] = file_diffs
+    if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return list(file_diffs)
+
+
+def _parse_diff_text(diff_text: str) -> List[FileDiff]:
+    """Parse a non-empty unified diff (uncached)."""
     file_diffs = []
     current_file: Optional[FileDiff] = None
     current_hunk_lines: List[str] = []
     current_hunk_header: Optional[str] = None
 
-    # Regex patterns
-    file_header_pattern = re.compile(r'^diff --git a/(.*) b/(.*)$')
-    old_file_pattern = re.compile(r'^--- (?:a/)?(.*)$')
-    new_file_pattern = re.compile(r'^\+\+\+ (?:b/)?(.*)$')
-    hunk_header_pattern = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$')
-
     lines = diff_text.split('\n')
 
     def save_current_hunk():
         nonlocal current_hunk_lines, current_hunk_header
         if current_file and current_hunk_header and current_hunk_lines:
-            match = hunk_header_pattern.match(current_hunk_header)
+            match = HUNK_HEADER_RE.match(current_hunk_header)
             if match:
                 hunk = Hunk(
                     file_path=current_file.new_path,
@@ -73,7 +104,7 @@ def parse_pr_diff(diff_text: str) -> List[FileDiff]:
 
     for line in lines:
         # Check for new file diff
-        file_match = file_header_pattern.match(line)
+        file_match = FILE_HEADER_RE.match(line)
         if file_match:
             # Save previous hunk and file
             save_current_hunk()
@@ -97,7 +128,7 @@ def parse_pr_diff(diff_text: str) -> List[FileDiff]:
                 continue
 
         # Check for hunk header
-        hunk_match = hunk_header_pattern.match(line)
+        hunk_match = HUNK_HEADER_RE.match(line)
         if hunk_match:
             save_current_hunk()
             current_hunk_header = line
@@ -116,22 +147,22 @@ def parse_pr_diff(diff_text: str) -> List[FileDiff]:
     return file_diffs
 
 
-def format_hunks(file_diffs: List[FileDiff]) -> str:
+def iter_file_hunks(file_diffs: List[FileDiff]) -> Iterator[str]:
     """
-    Format parsed diffs into a readable string for LLM analysis.
+    Format parsed diffs file by file for LLM analysis.
+
+    Yields one formatted chunk per file so callers can batch or dispatch
+    files without materializing the whole formatted diff.
 
     Args:
         file_diffs: List of parsed FileDiff objects
 
-    Returns:
-        Formatted string representation of all changes
+    Yields:
+        Formatted string representation of one file's changes
     """
-    if not file_diffs:
-        return "No changes found."
-
-    output_parts = []
-
     for file_diff in file_diffs:
+        output_parts = []
+
         # File header
         status = ""
         if file_diff.is_new_file:
@@ -147,7 +178,23 @@ def format_hunks(file_diffs: List[FileDiff]) -> str:
             output_parts.append(hunk.content)
             output_parts.append("```\n")
 
-    return '\n'.join(output_parts)
+        yield '\n'.join(output_parts)
+
+
+def format_hunks(file_diffs: List[FileDiff]) -> str:
+    """
+    Format parsed diffs into a readable string for LLM analysis.
+
+    Args:
+        file_diffs: List of parsed FileDiff objects
+
+    Returns:
+        Formatted string representation of all changes
+    """
+    if not file_diffs:
+        return "No changes found."
+
+    return '\n'.join(iter_file_hunks(file_diffs))
 
 
 def get_changed_functions(file_diffs: List[FileDiff]) -> List[dict]:
@@ -158,23 +205,16 @@ def get_changed_functions(file_diffs: List[FileDiff]) -> List[dict]:
     """
     changed_functions = []
 
-    # Patterns for different languages
-    patterns = {
-        'python': re.compile(r'^\+\s*(?:async\s+)?def\s+(\w+)\s*\('),
-        'javascript': re.compile(r'^\+\s*(?:async\s+)?(?:function\s+(\w+)|(\w+)\s*(?:=|:)\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))'),
-        'typescript': re.compile(r'^\+\s*(?:async\s+)?(?:function\s+(\w+)|(\w+)\s*(?:=|:)\s*(?:async\s+)?(?:function|\([^)]*\)\s*=>))'),
-    }
-
     for file_diff in file_diffs:
         ext = file_diff.new_path.split('.')[-1] if '.' in file_diff.new_path else ''
 
         # Determine language
         if ext == 'py':
-            pattern = patterns['python']
+            pattern = FUNCTION_PATTERNS['python']
         elif ext in ('js', 'jsx'):
-            pattern = patterns['javascript']
+            pattern = FUNCTION_PATTERNS['javascript']
         elif ext in ('ts', 'tsx'):
-            pattern = patterns['typescript']
+            pattern = FUNCTION_PATTERNS['typescript']
         else:
             continue
 
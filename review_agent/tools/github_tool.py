@@ -1,12 +1,23 @@
 """GitHub API wrapper for PR operations."""
 
 import os
+import tempfile
 from dataclasses import dataclass
-from typing import List, Optional
-from github import Github, GithubException
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from github import Github, GithubException, GithubRetry, UnknownObjectException
+from github.Commit import Commit
+from github.File import File
 from github.PullRequest import PullRequest
+from github.Repository import Repository
 
 from ..models import ValidatedIssue
+from ..utils import get_cache_dir
+
+try:
+    import orjson
+except ImportError:  # Optional: installed with the "fast" extra
+    orjson = None
 
 
 @dataclass
@@ -18,6 +29,180 @@ class ReviewComment:
     side: str = "RIGHT"  # LEFT for deletions, RIGHT for additions
 
 
+# Retry policy for 403/429 and 5xx responses. GithubRetry honors
+# Retry-After and X-RateLimit-Reset and backs off exponentially otherwise.
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 2.0
+MAX_RATE_LIMIT_WAIT = 900  # Give up rather than sleep past 15 minutes
+
+# Enough pooled connections for concurrent comment posting
+HTTP_POOL_SIZE = 16
+
+# Open PRs into a base branch with their first page of changed files
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!, $base: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      states: OPEN, baseRefName: $base, first: 100, after: $cursor,
+      orderBy: {field: CREATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        headRefName
+        headRefOid
+        baseRefName
+        createdAt
+        updatedAt
+        files(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes { path }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Further pages of changed files for a single PR
+PR_FILES_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      files(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path }
+      }
+    }
+  }
+}
+"""
+
+
+def select_token(tokens: List[str]) -> str:
+    """
+    Pick the token with the most remaining core rate limit.
+
+    Rate limit lookups do not count against the limit. Tokens whose
+    lookup fails are ranked last.
+
+    Args:
+        tokens: Candidate GitHub tokens
+
+    Returns:
+        The token with the highest remaining quota
+    """
+    if len(tokens) == 1:
+        return tokens[0]
+
+    def remaining(token: str) -> int:
+        try:
+            return Github(token).rate_limiting[0]
+        except GithubException:
+            return -1
+
+    return max(tokens, key=remaining)
+
+
+def graphql_query(repo: Repository, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run a GraphQL query against a repository.
+
+    $owner and $name are bound to the repository, so queries can start
+    with repository(owner: $owner, name: $name). Uses the repository's
+    own client, so retries and connection pooling are shared.
+
+    Args:
+        repo: Repository the query is scoped to
+        query: GraphQL query text
+        variables: Additional query variables
+
+    Returns:
+        The "data" member of the response
+
+    Raises:
+        GithubException: On HTTP errors or GraphQL errors in the response
+    """
+    bound = {"owner": repo.owner.login, "name": repo.name, **(variables or {})}
+    requester = repo.requester
+    if orjson is None:
+        _, response = requester.graphql_query(query, bound)
+        return response["data"]
+
+    # Same request as Requester.graphql_query, but the (often large)
+    # response body is parsed with orjson instead of the stdlib json
+    status, headers, body = requester.requestJson(
+        "POST", requester.graphql_url, input={"query": query, "variables": bound}
+    )
+    response = orjson.loads(body) if body else None
+    if status >= 400:
+        raise requester.createException(status, headers, response)
+    errors = response.get("errors")
+    if errors:
+        if len(errors) == 1 and errors[0].get("type") == "NOT_FOUND":
+            raise UnknownObjectException(404, response, headers, errors[0].get("message"))
+        raise requester.createException(400, headers, response)
+    return response["data"]
+
+
+def list_open_prs(
+    repo: Repository,
+    base: str,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    List one page (up to 100) of open PRs into a base branch as plain dicts.
+
+    One GraphQL request returns the PRs together with their first 100
+    changed file paths, without materializing PyGithub objects.
+
+    Args:
+        repo: Repository to list
+        base: Base branch to filter PRs
+        cursor: Page cursor, None for the first page
+
+    Returns:
+        Tuple of (PR dicts, next page cursor or None). Each dict has the
+        GraphQL fields number, headRefName, headRefOid, baseRefName,
+        createdAt and updatedAt, plus "changed_files" (first page of
+        paths) and "files_cursor" (cursor for list_pr_files, or None)
+    """
+    data = graphql_query(repo, OPEN_PRS_QUERY, {"base": base, "cursor": cursor})
+    page = data["repository"]["pullRequests"]
+
+    prs = []
+    for pr in page["nodes"]:
+        files = pr.pop("files")
+        pr["changed_files"] = [f["path"] for f in files["nodes"]]
+        pr["files_cursor"] = files["pageInfo"]["endCursor"] if files["pageInfo"]["hasNextPage"] else None
+        prs.append(pr)
+
+    next_cursor = page["pageInfo"]["endCursor"] if page["pageInfo"]["hasNextPage"] else None
+    return prs, next_cursor
+
+
+def list_pr_files(repo: Repository, pr_number: int, cursor: Optional[str] = None) -> List[str]:
+    """
+    List the changed file paths of a PR via GraphQL.
+
+    Args:
+        repo: Repository of the PR
+        pr_number: Pull request number
+        cursor: Files page cursor to continue after, None to start
+
+    Returns:
+        File paths from the cursor to the end
+    """
+    paths = []
+    while True:
+        data = graphql_query(repo, PR_FILES_QUERY, {"number": pr_number, "cursor": cursor})
+        files = data["repository"]["pullRequest"]["files"]
+        paths.extend(f["path"] for f in files["nodes"])
+        if not files["pageInfo"]["hasNextPage"]:
+            return paths
+        cursor = files["pageInfo"]["endCursor"]
+
+
 class GitHubTool:
     """
     GitHub API wrapper for PR review operations.
@@ -28,7 +213,16 @@ class GitHubTool:
     - Managing PR status
     """
 
-    def __init__(self, repo: str, pr_number: int, token: Optional[str] = None):
+    # Switch tokens on refresh() once the current one drops below this
+    ROTATE_BELOW_REMAINING = 500
+
+    def __init__(
+        self,
+        repo: str,
+        pr_number: int,
+        token: Optional[str] = None,
+        tokens: Optional[List[str]] = None,
+    ):
         """
         Initialize GitHub tool.
 
@@ -36,15 +230,38 @@ class GitHubTool:
             repo: Repository in format "owner/repo"
             pr_number: Pull request number
             token: GitHub token (defaults to GITHUB_TOKEN env var)
+            tokens: Optional pool of tokens; the one with the most remaining
+                rate limit is used, and refresh() rotates when it runs low
         """
-        self.token = token or os.environ.get("GITHUB_TOKEN")
-        if not self.token:
+        self.tokens = [t for t in (tokens or []) if t]
+        if not self.tokens:
+            fallback = token or os.environ.get("GITHUB_TOKEN")
+            self.tokens = [fallback] if fallback else []
+        if not self.tokens:
             raise ValueError("GitHub token required. Set GITHUB_TOKEN env var or pass token parameter.")
 
-        self.gh = Github(self.token)
-        self.repo = self.gh.get_repo(repo)
+        self.repo_name = repo
         self.pr_number = pr_number
         self._pr: Optional[PullRequest] = None
+        self._files: Optional[List[File]] = None
+        self._head_commit: Optional[Commit] = None
+        self._connect(select_token(self.tokens))
+
+    def _connect(self, token: str):
+        """Create the API client and repository handle for a token."""
+        self.token = token
+        # per_page=100 is the API maximum; fewer pages for large PRs
+        self.gh = Github(
+            self.token,
+            per_page=100,
+            retry=GithubRetry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                max_rate_limit_wait=MAX_RATE_LIMIT_WAIT,
+            ),
+            pool_size=HTTP_POOL_SIZE,
+        )
+        self.repo = self.gh.get_repo(self.repo_name)
 
     @property
     def pr(self) -> PullRequest:
@@ -53,16 +270,68 @@ class GitHubTool:
             self._pr = self.repo.get_pull(self.pr_number)
         return self._pr
 
+    @property
+    def files(self) -> List[File]:
+        """Get the changed files of the pull request (cached)."""
+        if self._files is None:
+            self._files = list(self.pr.get_files())
+        return self._files
+
+    @property
+    def head_commit(self) -> Commit:
+        """Get the head commit of the pull request (cached)."""
+        if self._head_commit is None:
+            self._head_commit = self.repo.get_commit(self.pr.head.sha)
+        return self._head_commit
+
+    def refresh(self):
+        """
+        Drop cached PR state so the next access refetches it.
+
+        With a token pool, also switches to the freshest token once the
+        current one is running low on rate limit.
+        """
+        self._pr = None
+        self._files = None
+        self._head_commit = None
+
+        if len(self.tokens) > 1:
+            # Read from the last response headers; no extra request
+            remaining, _ = self.gh.rate_limiting
+            if 0 <= remaining < self.ROTATE_BELOW_REMAINING:
+                best = select_token(self.tokens)
+                if best != self.token:
+                    self._connect(best)
+
+    def fetch_pr_bundle(self) -> Tuple[str, List[str]]:
+        """
+        Fetch the diff and changed file list with a single file listing.
+
+        Returns:
+            Tuple of (diff_text, changed_files)
+        """
+        return self.get_diff(), self.get_changed_files()
+
     def get_diff(self) -> str:
         """
         Get the unified diff for this PR.
 
+        The diff of a given head commit does not change, so it is cached
+        on disk keyed by head SHA and reused on re-reviews.
+
         Returns:
             Raw diff string
         """
+        cache_file = self._diff_cache_file()
+        if cache_file is not None and cache_file.exists():
+            try:
+                return cache_file.read_text(encoding="utf-8")
+            except OSError:
+                pass
+
         # GitHub API returns diff when Accept header is set
         # PyGithub doesn't support this directly, so we use the files
-        files = self.pr.get_files()
+        files = self.files
 
         diff_parts = []
         for file in files:
@@ -77,11 +346,37 @@ class GitHubTool:
                 diff_parts.append(file.patch)
                 diff_parts.append("")
 
-        return '\n'.join(diff_parts)
+        diff_text = '\n'.join(diff_parts)
+
+        if cache_file is not None:
+            # Write to a temp file and rename so concurrent readers never
+            # see a partial diff
+            tmp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=cache_file.parent, suffix=".tmp", delete=False
+                ) as tmp:
+                    tmp_path = tmp.name
+                    tmp.write(diff_text)
+                os.replace(tmp_path, cache_file)
+            except OSError:
+                # Cache is best-effort
+                if tmp_path is not None:
+                    Path(tmp_path).unlink(missing_ok=True)
+
+        return diff_text
+
+    def _diff_cache_file(self) -> Optional[Path]:
+        """Get the on-disk cache path for the current head SHA's diff."""
+        try:
+            cache_dir = get_cache_dir("diffs", self.repo_name.replace("/", "__"))
+        except OSError:
+            return None
+        return cache_dir / f"{self.pr_number}-{self.pr.head.sha}.diff"
 
     def get_changed_files(self) -> List[str]:
         """Get list of files changed in this PR."""
-        return [f.filename for f in self.pr.get_files()]
+        return [f.filename for f in self.files]
 
     def post_review_comment(
         self,
@@ -101,7 +396,7 @@ class GitHubTool:
         if not issue.is_valid:
             return False
 
-        commit = self.repo.get_commit(commit_sha or self.pr.head.sha)
+        commit = self.repo.get_commit(commit_sha) if commit_sha else self.head_commit
 
         # Build comment body
         body = self._format_issue_comment(issue)
@@ -116,7 +411,50 @@ class GitHubTool:
             )
             return True
         except GithubException as e:
-            print(f"Failed to post comment: {e}")
+            # Raised only once the retry policy has given up
+            print(f"Failed to post comment after retries: {e}")
+            return False
+
+    def post_review_batch(
+        self,
+        issues: List[ValidatedIssue],
+        commit_sha: Optional[str] = None
+    ) -> bool:
+        """
+        Post inline comments for several validated issues as one review.
+
+        A single review with all comments costs one API call instead of
+        one per issue. GitHub rejects the whole review if any comment
+        cannot be placed, so callers should fall back to
+        post_review_comment per issue when this returns False.
+
+        Args:
+            issues: Validated issues to comment on (invalid ones are skipped)
+            commit_sha: Specific commit SHA (defaults to latest)
+
+        Returns:
+            True if the review was posted successfully
+        """
+        comments = [
+            {
+                "path": issue.issue.file_path,
+                "line": issue.issue.line_end,
+                "side": "RIGHT",
+                "body": self._format_issue_comment(issue),
+            }
+            for issue in issues
+            if issue.is_valid
+        ]
+        if not comments:
+            return False
+
+        commit = self.repo.get_commit(commit_sha) if commit_sha else self.head_commit
+
+        try:
+            self.pr.create_review(commit=commit, event="COMMENT", comments=comments)
+            return True
+        except GithubException as e:
+            print(f"Failed to post batched review: {e}")
             return False
 
     def post_review_summary(
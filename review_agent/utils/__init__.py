@@ -1,5 +1,6 @@
 """Utility functions."""
 
 from .logging import setup_logging, get_logger
+from .cache import get_cache_dir, JsonCache
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = ["setup_logging", "get_logger", "get_cache_dir", "JsonCache"]
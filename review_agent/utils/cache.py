@@ -0,0 +1,113 @@
+"""On-disk cache utilities."""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """
+    Get a cache directory for the review agent, creating it if needed.
+
+    Honors REVIEW_AGENT_CACHE_DIR, then XDG_CACHE_HOME, then ~/.cache.
+
+    Args:
+        parts: Subdirectory components below the review_agent cache root
+
+    Returns:
+        Path to the cache directory
+    """
+    root = os.environ.get("REVIEW_AGENT_CACHE_DIR")
+    if root:
+        base = Path(root)
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "review_agent"
+
+    path = base.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class JsonCache:
+    """
+    Persistent key -> JSON value store backed by SQLite.
+
+    Entries older than ttl_seconds are treated as missing. Failures to
+    open or write the database are swallowed: the cache is best-effort.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float = 7 * 24 * 3600, path: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Database file stem under the cache directory
+            ttl_seconds: Maximum entry age
+            path: Explicit database path (overrides name)
+        """
+        self.path = path
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path or get_cache_dir() / f"{self.name}.sqlite"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, mtime REAL NOT NULL)"
+        )
+        return conn
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            Dict of key -> value for fresh hits only
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        cutoff = time.time() - self.ttl_seconds
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT key, payload FROM entries WHERE mtime >= ? AND key IN ({placeholders})",
+                    (cutoff, *keys),
+                ).fetchall()
+        except (OSError, sqlite3.Error):
+            return {}
+        hits = {}
+        for key, payload in rows:
+            try:
+                hits[key] = json.loads(payload)
+            except ValueError:
+                continue  # Corrupt entry; treat as a miss
+        return hits
+
+    def set_many(self, items: Dict[str, Any]):
+        """
+        Store several values at once.
+
+        Args:
+            items: Dict of key -> JSON-serializable value
+        """
+        if not items:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, payload, mtime) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in items.items()],
+                )
+        except (OSError, sqlite3.Error):
+            pass
@@ -0,0 +1,493 @@
+"""Tests for the feedback loop helpers.
+
+Following the testing philosophy from CLAUDE.md:
+- Client-perspective behavior verification
+- Given-When-Then structure
+- Minimal mocking (only external APIs)
+"""
+
+import asyncio
+import os
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+from claude_agent_sdk import AssistantMessage, TextBlock, ToolResultBlock, ToolUseBlock, UserMessage
+
+from review_agent.models import PotentialIssue, ValidatedIssue
+from review_agent.pipeline import feedback_loop, stage1_identify
+from review_agent.tools import parse_pr_diff
+
+
+def _issue(file_path: str, description: str = "Something is wrong") -> ValidatedIssue:
+    return ValidatedIssue(
+        issue=PotentialIssue(
+            file_path=file_path,
+            line_start=1,
+            line_end=1,
+            issue_type="bug",
+            severity="high",
+            description=description,
+            code_snippet="x = 1",
+        ),
+        is_valid=True,
+        confidence=0.9,
+    )
+
+
+def _file_diff(path: str, new_line: str) -> str:
+    return (
+        f"diff --git a/{path} b/{path}\n"
+        f"--- a/{path}\n"
+        f"+++ b/{path}\n"
+        "@@ -1 +1 @@\n"
+        "-x = 1\n"
+        f"+{new_line}\n"
+    )
+
+
+class FakeGitHubTool:
+    """Stand-in for GitHubTool serving one diff per iteration."""
+
+    diffs = []
+
+    def __init__(self, repo, pr_number, token=None):
+        self.pr = SimpleNamespace(head=SimpleNamespace(ref="feature"))
+        self._diffs = iter(self.diffs)
+
+    def refresh(self):
+        pass
+
+    def get_diff(self):
+        return next(self._diffs)
+
+
+@pytest.fixture
+def fake_loop(monkeypatch):
+    """Fake GitHub, git and the LLM stages of the feedback loop."""
+    calls = {"identify": [], "validate": [], "fix": []}
+
+    async def identify_issues(hunks_text):
+        calls["identify"].append(hunks_text)
+        return [
+            _issue(path, f"issue found in call {len(calls['identify'])}").issue
+            for path in ("a.py", "b.py")
+            if f"### File: {path}" in hunks_text
+        ]
+
+    async def validate_issues(issues, parallel=True):
+        calls["validate"].append([i.file_path for i in issues])
+        return [ValidatedIssue(issue=i, is_valid=True, confidence=0.9) for i in issues]
+
+    async def fix_issues_batch(issues, attempted, working_dir, max_parallel=4):
+        calls["fix"].append([i.issue.file_path for i in issues])
+        results = []
+        for issue in issues:
+            attempted.add(feedback_loop._issue_hash(issue))
+            fixed = issue.issue.file_path == "a.py"
+            results.append(feedback_loop.FixResult(
+                issue_hash=feedback_loop._issue_hash(issue),
+                file_path=issue.issue.file_path,
+                success=fixed,
+                changes_made=fixed,
+            ))
+        return results
+
+    async def git_ok(*args, **kwargs):
+        return True
+
+    async def commit_and_push(**kwargs):
+        return "f" * 40
+
+    monkeypatch.setattr(feedback_loop, "GitHubTool", FakeGitHubTool)
+    monkeypatch.setattr(stage1_identify, "identify_issues", identify_issues)
+    monkeypatch.setattr(feedback_loop, "validate_issues", validate_issues)
+    monkeypatch.setattr(feedback_loop, "_fix_issues_batch", fix_issues_batch)
+    monkeypatch.setattr(feedback_loop, "_checkout_branch", git_ok)
+    monkeypatch.setattr(feedback_loop, "_pull_latest", git_ok)
+    monkeypatch.setattr(feedback_loop, "_commit_and_push", commit_and_push)
+    return calls
+
+
+class TestChangedFiles:
+    """Tests for reading changed files from a diff."""
+
+    def test_collects_old_and_new_paths(self):
+        """Given added, modified and renamed files, should list every real path."""
+        # Given
+        diff_text = (
+            _file_diff("a.py", "x = 2")
+            + "diff --git a/new.py b/new.py\n--- /dev/null\n+++ b/new.py\n@@ -0,0 +1 @@\n+y = 1\n"
+            + "diff --git a/old.py b/moved.py\n--- a/old.py\n+++ b/moved.py\n@@ -1 +1 @@\n-z\n+--- a/not_a_header.py\n"
+        )
+
+        # When
+        files = feedback_loop._get_changed_files_from_diff(diff_text)
+
+        # Then
+        assert files == {"a.py", "new.py", "old.py", "moved.py"}
+
+
+class FakeClaudeClient:
+    """Stand-in for ClaudeSDKClient replaying a scripted session."""
+
+    script = []
+    received = []
+
+    def __init__(self, options):
+        self.options = options
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def query(self, prompt):
+        pass
+
+    async def receive_response(self):
+        for message in self.script:
+            self.received.append(message)
+            yield message
+
+
+class TestFixSingleIssue:
+    """Tests for a single fix session (agent SDK faked)."""
+
+    async def test_session_ends_after_successful_edit(self, monkeypatch, tmp_path):
+        """Given a confirmed Edit, should stop without waiting for the closing commentary."""
+        # Given
+        script = [
+            AssistantMessage(content=[ToolUseBlock(id="t1", name="Edit", input={})], model="m"),
+            UserMessage(content=[ToolResultBlock(tool_use_id="t1", content="ok", is_error=False)]),
+            AssistantMessage(content=[TextBlock(text="I fixed the issue by ...")], model="m"),
+        ]
+        monkeypatch.setattr(FakeClaudeClient, "script", script)
+        monkeypatch.setattr(FakeClaudeClient, "received", [])
+        monkeypatch.setattr(feedback_loop, "ClaudeSDKClient", FakeClaudeClient)
+
+        # When
+        fixed = await feedback_loop._fix_single_issue(_issue("a.py"), str(tmp_path))
+
+        # Then
+        assert fixed
+        assert FakeClaudeClient.received == script[:2]
+
+    async def test_failed_edit_keeps_session_going(self, monkeypatch, tmp_path):
+        """Given an Edit that errored, should keep reading so the model can retry."""
+        # Given
+        script = [
+            AssistantMessage(content=[ToolUseBlock(id="t1", name="Edit", input={})], model="m"),
+            UserMessage(content=[ToolResultBlock(tool_use_id="t1", content="no match", is_error=True)]),
+            AssistantMessage(content=[TextBlock(text="Could not apply the change")], model="m"),
+        ]
+        monkeypatch.setattr(FakeClaudeClient, "script", script)
+        monkeypatch.setattr(FakeClaudeClient, "received", [])
+        monkeypatch.setattr(feedback_loop, "ClaudeSDKClient", FakeClaudeClient)
+
+        # When
+        await feedback_loop._fix_single_issue(_issue("a.py"), str(tmp_path))
+
+        # Then
+        assert FakeClaudeClient.received == script
+
+
+class TestRunFeedbackLoop:
+    """Tests for the loop's iteration logic (GitHub, git and LLM faked)."""
+
+    async def test_unchanged_files_are_not_reanalyzed(self, fake_loop, monkeypatch, tmp_path):
+        """Given a file whose diff did not change, should carry its issues forward instead of re-identifying."""
+        # Given - the fix for a.py lands, b.py stays as it was
+        monkeypatch.setattr(FakeGitHubTool, "diffs", [
+            _file_diff("a.py", "x = 2") + _file_diff("b.py", "y = 2"),
+            _file_diff("a.py", "x = 3") + _file_diff("b.py", "y = 2"),
+        ])
+        config = feedback_loop.LoopConfig(max_iterations=2, auto_merge=False, working_dir=str(tmp_path))
+
+        # When
+        result, statuses = await feedback_loop.run_feedback_loop("octo/repo", 1, config)
+
+        # Then - iteration 2 only sent a.py to the LLM; b.py's issue reappeared unfixed
+        assert "### File: b.py" not in fake_loop["identify"][1]
+        assert "### File: a.py" in fake_loop["identify"][1]
+        assert fake_loop["validate"] == [["a.py", "b.py"], ["a.py"]]
+        assert statuses[1].issues_found == 2
+        assert statuses[1].issues_skipped == 1
+
+    async def test_identical_diff_is_not_reparsed(self, fake_loop, monkeypatch, tmp_path):
+        """Given the same diff in consecutive iterations, should parse it only once."""
+        # Given
+        diff_text = _file_diff("a.py", "x = 2")
+        monkeypatch.setattr(FakeGitHubTool, "diffs", [diff_text, diff_text])
+        parsed = []
+        real_parse = feedback_loop._diff_sections
+
+        def diff_sections(file_diffs):
+            parsed.append(file_diffs)
+            return real_parse(file_diffs)
+
+        monkeypatch.setattr(feedback_loop, "_diff_sections", diff_sections)
+        config = feedback_loop.LoopConfig(max_iterations=2, auto_merge=False, working_dir=str(tmp_path))
+
+        # When
+        _, statuses = await feedback_loop.run_feedback_loop("octo/repo", 1, config)
+
+        # Then - iteration 2 reused the sections and re-identified nothing
+        assert len(statuses) == 2
+        assert len(parsed) == 1
+        assert len(fake_loop["identify"]) == 1
+
+    async def test_diff_is_fetched_while_pulling(self, fake_loop, monkeypatch, tmp_path):
+        """Given a slow git pull, should fetch the GitHub diff without waiting for it."""
+        # Given
+        events = []
+
+        async def pull_latest(working_dir):
+            await asyncio.sleep(0.05)
+            events.append("pulled")
+            return True
+
+        def get_diff(self):
+            events.append("diff")
+            return ""
+
+        monkeypatch.setattr(feedback_loop, "_pull_latest", pull_latest)
+        monkeypatch.setattr(FakeGitHubTool, "get_diff", get_diff)
+        config = feedback_loop.LoopConfig(max_iterations=1, auto_merge=False, working_dir=str(tmp_path))
+
+        # When
+        result, _ = await feedback_loop.run_feedback_loop("octo/repo", 1, config)
+
+        # Then
+        assert events == ["diff", "pulled"]
+        assert result == feedback_loop.LoopResult.READY_TO_MERGE
+
+    async def test_large_diffs_are_identified_in_batches(self, fake_loop, monkeypatch, tmp_path):
+        """Given files exceeding one Stage 1 batch, should split them across calls."""
+        # Given
+        long_line = "x = " + "1" * stage1_identify.DEFAULT_BATCH_CHARS
+        monkeypatch.setattr(FakeGitHubTool, "diffs", [
+            _file_diff("a.py", long_line) + _file_diff("b.py", "y = 2"),
+        ])
+        config = feedback_loop.LoopConfig(max_iterations=1, auto_merge=False, working_dir=str(tmp_path))
+
+        # When
+        await feedback_loop.run_feedback_loop("octo/repo", 1, config)
+
+        # Then
+        assert len(fake_loop["identify"]) == 2
+        assert fake_loop["validate"] == [["a.py", "b.py"]]
+
+
+class TestFixIssuesBatch:
+    """Tests for concurrent issue fixing (fix sessions faked)."""
+
+    async def test_files_fixed_in_parallel_but_never_concurrently(self, monkeypatch, tmp_path):
+        """Given issues in two files, should fix the files in parallel and each file serially."""
+        # Given
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("x = 1\n")
+        active = []
+        peak = 0
+
+        async def fix_single_issue(issue, working_dir):
+            nonlocal peak
+            file_path = issue.issue.file_path
+            assert file_path not in active
+            active.append(file_path)
+            peak = max(peak, len(active))
+            await asyncio.sleep(0.01)
+            path = tmp_path / file_path
+            path.write_text(path.read_text() + "# fixed\n")
+            active.remove(file_path)
+            return True
+
+        monkeypatch.setattr(feedback_loop, "_fix_single_issue", fix_single_issue)
+        issues = [_issue("a.py", "first"), _issue("a.py", "second"), _issue("b.py")]
+        attempted = set()
+
+        # When
+        results = await feedback_loop._fix_issues_batch(issues, attempted, str(tmp_path))
+
+        # Then
+        assert peak == 2
+        assert [r.file_path for r in results] == ["a.py", "a.py", "b.py"]
+        assert all(r.success and r.changes_made for r in results)
+        assert (tmp_path / "a.py").read_text().count("# fixed") == 2
+        assert len(attempted) == 3
+
+    async def test_duplicate_issues_share_one_fix(self, monkeypatch, tmp_path):
+        """Given the same issue twice, should run a single fix session."""
+        # Given
+        (tmp_path / "a.py").write_text("x = 1\n")
+        fixed = []
+
+        async def fix_single_issue(issue, working_dir):
+            fixed.append(issue)
+            (tmp_path / "a.py").write_text("x = 2\n")
+            return True
+
+        monkeypatch.setattr(feedback_loop, "_fix_single_issue", fix_single_issue)
+        issues = [_issue("a.py"), _issue("a.py"), _issue("a.py", "other")]
+
+        # When
+        results = await feedback_loop._fix_issues_batch(issues, set(), str(tmp_path))
+
+        # Then
+        assert fixed == [issues[0], issues[2]]
+        assert len(results) == 2
+
+    async def test_rewrite_with_same_content_is_not_a_change(self, monkeypatch, tmp_path):
+        """Given a fix that rewrites the file unchanged, should report no changes made."""
+        # Given
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+
+        async def fix_single_issue(issue, working_dir):
+            path.write_text("x = 1\n")
+            os.utime(path, ns=(0, 0))
+            return True
+
+        monkeypatch.setattr(feedback_loop, "_fix_single_issue", fix_single_issue)
+
+        # When
+        results = await feedback_loop._fix_issues_batch([_issue("a.py")], set(), str(tmp_path))
+
+        # Then
+        assert results[0].success
+        assert not results[0].changes_made
+
+    async def test_missing_file_is_reported(self, tmp_path):
+        """Given an issue in a file that does not exist, should fail without a fix session."""
+        # When
+        results = await feedback_loop._fix_issues_batch([_issue("gone.py")], set(), str(tmp_path))
+
+        # Then
+        assert results[0].error == "File not found"
+        assert not results[0].success
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def clone(tmp_path):
+    """A working clone with one commit, tracking a local bare remote."""
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    _git(tmp_path, "clone", "-q", str(remote), str(work))
+    _git(work, "config", "user.email", "bot@example.com")
+    _git(work, "config", "user.name", "bot")
+    (work / "a.py").write_text("x = 1\n")
+    _git(work, "add", "a.py")
+    _git(work, "commit", "-q", "-m", "init")
+    _git(work, "push", "-q", "-u", "origin", "HEAD")
+    return work
+
+
+class TestCommitAndPush:
+    """Tests for committing and pushing fixes against a local remote."""
+
+    async def test_commits_and_pushes_fixed_files(self, clone):
+        """Given a fixed file, should push a commit and return its SHA."""
+        # Given
+        (clone / "a.py").write_text("x = 2\n")
+
+        # When
+        sha = await feedback_loop._commit_and_push("fix: ", 1, ["a.py"], str(clone))
+
+        # Then
+        assert sha == _git(clone, "rev-parse", "HEAD")
+        assert sha == _git(clone.parent / "remote.git", "rev-parse", _git(clone, "branch", "--show-current"))
+        assert _git(clone, "log", "-1", "--format=%s") == "fix: Auto-fix issues (iteration 1)"
+
+    async def test_clean_tree_makes_no_commit(self, clone):
+        """Given no changes, should return None without committing."""
+        # Given
+        head = _git(clone, "rev-parse", "HEAD")
+
+        # When
+        sha = await feedback_loop._commit_and_push("fix: ", 1, [], str(clone))
+
+        # Then
+        assert sha is None
+        assert _git(clone, "rev-parse", "HEAD") == head
+
+    async def test_unchanged_fixed_file_makes_no_commit(self, clone):
+        """Given fixed files that did not change, should return None without committing."""
+        # Given
+        head = _git(clone, "rev-parse", "HEAD")
+
+        # When
+        sha = await feedback_loop._commit_and_push("fix: ", 1, ["a.py"], str(clone))
+
+        # Then
+        assert sha is None
+        assert _git(clone, "rev-parse", "HEAD") == head
+
+    async def test_stray_edits_are_left_uncommitted(self, clone, capsys):
+        """Given changes outside the fixed files, should commit only the fixed files and warn."""
+        # Given
+        (clone / "a.py").write_text("x = 2\n")
+        (clone / "new_test.py").write_text("def test(): pass\n")
+        (clone / "notes.txt").write_text("unrelated\n")
+
+        # When
+        sha = await feedback_loop._commit_and_push("fix: ", 1, ["a.py", "new_test.py"], str(clone))
+
+        # Then
+        assert sha == _git(clone, "rev-parse", "HEAD")
+        assert _git(clone, "show", "--name-only", "--format=", "HEAD").split() == ["a.py", "new_test.py"]
+        assert _git(clone, "status", "--porcelain") == "?? notes.txt"
+        assert "notes.txt" in capsys.readouterr().out
+
+
+class TestLocalDiff:
+    """Tests for diffing the checkout against the base branch."""
+
+    async def test_ignores_end_of_line_whitespace(self, clone):
+        """Given a branch with a real change and a trailing-space change, should diff only the real one."""
+        # Given
+        base = "origin/" + _git(clone, "branch", "--show-current")
+        (clone / "b.py").write_text("y = 1\n")
+        _git(clone, "add", "b.py")
+        _git(clone, "commit", "-q", "-m", "add b")
+        _git(clone, "push", "-q")
+        _git(clone, "checkout", "-q", "-b", "feature")
+        (clone / "a.py").write_text("x = 2\n")
+        (clone / "b.py").write_text("y = 1\r\n")
+        _git(clone, "commit", "-q", "-am", "change")
+
+        # When
+        diff_text = await feedback_loop._local_diff(base, str(clone))
+
+        # Then
+        assert [fd.new_path for fd in parse_pr_diff(diff_text)] == ["a.py"]
+        assert "+x = 2" in diff_text
+
+
+class TestRunTests:
+    """Tests for running the project's test command."""
+
+    async def test_failure_prints_last_lines_of_output(self, tmp_path, capsys):
+        """Given a failing command with long output, should report only its last lines."""
+        # Given
+        command = "for i in $(seq 1 5000); do echo line$i; done; echo oops >&2; exit 1"
+
+        # When
+        passed = await feedback_loop._run_tests(command, str(tmp_path))
+
+        # Then
+        out = capsys.readouterr().out
+        assert not passed
+        assert "line4992" in out and "oops" in out
+        assert "line4991" not in out
+
+    async def test_passing_command(self, tmp_path):
+        """Given a succeeding command, should report success."""
+        assert await feedback_loop._run_tests("echo ok", str(tmp_path))
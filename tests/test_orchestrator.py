@@ -6,12 +6,77 @@ Following the testing philosophy from CLAUDE.md:
 - Minimal mocking (only external APIs)
 """
 
-import pytest
+import asyncio
+import json
+import threading
+import time
 from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
 
-from review_agent.models import PRNode, PRStatus, OrchestratorConfig, OrchestrationPlan
+from review_agent.models import PRNode, PRStatus, OrchestratorConfig, OrchestrationPlan, MergeResult
 from review_agent.orchestrator.dependency import DependencyAnalyzer
 from review_agent.orchestrator.conflict import ConflictPredictor
+from review_agent.orchestrator import orchestrator as orchestrator_module
+from review_agent.orchestrator import merge as merge_module
+from review_agent.orchestrator.merge import MergeExecutor
+from review_agent.orchestrator.index import PRIndex
+
+
+class FakeRequester:
+    """Stand-in for PyGithub's Requester, answering GraphQL with a handler."""
+
+    graphql_url = "https://api.github.com/graphql"
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def graphql_query(self, query, variables):
+        return self.handler(query, variables)
+
+    def requestJson(self, verb, url, input=None, **kwargs):
+        headers, data = self.handler(input["query"], input["variables"])
+        return 200, headers, json.dumps(data)
+
+
+class FakeRepo:
+    """Stand-in for the GitHub repository API with a fixed per-call latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = []
+        self.contexts = []  # statusCheckRollup contexts of every commit
+        self.lock = threading.Lock()
+
+    def _call(self, name, *args):
+        with self.lock:
+            self.calls.append((name, *args))
+        time.sleep(self.latency)
+
+    def get_pull(self, pr_number):
+        self._call("get_pull", pr_number)
+        return SimpleNamespace(
+            number=pr_number,
+            title=f"PR {pr_number}",
+            merged=False,
+            mergeable=True,
+            mergeable_state="clean",
+            head=SimpleNamespace(sha=f"sha{pr_number}", ref=f"branch{pr_number}"),
+            merge=lambda **kwargs: SimpleNamespace(sha=f"merge{pr_number}"),
+        )
+
+    owner = SimpleNamespace(login="octo")
+    name = "repo"
+
+    @property
+    def requester(self):
+        return FakeRequester(self.graphql_query)
+
+    def graphql_query(self, query, variables):
+        self._call("graphql", variables["sha"])
+        rollup = {"state": "SUCCESS", "contexts": {"nodes": self.contexts}}
+        return {}, {"data": {"repository": {"object": {"statusCheckRollup": rollup}}}}
 
 
 class TestDependencyAnalyzer:
@@ -97,6 +162,61 @@ class TestDependencyAnalyzer:
         assert set(groups[0]) == {1, 3}
         assert set(groups[1]) == {2}
 
+    def test_analyze_all_returns_order_and_groups(self):
+        """Given a dependency chain, should return both outputs from one analysis."""
+        # Given - PR 3 depends on PR 1 explicitly
+        prs = [
+            PRNode(pr_number=3, branch="feature-c", base="main", depends_on=[1]),
+            PRNode(pr_number=1, branch="feature-a", base="main"),
+            PRNode(pr_number=2, branch="feature-b", base="main"),
+        ]
+
+        # When
+        analyzer = DependencyAnalyzer()
+        order, groups = analyzer.analyze_all(prs)
+
+        # Then
+        assert order == [1, 2, 3]
+        assert groups == [[1, 2], [3]]
+        assert analyzer.topological_sort(prs) == order
+        assert analyzer.get_parallel_groups(prs) == groups
+
+    def test_analyze_all_recomputes_when_dependencies_change(self):
+        """Given a PR whose dependencies change, should not return the cached plan."""
+        # Given
+        prs = [
+            PRNode(pr_number=1, branch="feature-a", base="main"),
+            PRNode(pr_number=2, branch="feature-b", base="main"),
+        ]
+        analyzer = DependencyAnalyzer()
+        assert analyzer.get_parallel_groups(prs) == [[1, 2]]
+
+        # When
+        prs[0].depends_on.add(2)
+
+        # Then
+        assert analyzer.topological_sort(prs) == [2, 1]
+        assert analyzer.get_parallel_groups(prs) == [[2], [1]]
+
+    def test_compute_blocked_matches_per_pr_checks(self):
+        """Given a partially merged chain, the bulk blocked set should match is_blocked."""
+        # Given
+        prs = [
+            PRNode(pr_number=1, branch="feature-a", base="main"),
+            PRNode(pr_number=2, branch="feature-b", base="feature-a"),
+            PRNode(pr_number=3, branch="feature-c", base="feature-b"),
+            PRNode(pr_number=4, branch="feature-d", base="main", depends_on=[1, 3]),
+        ]
+        analyzer = DependencyAnalyzer()
+        analyzer.build_dependency_graph(prs)
+
+        # When
+        blocked = analyzer.compute_blocked({1})
+
+        # Then
+        assert blocked == {3, 4}
+        assert blocked == {pr.pr_number for pr in prs if analyzer.is_blocked(pr.pr_number, {1})}
+
 
 class TestConflictPredictor:
     """Tests for conflict prediction."""
@@ -133,6 +253,45 @@ class TestConflictPredictor:
         assert has_conflict is True
         assert "shared.py" in files
 
+    def test_predict_conflicts_exact_despite_signature_collisions(self):
+        """Given large PRs whose file signatures collide, should still report exact overlap."""
+        # Given - 100 files each saturate most of the 64 signature bits
+        prs = [
+            PRNode(pr_number=1, branch="a", base="main", changed_files=[f"a/{i}.py" for i in range(100)]),
+            PRNode(pr_number=2, branch="b", base="main", changed_files=[f"b/{i}.py" for i in range(100)]),
+            PRNode(pr_number=3, branch="c", base="main", changed_files=["c.py", "a/7.py"]),
+        ]
+
+        # When
+        predictor = ConflictPredictor()
+
+        # Then
+        assert predictor.predict_conflicts(1, 2, prs) == (False, [])
+        assert predictor.predict_conflicts(1, 3, prs) == (True, ["a/7.py"])
+        assert predictor.predict_conflicts(2, 3, prs) == (False, [])
+
+    def test_predict_conflicts_reanalyzes_new_pr_list(self):
+        """Given a different PR list on a later call, should not reuse stale file sets."""
+        # Given
+        predictor = ConflictPredictor()
+        first = [
+            PRNode(pr_number=1, branch="a", base="main", changed_files=["a.py"]),
+            PRNode(pr_number=2, branch="b", base="main", changed_files=["b.py"]),
+        ]
+        second = [
+            PRNode(pr_number=1, branch="a", base="main", changed_files=["a.py"]),
+            PRNode(pr_number=2, branch="b", base="main", changed_files=["a.py"]),
+        ]
+
+        # When
+        before, _ = predictor.predict_conflicts(1, 2, first)
+        after, files = predictor.predict_conflicts(1, 2, second)
+
+        # Then
+        assert before is False
+        assert after is True
+        assert files == ["a.py"]
+
     def test_get_all_conflict_pairs(self):
         """Given multiple PRs, should find all conflict pairs."""
         # Given - PR 1 & 2 conflict on shared.py, PR 2 & 3 conflict on other.py
@@ -152,6 +311,56 @@ class TestConflictPredictor:
         assert (1, 2) in pr_pairs
         assert (2, 3) in pr_pairs
 
+    def test_conflict_pair_lists_every_shared_file(self):
+        """Given PRs overlapping on several files, should report one pair with all files."""
+        # Given
+        prs = [
+            PRNode(pr_number=5, branch="a", base="main", changed_files=["x.py", "y.py", "z.py"]),
+            PRNode(pr_number=4, branch="b", base="main", changed_files=["y.py", "x.py"]),
+        ]
+
+        # When
+        conflicts = ConflictPredictor().get_all_conflict_pairs(prs)
+
+        # Then
+        assert len(conflicts) == 1
+        pr_a, pr_b, files = conflicts[0]
+        assert (pr_a, pr_b) == (4, 5)
+        assert sorted(files) == ["x.py", "y.py"]
+
+    def test_conflict_groups_are_transitive_on_long_chains(self):
+        """Given a long chain of pairwise overlaps, should form a single group."""
+        # Given - PR i and PR i+1 share file i
+        n = 3000
+        prs = [
+            PRNode(pr_number=i, branch=f"b{i}", base="main", changed_files=[f"f{i - 1}.py", f"f{i}.py"])
+            for i in range(n)
+        ]
+
+        # When
+        predictor = ConflictPredictor()
+        predictor.analyze(prs)
+        groups = predictor._find_conflict_groups(prs)
+
+        # Then
+        assert len(groups) == 1
+        assert sorted(groups[0]) == list(range(n))
+
+    def test_get_prs_by_dir_covers_nested_files(self):
+        """Given files in nested directories, should index every ancestor directory."""
+        # Given
+        prs = [
+            PRNode(pr_number=1, branch="a", base="main", changed_files=["src/api/routes.py"]),
+            PRNode(pr_number=2, branch="b", base="main", changed_files=["src/db.py", "README.md"]),
+        ]
+        predictor = ConflictPredictor()
+        predictor.analyze(prs)
+
+        # Then
+        assert predictor.get_prs_by_dir("src") == {1, 2}
+        assert predictor.get_prs_by_dir("src/api/") == {1}
+        assert predictor.get_prs_by_dir("docs") == set()
+
     def test_conflict_free_order_respects_creation_time(self):
         """Given conflicting PRs, should order by creation time within conflict groups."""
         # Given - two PRs touching same file, older should come first
@@ -171,6 +380,27 @@ class TestConflictPredictor:
         assert order[0] == 1
         assert order[1] == 2
 
+    def test_shared_index_feeds_both_analyzers(self):
+        """Given one PRIndex, dependency and conflict analysis should agree with a fresh scan."""
+        # Given
+        prs = [
+            PRNode(pr_number=1, branch="feature-a", base="main", changed_files=["shared.py"]),
+            PRNode(pr_number=2, branch="feature-b", base="feature-a", changed_files=["shared.py", "b.py"]),
+            PRNode(pr_number=3, branch="feature-c", base="main", changed_files=["c.py"]),
+        ]
+        index = PRIndex.build(prs)
+
+        # When
+        order = DependencyAnalyzer().topological_sort(prs, index)
+        predictor = ConflictPredictor()
+        predictor.analyze(prs, index)
+
+        # Then
+        assert order == DependencyAnalyzer().topological_sort(prs)
+        assert index.branch_map["feature-a"] == 1
+        assert predictor.get_prs_by_file("shared.py") == {1, 2}
+        assert predictor.get_all_conflict_pairs(prs) == [(1, 2, ["shared.py"])]
+
 
 class TestPRModels:
     """Tests for PR data models."""
@@ -220,3 +450,453 @@ class TestOrchestratorConfig:
         assert config.auto_merge is False
         assert config.max_parallel_reviews == 5
         assert config.require_review_pass is True
+
+
+class TestMergeExecutor:
+    """Tests for merge readiness checks (GitHub API faked)."""
+
+    async def test_dry_run_checks_prs_concurrently(self):
+        """Given several PRs, dry run should overlap their API calls and keep order."""
+        # Given
+        repo = FakeRepo(latency=0.1)
+        executor = MergeExecutor(repo, OrchestratorConfig(max_parallel_reviews=10))
+
+        # When
+        start = time.perf_counter()
+        statuses = await executor.dry_run([3, 1, 2, 5, 4])
+        elapsed = time.perf_counter() - start
+
+        # Then - 10 sequential calls would take ~1s
+        assert [s["pr_number"] for s in statuses] == [3, 1, 2, 5, 4]
+        assert all(s["ready"] for s in statuses)
+        assert elapsed < 0.6
+
+    async def test_dry_run_fetches_each_pull_request_once(self):
+        """Given several PRs, dry run should share one PR fetch between both checks."""
+        # Given
+        repo = FakeRepo()
+        executor = MergeExecutor(repo, OrchestratorConfig())
+
+        # When
+        await executor.dry_run([1, 2])
+
+        # Then
+        assert sorted(c for c in repo.calls if c[0] == "get_pull") == [("get_pull", 1), ("get_pull", 2)]
+
+    async def test_merge_fetches_pull_request_once(self):
+        """Given a mergeable PR, merge should reuse one PR fetch for all checks."""
+        # Given
+        repo = FakeRepo()
+        executor = MergeExecutor(repo, OrchestratorConfig(delete_branch_after_merge=False))
+
+        # When
+        result = await executor.merge(7)
+
+        # Then
+        assert result.success is True
+        assert result.commit_sha == "merge7"
+        assert [c for c in repo.calls if c[0] == "get_pull"] == [("get_pull", 7)]
+
+    async def test_mergeable_poll_backs_off_from_short_delay(self):
+        """Given mergeability computed shortly after fetch, should resolve well under a second."""
+        # Given
+        repo = FakeRepo()
+        pr = repo.get_pull(7)
+        pr.mergeable = None
+        refreshes = []
+
+        def update():
+            refreshes.append(time.perf_counter())
+            if len(refreshes) == 2:
+                pr.mergeable = True
+
+        pr.update = update
+        executor = MergeExecutor(repo, OrchestratorConfig())
+
+        # When
+        start = time.perf_counter()
+        ok, reason = await executor.check_mergeable(7, {7: pr})
+        elapsed = time.perf_counter() - start
+
+        # Then - 0.1s + 0.2s of backoff, refreshing the same object in place
+        assert (ok, reason) == (True, "OK")
+        assert len(refreshes) == 2
+        assert elapsed < 0.6
+
+    async def test_ci_status_uses_one_rollup_query(self):
+        """Given a failing status and a running check, should report from one query."""
+        # Given
+        repo = FakeRepo()
+        executor = MergeExecutor(repo, OrchestratorConfig())
+        pulls = {7: repo.get_pull(7)}
+
+        # When
+        repo.contexts = [
+            {"__typename": "StatusContext", "context": "lint", "state": "FAILURE"},
+            {"__typename": "CheckRun", "name": "tests", "status": "IN_PROGRESS", "conclusion": None},
+        ]
+        failed = await executor.check_ci_status(7, pulls)
+        repo.contexts = repo.contexts[1:]
+        running = await executor.check_ci_status(7, pulls)
+
+        # Then
+        assert failed == (False, "CI checks failed: lint")
+        assert running == (False, "Check 'tests' still running")
+        assert [c for c in repo.calls if c[0] == "graphql"] == [("graphql", "sha7")] * 2
+
+    async def test_merge_plan_overlaps_independent_prs(self):
+        """Given one group of independent PRs, should merge them concurrently."""
+        # Given
+        repo = FakeRepo(latency=0.15)
+        config = OrchestratorConfig(max_parallel_merges=3, delete_branch_after_merge=False)
+        executor = MergeExecutor(repo, config)
+
+        # When
+        start = time.perf_counter()
+        results = await executor.execute_merge_plan([1, 2, 3], parallel_groups=[[1, 2, 3]])
+        elapsed = time.perf_counter() - start
+
+        # Then - merging one at a time would take ~0.9s
+        assert [r.pr_number for r in results] == [1, 2, 3]
+        assert all(r.success for r in results)
+        assert elapsed < 0.6
+
+    async def test_merge_plan_stops_after_failure(self):
+        """Given a failing PR in a sequential plan, should not merge later PRs."""
+        # Given
+        repo = FakeRepo()
+        get_pull = repo.get_pull
+
+        def failing_get_pull(pr_number):
+            pr = get_pull(pr_number)
+            pr.mergeable = pr_number != 1
+            return pr
+
+        repo.get_pull = failing_get_pull
+        executor = MergeExecutor(repo, OrchestratorConfig(auto_rebase_on_conflict=False))
+
+        # When
+        results = await executor.execute_merge_plan([1, 2], parallel_groups=[[1], [2]])
+
+        # Then
+        assert [(r.pr_number, r.success) for r in results] == [(1, False)]
+
+    async def test_api_calls_are_bounded_across_checks(self):
+        """Given many concurrent checks, in-flight API calls should stay under the limit."""
+        # Given
+        repo = FakeRepo(latency=0.02)
+        in_flight = 0
+        peak = 0
+        call = repo._call
+
+        def tracked_call(name, *args):
+            nonlocal in_flight, peak
+            with repo.lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                call(name, *args)
+            finally:
+                with repo.lock:
+                    in_flight -= 1
+
+        repo._call = tracked_call
+        executor = MergeExecutor(repo, OrchestratorConfig(max_parallel_reviews=3))
+
+        # When
+        statuses = await executor.dry_run(list(range(1, 11)))
+
+        # Then
+        assert all(s["ready"] for s in statuses)
+        assert peak == 3
+
+
+def _make_orchestrator(monkeypatch, repo=None, **config):
+    """Create a PROrchestrator whose GitHub client returns repo."""
+    monkeypatch.setattr(
+        orchestrator_module, "Github",
+        lambda token: SimpleNamespace(get_repo=lambda name: repo)
+    )
+    return orchestrator_module.PROrchestrator(
+        "octo/repo", token="t", config=OrchestratorConfig(**config)
+    )
+
+
+class TestLoadOpenPRs:
+    """Tests for loading the PR queue (GitHub GraphQL API faked)."""
+
+    @staticmethod
+    def _page(nodes, cursor=None):
+        return {"hasNextPage": cursor is not None, "endCursor": cursor}, nodes
+
+    async def test_pages_prs_and_overflow_files(self, monkeypatch):
+        """Given two pages of PRs and a PR with many files, should load every PR and file."""
+        # Given
+        queries = []
+
+        def pr(number, paths, files_cursor=None):
+            page_info, nodes = self._page([{"path": p} for p in paths], files_cursor)
+            return {
+                "number": number,
+                "headRefName": f"feature-{number}",
+                "headRefOid": f"sha{number}",
+                "baseRefName": "main",
+                "createdAt": "2024-01-0%dT00:00:00Z" % number,
+                "updatedAt": "2024-02-01T00:00:00Z",
+                "files": {"pageInfo": page_info, "nodes": nodes},
+            }
+
+        def graphql_query(query, variables):
+            queries.append(variables)
+            if "pullRequests(" in query:
+                if variables["cursor"] is None:
+                    page_info, nodes = self._page([pr(2, ["a.py"], files_cursor="f1")], "p1")
+                else:
+                    page_info, nodes = self._page([pr(1, ["b.py"])])
+                repository = {"pullRequests": {"pageInfo": page_info, "nodes": nodes}}
+            else:
+                page_info, nodes = self._page([{"path": "c.py"}])
+                repository = {"pullRequest": {"files": {"pageInfo": page_info, "nodes": nodes}}}
+            return {}, {"data": {"repository": repository}}
+
+        repo = SimpleNamespace(
+            owner=SimpleNamespace(login="octo"),
+            name="repo",
+            requester=FakeRequester(graphql_query),
+        )
+        orchestrator = _make_orchestrator(monkeypatch, repo)
+
+        # When
+        prs = await orchestrator.load_open_prs()
+
+        # Then - 2 PR pages + 1 overflow files page
+        assert [(p.pr_number, p.branch, p.changed_files) for p in prs] == [
+            (2, "feature-2", ["a.py", "c.py"]),
+            (1, "feature-1", ["b.py"]),
+        ]
+        assert prs[1].created_at.day == 1
+        assert len(queries) == 3
+        assert {"owner": "octo", "name": "repo", "number": 2, "cursor": "f1"} in queries
+
+        # When - reloading with unchanged heads
+        queries.clear()
+        reloaded = await orchestrator.load_open_prs()
+
+        # Then - known file lists are reused, no overflow page is fetched
+        assert [p.changed_files for p in reloaded] == [["a.py", "c.py"], ["b.py"]]
+        assert len(queries) == 2
+
+
+class TestExecutePlan:
+    """Tests for plan execution (reviews faked)."""
+
+    async def test_next_group_starts_while_previous_finishes(self, monkeypatch):
+        """Given a slow PR in the first group, a free worker should start the next group."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch, max_parallel_reviews=2)
+        events = []
+        durations = {1: 0.1, 2: 0.01, 3: 0.01}
+
+        async def review_pr(pr_number, config=None):
+            events.append(("start", pr_number))
+            await asyncio.sleep(durations[pr_number])
+            events.append(("end", pr_number))
+            return {"status": "completed"}
+
+        monkeypatch.setattr(orchestrator, "review_pr", review_pr)
+        plan = OrchestrationPlan(pr_order=[1, 2, 3], parallel_groups=[[1, 2], [3]], conflict_pairs=[])
+
+        # When
+        results = await orchestrator.execute_plan(plan)
+
+        # Then - PR 3 ran alongside PR 1 instead of after it
+        assert events.index(("start", 3)) < events.index(("end", 1))
+        assert results["summary"]["passed"] == 3
+        assert orchestrator._review_workers == []
+
+    async def test_dependent_starts_when_its_dependency_finishes(self, monkeypatch):
+        """Given a PR depending only on a fast PR, it should not wait for the slow one."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch, max_parallel_reviews=3)
+        orchestrator.dependency_analyzer.build_dependency_graph([
+            PRNode(pr_number=1, branch="feature-a", base="main"),
+            PRNode(pr_number=2, branch="feature-b", base="main"),
+            PRNode(pr_number=3, branch="feature-c", base="feature-b"),
+        ])
+        events = []
+        durations = {1: 0.1, 2: 0.01, 3: 0.01}
+
+        async def review_pr(pr_number, config=None):
+            events.append(("start", pr_number))
+            await asyncio.sleep(durations[pr_number])
+            events.append(("end", pr_number))
+            return {"status": "completed"}
+
+        monkeypatch.setattr(orchestrator, "review_pr", review_pr)
+        plan = OrchestrationPlan(pr_order=[1, 2, 3], parallel_groups=[[1, 2], [3]], conflict_pairs=[])
+
+        # When
+        results = await orchestrator.execute_plan(plan)
+
+        # Then - PR 3 waited for PR 2 but not for PR 1
+        assert events.index(("end", 2)) < events.index(("start", 3)) < events.index(("end", 1))
+        assert list(results["reviews"]) == [1, 2, 3]
+        assert results["summary"]["passed"] == 3
+
+    async def test_conflicting_prs_in_one_group_merge_sequentially(self, monkeypatch):
+        """Given a conflicting pair in one dependency layer, should merge them one after the other."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch, auto_merge=True, max_parallel_merges=3)
+        monkeypatch.setattr(merge_module, "MERGE_SETTLE_DELAY", 0)
+        for pr_num in (1, 2, 3):
+            orchestrator._queue[pr_num] = PRNode(pr_number=pr_num, branch=f"b{pr_num}", base="main")
+        events = []
+
+        async def review_pr(pr_number, config=None):
+            orchestrator._set_status(orchestrator._queue[pr_number], PRStatus.REVIEW_PASSED)
+            return {"status": "completed"}
+
+        async def merge(pr_number):
+            events.append(("start", pr_number))
+            await asyncio.sleep(0.01)
+            events.append(("end", pr_number))
+            return MergeResult(pr_number=pr_number, success=True)
+
+        monkeypatch.setattr(orchestrator, "review_pr", review_pr)
+        monkeypatch.setattr(orchestrator.merge_executor, "merge", merge)
+        plan = OrchestrationPlan(
+            pr_order=[2, 1, 3],
+            parallel_groups=[[1, 2, 3]],
+            conflict_pairs=[(1, 2)],
+        )
+
+        # When
+        results = await orchestrator.execute_plan(plan, merge=True)
+
+        # Then - 2 (first in pr_order) and 3 merge together, 1 only after 2 is done
+        assert events.index(("start", 3)) < events.index(("end", 2))
+        assert events.index(("end", 2)) < events.index(("start", 1))
+        assert results["summary"]["merged"] == 3
+
+    async def test_analyzed_conflicts_merge_sequentially(self, monkeypatch):
+        """Given two PRs touching the same file, an analyzed plan should merge them one at a time."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch, auto_merge=True, max_parallel_merges=2)
+        monkeypatch.setattr(merge_module, "MERGE_SETTLE_DELAY", 0)
+        for pr_num in (1, 2):
+            orchestrator._queue[pr_num] = PRNode(
+                pr_number=pr_num, branch=f"b{pr_num}", base="main", changed_files=["shared.py"]
+            )
+        events = []
+
+        async def review_pr(pr_number, config=None):
+            orchestrator._set_status(orchestrator._queue[pr_number], PRStatus.REVIEW_PASSED)
+            return {"status": "completed"}
+
+        async def merge(pr_number):
+            events.append(("start", pr_number))
+            await asyncio.sleep(0.01)
+            events.append(("end", pr_number))
+            return MergeResult(pr_number=pr_number, success=True)
+
+        monkeypatch.setattr(orchestrator, "review_pr", review_pr)
+        monkeypatch.setattr(orchestrator.merge_executor, "merge", merge)
+        plan = await orchestrator.analyze()
+
+        # When
+        results = await orchestrator.execute_plan(plan, merge=True)
+
+        # Then
+        first, second = plan.pr_order
+        assert events == [("start", first), ("end", first), ("start", second), ("end", second)]
+        assert results["summary"]["merged"] == 2
+
+    async def test_dry_run_reports_readiness_in_plan_order(self, monkeypatch):
+        """Given loaded PRs, readiness checked alongside analysis should follow the plan order."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch, FakeRepo(latency=0.01))
+        prs = [
+            PRNode(pr_number=2, branch="feature-b", base="feature-a"),
+            PRNode(pr_number=1, branch="feature-a", base="main"),
+        ]
+
+        async def load_open_prs(base="main"):
+            orchestrator._queue = {pr.pr_number: pr for pr in prs}
+            return prs
+
+        monkeypatch.setattr(orchestrator, "load_open_prs", load_open_prs)
+
+        # When
+        result = await orchestrator.dry_run()
+
+        # Then
+        assert result["plan"]["order"] == [1, 2]
+        assert [s["pr_number"] for s in result["merge_readiness"]] == [1, 2]
+        assert all(s["ready"] for s in result["merge_readiness"])
+
+    async def test_failed_review_is_reported_per_pr(self, monkeypatch):
+        """Given a review that raises, the group should still report every PR."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch)
+
+        async def review_pr(pr_number, config=None):
+            if pr_number == 2:
+                raise RuntimeError("boom")
+            return {"status": "completed"}
+
+        monkeypatch.setattr(orchestrator, "review_pr", review_pr)
+
+        # When
+        results = await orchestrator.review_parallel_group([1, 2])
+
+        # Then
+        assert results[1] == {"status": "completed"}
+        assert results[2]["status"] == "error"
+        assert "boom" in results[2]["error"]
+
+
+class TestQueueStatus:
+    """Tests for the queue status view."""
+
+    async def test_view_is_reused_until_a_status_changes(self, monkeypatch):
+        """Given repeated polls, should reuse the view until a review changes a status."""
+        # Given
+        async def run_review(config):
+            return {"status": "completed"}
+
+        monkeypatch.setattr(orchestrator_module, "_run_review", run_review)
+        orchestrator = _make_orchestrator(monkeypatch)
+        orchestrator._queue[1] = PRNode(pr_number=1, branch="feature-a", base="main")
+        first = orchestrator.get_queue_status()
+
+        # When
+        second = orchestrator.get_queue_status()
+        await orchestrator.review_pr(1)
+        third = orchestrator.get_queue_status()
+
+        # Then
+        assert second is first
+        assert first[1]["status"] == "pending"
+        assert third[1]["status"] == "review_passed"
+        assert third[1]["review_result"] == {"status": "completed"}
+
+    async def test_conflicts_are_recorded_once_per_analysis(self, monkeypatch):
+        """Given repeated analysis, conflicts should be replaced, not accumulated."""
+        # Given
+        orchestrator = _make_orchestrator(monkeypatch)
+        for pr in [
+            PRNode(pr_number=3, branch="feature-c", base="main", changed_files=["a.py"]),
+            PRNode(pr_number=1, branch="feature-a", base="main", changed_files=["a.py"]),
+            PRNode(pr_number=2, branch="feature-b", base="main", changed_files=["a.py"], depends_on=[3, 1]),
+        ]:
+            orchestrator._queue[pr.pr_number] = pr
+
+        # When
+        await orchestrator.analyze()
+        await orchestrator.analyze()
+        status = orchestrator.get_queue_status()
+
+        # Then
+        assert orchestrator._queue[1].conflicts_with == {2, 3}
+        assert status[1]["conflicts_with"] == [2, 3]
+        assert status[2]["depends_on"] == [1, 3]
@@ -51,6 +51,44 @@ def test_logout():
         # Then
         assert test.test_count == 3
 
+    def test_generated_test_count_ignores_mentions_in_strings(self):
+        """Given 'def test_' inside comments or strings, should count only definitions."""
+        # Given
+        content = """
+# def test_commented_out(): pass
+HELP = "write def test_ functions"
+
+class TestAuth:
+    def test_login(self):
+        pass
+
+    async def test_logout(self):
+        pass
+"""
+        # When
+        test = GeneratedTest(
+            file_path="tests/test_auth.py",
+            content=content,
+            covers_functions=["login", "logout"],
+        )
+
+        # Then
+        assert test.test_count == 2
+
+    def test_generated_test_keeps_explicit_count(self):
+        """Given test_count passed to the constructor, should keep it."""
+        # When
+        test = GeneratedTest(
+            file_path="tests/test_auth.py",
+            content="def test_one():\n    pass\n",
+            covers_functions=["login"],
+            test_count=5,
+        )
+
+        # Then
+        assert test.test_count == 5
+        assert "test_count=5" in repr(test)
+
     def test_generated_test_default_type_is_unit(self):
         """Given no test_type specified, should default to unit."""
         # When
@@ -0,0 +1,765 @@
+"""Tests for the Phase 1 review pipeline helpers.
+
+Following the testing philosophy from CLAUDE.md:
+- Client-perspective behavior verification
+- Given-When-Then structure
+- Minimal mocking (only external APIs)
+"""
+
+import asyncio
+import sqlite3
+import sys
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from github import GithubException
+from github.Requester import Requester
+
+from review_agent import main
+from review_agent.config import ReviewConfig
+from review_agent.models import PotentialIssue, ValidatedIssue
+from review_agent.pipeline import stage1_identify, stage2_validate, would_report, filter_reportable_issues
+from review_agent.pipeline import fused_review
+from review_agent.tools import parse_pr_diff, format_hunks, iter_file_hunks
+from review_agent.tools import github_tool
+
+
+SAMPLE_DIFF = """diff --git a/app/a.py b/app/a.py
+--- a/app/a.py
++++ b/app/a.py
+@@ -1,2 +1,2 @@
+ import os
+-x = 1
++x = 2
+diff --git a/app/b.py b/app/b.py
+new file mode 100644
+--- a/app/b.py
++++ b/app/b.py
+@@ -0,0 +1,2 @@
++def run():
++    return 1
+"""
+
+
+def _issue(file_path: str) -> PotentialIssue:
+    return PotentialIssue(
+        file_path=file_path,
+        line_start=1,
+        line_end=1,
+        issue_type="bug",
+        severity="high",
+        description="Something is wrong",
+        code_snippet="x = 2",
+    )
+
+
+class TestPotentialIssue:
+    """Tests for PotentialIssue normalization."""
+
+    def test_severity_and_type_are_canonicalized(self):
+        """Given mixed-case fields, should store lowercase interned strings."""
+        # When
+        issue = PotentialIssue("a.py", 1, 1, "Bug", "HIGH", "desc", "x")
+
+        # Then
+        assert issue.severity == "high"
+        assert issue.issue_type == "bug"
+        assert issue.severity is sys.intern("high")
+
+
+class TestDiffFormatting:
+    """Tests for diff parsing and hunk formatting."""
+
+    def test_iter_file_hunks_yields_one_chunk_per_file(self):
+        """Given a two-file diff, should yield one formatted chunk per file."""
+        # Given
+        file_diffs = parse_pr_diff(SAMPLE_DIFF)
+
+        # When
+        chunks = list(iter_file_hunks(file_diffs))
+
+        # Then
+        assert len(chunks) == 2
+        assert "### File: app/a.py" in chunks[0]
+        assert "### File: app/b.py (NEW FILE)" in chunks[1]
+
+    def test_format_hunks_joins_file_chunks(self):
+        """Formatted hunks should be the per-file chunks joined together."""
+        # Given
+        file_diffs = parse_pr_diff(SAMPLE_DIFF)
+
+        # Then
+        assert format_hunks(file_diffs) == "\n".join(iter_file_hunks(file_diffs))
+        assert format_hunks([]) == "No changes found."
+
+    def test_parse_is_memoized_by_content(self):
+        """Given the same diff text twice, should reuse the parsed files."""
+        # When
+        first = parse_pr_diff(SAMPLE_DIFF)
+        second = parse_pr_diff(SAMPLE_DIFF)
+
+        # Then
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+
+class TestIdentifyIssuesStream:
+    """Tests for batched Stage 1 dispatch."""
+
+    @pytest.fixture
+    def fake_identify(self, monkeypatch):
+        """Replace the LLM call with one issue per batch."""
+        batches = []
+
+        async def identify_issues(hunks_text: str):
+            batches.append(hunks_text)
+            return [_issue(f"batch{len(batches)}.py")]
+
+        monkeypatch.setattr(stage1_identify, "identify_issues", identify_issues)
+        return batches
+
+    async def test_small_chunks_share_a_batch(self, fake_identify):
+        """Given chunks under the budget, should send a single batch."""
+        # When
+        issues = await stage1_identify.identify_issues_stream(["aaa", "bbb"], max_chars=100)
+
+        # Then
+        assert fake_identify == ["aaa\nbbb"]
+        assert len(issues) == 1
+
+    async def test_chunks_over_budget_are_split(self, fake_identify):
+        """Given chunks exceeding the budget, should split into batches."""
+        # When
+        issues = await stage1_identify.identify_issues_stream(["a" * 60, "b" * 60, "c"], max_chars=100)
+
+        # Then
+        assert fake_identify == ["a" * 60, "b" * 60 + "\nc"]
+        assert [i.file_path for i in issues] == ["batch1.py", "batch2.py"]
+
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        """Given more batches than max_parallel, should never exceed the bound."""
+        # Given
+        running = 0
+        peak = 0
+
+        async def identify_issues(hunks_text: str):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [_issue(hunks_text)]
+
+        monkeypatch.setattr(stage1_identify, "identify_issues", identify_issues)
+
+        # When
+        issues = await stage1_identify.identify_issues_stream(
+            ["a" * 10] * 6, max_chars=10, max_parallel=2
+        )
+
+        # Then
+        assert len(issues) == 6
+        assert peak == 2
+
+    async def test_no_chunks_skips_stage1(self, fake_identify):
+        """Given no chunks, should not call the LLM."""
+        # When
+        issues = await stage1_identify.identify_issues_stream([])
+
+        # Then
+        assert issues == []
+        assert fake_identify == []
+
+
+class TestSelectToken:
+    """Tests for picking a token from a pool."""
+
+    def test_picks_token_with_most_remaining(self, monkeypatch):
+        """Given a token pool, should pick the one with the most quota left."""
+        # Given
+        remaining = {"a": 10, "b": 4000, "c": 200}
+
+        class FakeGithub:
+            def __init__(self, token):
+                self.rate_limiting = (remaining[token], 5000)
+
+        monkeypatch.setattr(github_tool, "Github", FakeGithub)
+
+        # When / Then
+        assert github_tool.select_token(["a", "b", "c"]) == "b"
+
+    def test_single_token_skips_lookup(self, monkeypatch):
+        """Given one token, should return it without any API call."""
+        # Given
+        def fail(token):
+            raise AssertionError("should not query rate limit")
+
+        monkeypatch.setattr(github_tool, "Github", fail)
+
+        # When / Then
+        assert github_tool.select_token(["only"]) == "only"
+
+
+class TestGraphQLQuery:
+    """Tests for the GraphQL helper."""
+
+    @pytest.mark.skipif(github_tool.orjson is None, reason="orjson not installed")
+    def test_errors_in_response_raise(self):
+        """Given a 200 response carrying GraphQL errors, should raise GithubException."""
+        # Given
+        class FakeRequester:
+            graphql_url = "https://api.github.com/graphql"
+            createException = Requester.createException
+
+            def requestJson(self, verb, url, input=None, **kwargs):
+                return 200, {}, '{"data": null, "errors": [{"message": "bad field"}]}'
+
+        repo = SimpleNamespace(
+            owner=SimpleNamespace(login="octo"), name="repo", requester=FakeRequester()
+        )
+
+        # When / Then
+        with pytest.raises(GithubException):
+            github_tool.graphql_query(repo, "query { viewer { login } }")
+
+
+def _github_tool(files, head_sha="abc123"):
+    """A GitHubTool with a fake PR, bypassing the API client."""
+    tool = object.__new__(github_tool.GitHubTool)
+    tool.repo_name = "org/repo"
+    tool.pr_number = 7
+    tool._pr = SimpleNamespace(head=SimpleNamespace(sha=head_sha))
+    tool._files = files
+    tool._head_commit = None
+    return tool
+
+
+class TestGetDiff:
+    """Tests for building and caching the PR diff."""
+
+    def test_diff_is_cached_per_head_sha(self, monkeypatch, tmp_path):
+        """Given a diff fetched once, should reuse it for the same head SHA only."""
+        # Given
+        monkeypatch.setenv("REVIEW_AGENT_CACHE_DIR", str(tmp_path))
+        patch = SimpleNamespace(filename="a.py", status="modified", patch="@@ -1 +1 @@\n-x\n+y")
+        first = _github_tool([patch]).get_diff()
+
+        # When
+        hit = _github_tool([]).get_diff()
+        miss = _github_tool([], head_sha="def456").get_diff()
+
+        # Then
+        assert "+++ b/a.py" in first
+        assert hit == first
+        assert miss == ""
+        cached = sorted(p.name for p in (tmp_path / "diffs" / "org__repo").iterdir())
+        assert cached == ["7-abc123.diff", "7-def456.diff"]
+
+
+class FakePullRequest:
+    """Records review calls; optionally rejects batched reviews."""
+
+    def __init__(self, reject_reviews=False):
+        self.head = SimpleNamespace(sha="abc123")
+        self.reject_reviews = reject_reviews
+        self.reviews = []
+        self.comments = []
+
+    def create_review(self, **kwargs):
+        if self.reject_reviews:
+            raise GithubException(422, {"message": "Unprocessable Entity"}, None)
+        self.reviews.append(kwargs)
+
+    def create_review_comment(self, **kwargs):
+        self.comments.append(kwargs)
+
+
+class TestPostReviewBatch:
+    """Tests for posting all inline comments as one review."""
+
+    def test_posts_valid_issues_as_one_review(self):
+        """Given valid and invalid issues, should post one review commenting on the valid ones."""
+        # Given
+        tool = _github_tool([])
+        tool._pr = FakePullRequest()
+        tool._head_commit = "head-commit"
+        issue = PotentialIssue("app/a.py", 3, 5, "bug", "high", "Off by one", "x")
+        issues = [
+            ValidatedIssue(issue=issue, is_valid=True, confidence=0.9),
+            ValidatedIssue(issue=_issue("app/b.py"), is_valid=False, confidence=0.9),
+        ]
+
+        # When
+        posted = tool.post_review_batch(issues)
+
+        # Then
+        assert posted is True
+        [review] = tool._pr.reviews
+        assert review["commit"] == "head-commit"
+        assert review["event"] == "COMMENT"
+        [comment] = review["comments"]
+        assert (comment["path"], comment["line"], comment["side"]) == ("app/a.py", 5, "RIGHT")
+        assert "Off by one" in comment["body"]
+
+    def test_rejected_review_returns_false(self):
+        """Given GitHub rejecting the review, should return False."""
+        # Given
+        tool = _github_tool([])
+        tool._pr = FakePullRequest(reject_reviews=True)
+        tool._head_commit = "head-commit"
+
+        # When
+        posted = tool.post_review_batch([ValidatedIssue(issue=_issue("app/a.py"), is_valid=True)])
+
+        # Then
+        assert posted is False
+
+    async def test_run_review_falls_back_to_single_comments(self, monkeypatch):
+        """Given a rejected batched review, run_review should post each comment on its own."""
+        # Given
+        pr = FakePullRequest(reject_reviews=True)
+        issues = [
+            ValidatedIssue(issue=_issue("app/a.py"), is_valid=True, confidence=0.9),
+            ValidatedIssue(issue=_issue("app/b.py"), is_valid=True, confidence=0.9),
+        ]
+
+        class FakeGitHubTool(github_tool.GitHubTool):
+            def __init__(self, **kwargs):
+                self._pr = pr
+                self._head_commit = "head-commit"
+
+            def get_diff(self):
+                return SAMPLE_DIFF
+
+            def post_review_summary(self, validated_issues, stats=None):
+                pass
+
+        async def review_core(diff_text, config):
+            return SimpleNamespace(potential_issues=[v.issue for v in issues], validated_issues=issues, skipped=0)
+
+        monkeypatch.setattr("review_agent.tools.GitHubTool", FakeGitHubTool)
+        monkeypatch.setattr("review_agent.pipeline.review_core", review_core)
+        config = ReviewConfig(repo="org/repo", pr_number=7, github_token="t")
+
+        # When
+        stats = await main.run_review(config)
+
+        # Then
+        assert stats["reported"] == 2
+        assert sorted(c["path"] for c in pr.comments) == ["app/a.py", "app/b.py"]
+
+
+class TestValidateIssues:
+    """Tests for Stage 2 dispatch: deduplication and batching."""
+
+    async def test_duplicates_validated_once(self, monkeypatch):
+        """Given duplicate issues, should validate once and fan out."""
+        # Given
+        calls = []
+
+        async def validate_single_issue(issue):
+            calls.append(issue)
+            return ValidatedIssue(issue=issue, is_valid=True, confidence=0.9)
+
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        first, duplicate, other = _issue("a.py"), _issue("a.py"), _issue("b.py")
+
+        # When
+        results = await stage2_validate.validate_issues([first, duplicate, other])
+
+        # Then
+        assert calls == [first, other]
+        assert [r.issue for r in results] == [first, duplicate, other]
+        assert results[1].issue is duplicate
+        assert all(r.is_valid and r.confidence == 0.9 for r in results)
+
+    async def test_issues_differing_after_a_shared_prefix_are_validated_separately(self, monkeypatch):
+        """Given descriptions that only differ late in the text, should validate each issue."""
+        # Given
+        calls = []
+
+        async def validate_single_issue(issue):
+            calls.append(issue)
+            return ValidatedIssue(issue=issue, is_valid=True, confidence=0.9)
+
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        prefix = "Possible None dereference when the configuration loader returns early "
+        first = replace(_issue("a.py"), description=prefix + "for missing files")
+        second = replace(_issue("a.py"), description=prefix + "on invalid YAML")
+
+        # When
+        results = await stage2_validate.validate_issues([first, second])
+
+        # Then
+        assert calls == [first, second]
+        assert [r.issue for r in results] == [first, second]
+
+    async def test_sequential_mode_runs_one_batch_at_a_time(self, monkeypatch):
+        """Given parallel off, batches should be validated one after another."""
+        # Given
+        running = 0
+        peak = 0
+
+        async def validate_issue_batch(issues):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [ValidatedIssue(issue=i, is_valid=True, confidence=0.8) for i in issues]
+
+        monkeypatch.setattr(stage2_validate, "validate_issue_batch", validate_issue_batch)
+        issues = [_issue(f"{name}.py") for name in "abcd"]
+
+        # When
+        results = await stage2_validate.validate_issues(issues, parallel=False, batch_size=2)
+
+        # Then
+        assert peak == 1
+        assert [r.issue.file_path for r in results] == ["a.py", "b.py", "c.py", "d.py"]
+
+    async def test_missing_batch_verdicts_are_validated_alone(self, monkeypatch):
+        """Given an agent that stores only some verdicts, the rest should fall back to single validation."""
+        # Given
+        tools = []
+        make_tool = stage2_validate._make_store_batch_verdict_tool
+
+        def capture_tool(storage):
+            tools.append(make_tool(storage))
+            return tools[-1]
+
+        class FakeClient:
+            def __init__(self, options):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def query(self, prompt):
+                # Verdict for issue 1 only, plus one with an unusable index
+                await tools[-1].handler({"index": 1, "is_valid": True, "evidence": ["seen"], "confidence": 0.7})
+                await tools[-1].handler({"index": "x", "is_valid": True, "confidence": 0.9})
+
+            async def receive_response(self):
+                return
+                yield
+
+        fallback = []
+
+        async def validate_single_issue(issue):
+            fallback.append(issue.file_path)
+            await asyncio.sleep(0.01)
+            return ValidatedIssue(issue=issue, is_valid=False, confidence=0.5)
+
+        monkeypatch.setattr(stage2_validate, "_make_store_batch_verdict_tool", capture_tool)
+        monkeypatch.setattr(stage2_validate, "ClaudeSDKClient", FakeClient)
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        issues = [_issue("a.py"), _issue("b.py"), _issue("c.py")]
+
+        # When
+        results = await stage2_validate.validate_issue_batch(issues)
+
+        # Then
+        assert sorted(fallback) == ["a.py", "c.py"]
+        assert [(r.issue.file_path, r.is_valid, r.confidence) for r in results] == [
+            ("a.py", False, 0.5), ("b.py", True, 0.7), ("c.py", False, 0.5),
+        ]
+        assert results[1].evidence == ["seen"]
+
+    async def test_failed_batch_is_marked_inconclusive(self, monkeypatch):
+        """Given a batch failure, should mark only that batch inconclusive."""
+        # Given
+        async def validate_issue_batch(issues):
+            if issues[0].file_path == "bad.py":
+                raise RuntimeError("session died")
+            return [ValidatedIssue(issue=i, is_valid=True, confidence=0.8) for i in issues]
+
+        monkeypatch.setattr(stage2_validate, "validate_issue_batch", validate_issue_batch)
+        issues = [_issue("a.py"), _issue("b.py"), _issue("bad.py")]
+
+        # When
+        results = await stage2_validate.validate_issues(issues, batch_size=2)
+
+        # Then
+        assert [r.issue.file_path for r in results] == ["a.py", "b.py", "bad.py"]
+        assert [r.is_valid for r in results] == [True, True, False]
+        assert "session died" in results[2].evidence[0]
+
+    async def test_cached_verdicts_skip_validation(self, monkeypatch, tmp_path):
+        """Given an issue validated in an earlier run, should reuse its verdict."""
+        # Given
+        monkeypatch.setenv("REVIEW_AGENT_CACHE_DIR", str(tmp_path))
+        calls = []
+
+        async def validate_single_issue(issue):
+            calls.append(issue)
+            return ValidatedIssue(issue=issue, is_valid=True, evidence=["seen"], confidence=0.9)
+
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        await stage2_validate.validate_issues([_issue("a.py")], use_cache=True)
+
+        # When
+        results = await stage2_validate.validate_issues([_issue("a.py")], use_cache=True)
+
+        # Then
+        assert len(calls) == 1
+        assert results[0].is_valid and results[0].evidence == ["seen"]
+        assert results[0].confidence == 0.9
+
+    async def test_cached_verdicts_are_scoped_to_the_repo(self, monkeypatch, tmp_path):
+        """Given an issue validated for another repo, should validate it again."""
+        # Given
+        monkeypatch.setenv("REVIEW_AGENT_CACHE_DIR", str(tmp_path))
+        calls = []
+
+        async def validate_single_issue(issue):
+            calls.append(issue)
+            return ValidatedIssue(issue=issue, is_valid=True, evidence=["seen"], confidence=0.9)
+
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        await stage2_validate.validate_issues([_issue("a.py")], use_cache=True, repo="org/one")
+
+        # When
+        await stage2_validate.validate_issues([_issue("a.py")], use_cache=True, repo="org/two")
+
+        # Then
+        assert len(calls) == 2
+
+    async def test_corrupt_cache_entries_are_revalidated(self, monkeypatch, tmp_path):
+        """Given a cached verdict that no longer decodes, should validate the issue again."""
+        # Given
+        monkeypatch.setenv("REVIEW_AGENT_CACHE_DIR", str(tmp_path))
+        calls = []
+
+        async def validate_single_issue(issue):
+            calls.append(issue)
+            return ValidatedIssue(issue=issue, is_valid=True, evidence=["seen"], confidence=0.9)
+
+        monkeypatch.setattr(stage2_validate, "validate_single_issue", validate_single_issue)
+        await stage2_validate.validate_issues([_issue("a.py")], use_cache=True)
+        with sqlite3.connect(tmp_path / "validations.sqlite") as conn:
+            conn.execute("UPDATE entries SET payload = '{truncated'")
+        conn.close()
+
+        # When
+        results = await stage2_validate.validate_issues([_issue("a.py")], use_cache=True)
+
+        # Then
+        assert len(calls) == 2
+        assert results[0].is_valid
+
+
+class TestFusedReview:
+    """Tests for the fused identify + validate session used for small PRs."""
+
+    def test_parse_validated_issues_skips_malformed_entries(self):
+        """Given stored tool arguments, should build ValidatedIssues and skip unparsable ones."""
+        # Given
+        values = [
+            {
+                "file_path": "a.py", "line_start": 3, "line_end": 4, "issue_type": "Bug",
+                "severity": "HIGH", "description": "desc", "code_snippet": "x",
+                "is_valid": True, "evidence": ["seen"], "library_reference": "",
+                "mitigation": "fix it", "confidence": 0.8,
+            },
+            {"file_path": "b.py", "line_start": "three", "is_valid": True},
+        ]
+
+        # When
+        results = fused_review.parse_validated_issues(values)
+
+        # Then
+        assert len(results) == 1
+        assert results[0].issue.severity == "high"
+        assert (results[0].issue.line_start, results[0].issue.line_end) == (3, 4)
+        assert results[0].library_reference is None
+        assert results[0].mitigation == "fix it"
+
+    async def test_session_results_come_from_the_store_tool(self, monkeypatch):
+        """Given an agent calling store_validated_issue, should return what it stored."""
+        # Given
+        sessions = []
+        make_tool = fused_review._make_store_validated_issue_tool
+
+        def capture_tool(storage):
+            sessions.append(make_tool(storage))
+            return sessions[-1]
+
+        class FakeClient:
+            def __init__(self, options):
+                sessions.append(options)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def query(self, prompt):
+                await sessions[0].handler({
+                    "file_path": "a.py", "line_start": 1, "line_end": 1, "issue_type": "bug",
+                    "severity": "low", "description": "d", "code_snippet": "x",
+                    "is_valid": False, "evidence": [], "library_reference": "",
+                    "mitigation": "", "confidence": 0.9,
+                })
+
+            async def receive_response(self):
+                return
+                yield
+
+        monkeypatch.setattr(fused_review, "_make_store_validated_issue_tool", capture_tool)
+        monkeypatch.setattr(fused_review, "ClaudeSDKClient", FakeClient)
+
+        # When
+        results = await fused_review.identify_and_validate("### File: a.py")
+
+        # Then
+        assert [(r.issue.file_path, r.is_valid) for r in results] == [("a.py", False)]
+        assert "mcp__validate__store_validated_issue" in sessions[1].allowed_tools
+
+    async def test_small_pr_takes_the_fused_path(self, monkeypatch):
+        """Given a diff below fuse_below_hunks, review_core should skip Stages 1 and 2."""
+        # Given
+        high = ValidatedIssue(issue=_issue("app/a.py"), is_valid=True, confidence=0.9)
+        low = ValidatedIssue(
+            issue=PotentialIssue("app/b.py", 1, 1, "bug", "low", "desc", "x"),
+            is_valid=True,
+            confidence=0.9,
+        )
+
+        async def identify_and_validate(hunks_text):
+            assert "### File: app/a.py" in hunks_text
+            return [high, low]
+
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("separate stages should not run")
+
+        core = sys.modules["review_agent.pipeline.review_core"]
+        monkeypatch.setattr(core, "identify_and_validate", identify_and_validate)
+        monkeypatch.setattr(core, "identify_issues_stream", unexpected)
+        monkeypatch.setattr(core, "validate_issues", unexpected)
+        config = ReviewConfig(fuse_below_hunks=4, min_severity="medium")
+
+        # When
+        result = await core.review_core(SAMPLE_DIFF, config)
+
+        # Then
+        assert result.validated_issues == [high]
+        assert result.skipped == 1
+
+
+class TestWouldReport:
+    """Tests for the pre-Stage 2 reportability check."""
+
+    def test_respects_report_flags_and_min_severity(self):
+        """Given report_low off, low issues should be dropped before Stage 2."""
+        # Given
+        config = ReviewConfig(min_severity="low", report_low=False)
+        low = PotentialIssue("a.py", 1, 1, "bug", "low", "desc", "x")
+        high = PotentialIssue("a.py", 1, 1, "bug", "high", "desc", "x")
+
+        # Then
+        assert not would_report(low, config)
+        assert would_report(high, config)
+        assert not would_report(high, ReviewConfig(min_severity="critical"))
+
+    def test_unreachable_confidence_reports_nothing(self):
+        """Given min_confidence above 1.0, nothing can ever be reported."""
+        # Given
+        config = ReviewConfig(min_confidence=1.5)
+
+        # Then
+        assert not would_report(_issue("a.py"), config)
+
+    def test_unknown_severity_is_reported(self):
+        """Given a severity outside the known ranks, should always report it."""
+        # Given
+        issue = PotentialIssue("a.py", 1, 1, "bug", "urgent", "desc", "x")
+
+        # Then
+        assert would_report(issue, ReviewConfig(min_severity="low"))
+
+
+class TestFilterReportableIssues:
+    """Tests for the post-Stage 2 reporting filter."""
+
+    def test_keeps_valid_confident_issues_with_reported_severity(self):
+        """Given a mix of verdicts, should keep only those that pass every setting."""
+        # Given
+        config = ReviewConfig(min_confidence=0.7, report_low=False)
+
+        def validated(severity, is_valid=True, confidence=0.9):
+            issue = PotentialIssue("a.py", 1, 1, "bug", severity, severity, "x")
+            return ValidatedIssue(issue=issue, is_valid=is_valid, confidence=confidence)
+
+        kept = [validated("high"), validated("urgent")]
+        dropped = [validated("high", is_valid=False), validated("high", confidence=0.5), validated("low")]
+
+        # When
+        reportable = filter_reportable_issues(kept + dropped, config)
+
+        # Then
+        assert reportable == kept
+
+
+class TestReviewCore:
+    """Tests for running Stages 1 and 2 over a PR diff."""
+
+    async def test_validates_only_reportable_issues(self, monkeypatch):
+        """Given Stage 1 issues of mixed severity, should validate only those that could be reported."""
+        # Given
+        core = sys.modules["review_agent.pipeline.review_core"]
+        high = _issue("app/a.py")
+        low = PotentialIssue("app/b.py", 1, 1, "bug", "low", "desc", "x")
+        calls = {}
+
+        async def identify_issues_stream(file_hunks, max_parallel):
+            calls["files"] = list(file_hunks)
+            return [high, low]
+
+        async def validate_issues(issues, **kwargs):
+            calls["validate"] = (issues, kwargs)
+            return [ValidatedIssue(issue=issue, is_valid=True, confidence=0.9) for issue in issues]
+
+        monkeypatch.setattr(core, "identify_issues_stream", identify_issues_stream)
+        monkeypatch.setattr(core, "validate_issues", validate_issues)
+        config = ReviewConfig(repo="org/repo", fuse_below_hunks=0, min_severity="medium")
+
+        # When
+        result = await core.review_core(SAMPLE_DIFF, config)
+
+        # Then
+        assert ["### File: app/a.py" in text for text in calls["files"]] == [True, False]
+        issues, kwargs = calls["validate"]
+        assert issues == [high]
+        assert kwargs["repo"] == "org/repo"
+        assert result.potential_issues == [high]
+        assert [v.issue for v in result.validated_issues] == [high]
+        assert result.skipped == 1
+
+    async def test_nothing_reportable_skips_validation(self, monkeypatch):
+        """Given only issues that could never be reported, should not start Stage 2."""
+        # Given
+        core = sys.modules["review_agent.pipeline.review_core"]
+        low = PotentialIssue("app/a.py", 1, 1, "bug", "low", "desc", "x")
+
+        async def identify_issues_stream(file_hunks, max_parallel):
+            return [low]
+
+        async def validate_issues(issues, **kwargs):
+            raise AssertionError("Stage 2 should not run")
+
+        monkeypatch.setattr(core, "identify_issues_stream", identify_issues_stream)
+        monkeypatch.setattr(core, "validate_issues", validate_issues)
+
+        # When
+        result = await core.review_core(SAMPLE_DIFF, ReviewConfig(fuse_below_hunks=0))
+
+        # Then
+        assert result.validated_issues == []
+        assert result.skipped == 1